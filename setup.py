@@ -32,6 +32,9 @@ EXTRAS_REQUIRE = {
     "pillow": [
         "pillow",
     ],
+    "numpy": [
+        "numpy",
+    ],
     "tests": [
         "coverage",
         "pylint",
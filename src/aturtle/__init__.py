@@ -25,10 +25,14 @@ __email__ = 'tiago.montes@gmail.com'
 from . window import Window
 from . import shapes
 from . sprites import create_sprite
+from . import easing
 from . import turtle
+from . import paint
+from . import lsystem
+from . runner import run
 
 
-__all__ = ['Window', 'create_sprite']
+__all__ = ['Window', 'create_sprite', 'run']
 
 
 # ----------------------------------------------------------------------------
@@ -5,15 +5,86 @@
 # See LICENSE for details.
 # ----------------------------------------------------------------------------
 
+import contextlib
+import operator
+import re
 import tkinter
 
 
 
+# Characters with special meaning in Tcl words, those that can't be brace
+# quoted, and their escaped forms.
+
+_TCL_SPECIAL = re.compile(r'[\\{}\[\]$";\s]')
+_TCL_UNBRACEABLE = re.compile(r'[\\{}]')
+_TCL_ESCAPES = {'\n': '\\n', '\r': '\\r', '\t': '\\t'}
+
+
+def _tcl_escape(match):
+
+    char = match.group()
+    return _TCL_ESCAPES.get(char, '\\' + char)
+
+
+def _tcl_word(value):
+
+    # Tcl word representing `value`: tuples and lists as Tcl lists, anything
+    # else as its string, brace quoted if it has special characters, or with
+    # them backslash escaped, when it has braces or backslashes.
+
+    if isinstance(value, (tuple, list)):
+        return '{' + ' '.join(map(_tcl_word, value)) + '}'
+    value = str(value)
+    if not value:
+        return '{}'
+    if not _TCL_SPECIAL.search(value):
+        return value
+    if not _TCL_UNBRACEABLE.search(value):
+        return '{' + value + '}'
+    return _TCL_SPECIAL.sub(_tcl_escape, value)
+
+
+
+def batch(canvas):
+    """
+    Returns a context manager batching `canvas` mutations, if its type
+    supports it, like InvertedYCanvas does, or a no-op one, otherwise.
+    """
+    if getattr(type(canvas), 'batch', None) is None:
+        return contextlib.nullcontext()
+    return canvas.batch()
+
+
+
+# Sentinel for options never set through the item options cache.
+
+_MISSING = object()
+
+# Delegated tkinter.Canvas methods that may change item coordinates or options.
+
+_ITEM_CHANGING_METHODS = frozenset((
+    'itemconfigure',
+    'moveto',
+    'scale',
+    'insert',
+    'dchars',
+))
+
+
+
 class InvertedYCanvas:
 
     """
     Behaves like a tkinter.Canvas widget, where Y coordinates are negated such
     that larger values are at the top of the screen.
+
+    Supports batching `move`, `coords`, and `itemconfig` calls, such that they
+    are submitted to the Tcl interpreter in a single script evaluation.
+
+    Keeps a write-through cache of the last options set on each item, via
+    `itemconfig`, and of the last coordinates of polygon items, like sprite
+    ones, dropping calls that would not change them, along with zero distance
+    moves. Other items' coordinates, like long line ones, are not cached.
     """
 
     def __init__(self, master, background):
@@ -28,27 +99,80 @@ class InvertedYCanvas:
             background=background,
         )
 
+        # Tcl commands collected while batching, None otherwise.
+        self._batch = None
+
+        # Last coordinates and options set, by integer item id. Coordinates
+        # are tracked for polygon items only: None if unknown.
+        self._item_coords = {}
+        self._item_options = {}
+
     def _inverted_y(self, coords):
 
         # `coords` is an iterable of (x0, y0, x1, y0, ..., xn, yn) numbers,
         # where the ones in odd offsets/indices are Y values that are negated.
+        # Compact buffers, like array('d') ones, are copied at C speed, with
+        # no per value Python level work, other than the negation.
 
-        return [
-            -value if offset % 2 else value
-            for offset, value in enumerate(coords)
-        ]
+        values = list(coords)
+        values[1::2] = map(operator.neg, values[1::2])
+        return values
+
+
+    @contextlib.contextmanager
+    def batch(self):
+        """
+        Context manager collecting `move`, `coords`, and `itemconfig` calls,
+        submitting them to the Tcl interpreter as a single script evaluation,
+        on exit. Nested batches are collected into the outermost one.
+
+        Any other canvas operation submits the collected calls first, such that
+        the call order is preserved.
+        """
+        if self._batch is not None:
+            yield
+            return
+
+        self._batch = []
+        try:
+            yield
+        finally:
+            self._submit_batch(stop=True)
+
+
+    def _submit_batch(self, stop=False):
+
+        # Evaluate the collected Tcl commands in one go, if any.
+
+        commands = self._batch
+        if commands is None:
+            return
+        self._batch = None if stop else []
+        if commands:
+            self._canvas.tk.eval('\n'.join(commands))
+
+
+    def _batch_command(self, *words):
+
+        # Add a Tcl command to the current batch: canvas widget subcommand.
+
+        self._batch.append(' '.join(map(_tcl_word, (str(self._canvas),) + words)))
 
 
     def create_polygon(self, coords, *, fill, outline, width):
         """
         Creates a polygon item with given `coords` and visual attributes.
         """
-        return self._canvas.create_polygon(
-            self._inverted_y(coords),
+        self._submit_batch()
+        values = self._inverted_y(coords)
+        item_id = self._canvas.create_polygon(
+            values,
             fill=fill,
             outline=outline,
             width=width,
         )
+        self._item_coords[item_id] = values
+        return item_id
 
 
     def create_image(self, x, y, *, image, anchor):
@@ -56,18 +180,25 @@ class InvertedYCanvas:
         Creates an image item at the given (`x`, `y`) position with the `image`
         achored at `anchor`.
         """
-        return self._canvas.create_image(x, -y, image=image, anchor=anchor)
+        self._submit_batch()
+        item_id = self._canvas.create_image(x, -y, image=image, anchor=anchor)
+        self._item_options[item_id] = {'image': image}
+        return item_id
 
 
-    def create_line(self, coords, *, fill, width, capstyle):
+    def create_line(self, coords, *, fill, width, capstyle, tags=None):
         """
-        Creates a line item with given `coords` and visual attributes.
+        Creates a line item with given `coords` and visual attributes, tagged
+        with `tags`, if not None.
         """
+        self._submit_batch()
+        kwargs = {} if tags is None else {'tags': tags}
         return self._canvas.create_line(
             self._inverted_y(coords),
             fill=fill,
             width=width,
             capstyle=capstyle,
+            **kwargs,
         )
 
 
@@ -75,6 +206,12 @@ class InvertedYCanvas:
         """
         Moves the item identified by `item_id` relatively by (`dx`, `dy`).
         """
+        if not dx and not dy:
+            return None
+        self._unknown_coords(item_id)
+        if self._batch is not None:
+            self._batch_command('move', item_id, dx, -dy)
+            return None
         return self._canvas.move(item_id, dx, -dy)
 
 
@@ -82,11 +219,88 @@ class InvertedYCanvas:
         """
         Sets the coordinates of the item identified by `item_id` to `coords`.
         """
-        return self._canvas.coords(item_id, self._inverted_y(coords))
+        values = self._inverted_y(coords)
+        if item_id in self._item_coords:
+            if self._item_coords[item_id] == values:
+                return None
+            self._item_coords[item_id] = values
+        else:
+            self._unknown_coords(item_id)
+        if self._batch is not None:
+            self._batch_command('coords', item_id, *values)
+            return None
+        return self._canvas.coords(item_id, values)
+
+
+    def itemconfig(self, item_id, cnf=None, **kwargs):
+        """
+        Configures the item identified by `item_id`, like tkinter.Canvas does.
+        """
+        if cnf is None and kwargs and isinstance(item_id, int):
+            options = self._item_options.setdefault(item_id, {})
+            if all(options.get(name, _MISSING) == value for name, value in kwargs.items()):
+                return None
+            options.update(kwargs)
+        elif cnf is not None or kwargs:
+            self._forget(self._item_options, item_id)
+        if self._batch is not None and cnf is None and kwargs:
+            options = []
+            for name, value in kwargs.items():
+                # Like tkinter: trailing underscores avoid Python keywords.
+                options.extend(('-' + name.rstrip('_'), value))
+            self._batch_command('itemconfigure', item_id, *options)
+            return None
+        self._submit_batch()
+        if cnf is None:
+            return self._canvas.itemconfig(item_id, **kwargs)
+        return self._canvas.itemconfig(item_id, cnf, **kwargs)
+
+
+    def delete(self, *item_ids):
+        """
+        Deletes the items identified by `item_ids`, like tkinter.Canvas does.
+        """
+        for item_id in item_ids:
+            if isinstance(item_id, int):
+                self._item_coords.pop(item_id, None)
+            else:
+                self._unknown_coords(item_id)
+            self._forget(self._item_options, item_id)
+        self._submit_batch()
+        return self._canvas.delete(*item_ids)
+
+
+    def _unknown_coords(self, item_id):
+
+        # Tracked coordinates of `item_id` are no longer known. Tags may refer
+        # to any item.
+
+        if isinstance(item_id, int):
+            if item_id in self._item_coords:
+                self._item_coords[item_id] = None
+        else:
+            self._item_coords = dict.fromkeys(self._item_coords)
+
+
+    @staticmethod
+    def _forget(cache, item_id):
+
+        # Drops `item_id`'s entry from `cache`. Tags may refer to any item.
+
+        if isinstance(item_id, int):
+            cache.pop(item_id, None)
+        else:
+            cache.clear()
 
 
     def __getattr__(self, name):
         """
         Delegates attribute access to the wrapped tkinter.Canvas object.
+        Submits batched calls first, if any.
         """
+        self._submit_batch()
+        if name in _ITEM_CHANGING_METHODS:
+            # Changes bypassing the cache: it can no longer be trusted.
+            self._item_coords = dict.fromkeys(self._item_coords)
+            self._item_options.clear()
         return getattr(self._canvas, name)
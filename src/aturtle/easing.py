@@ -0,0 +1,183 @@
+# ----------------------------------------------------------------------------
+# Python A-Turtle
+# ----------------------------------------------------------------------------
+# Copyright (c) Tiago Montes.
+# See LICENSE for details.
+# ----------------------------------------------------------------------------
+
+"""
+Easing functions.
+
+Standard easing curves, usable wherever an `easing` callable is accepted,
+mapping linear progress, from 0 to 1, to eased progress.
+
+Curves are backed by precomputed lookup tables, linearly interpolated, and
+sprite animations read the eased progress for all their frames at once,
+instead of calling the easing function once per frame.
+"""
+
+from array import array
+import functools
+import math
+
+
+
+class Easing:
+    """
+    An easing curve, computed by the `function` callable, taking and
+    returning progress values, and sampled in a lookup table at
+    `resolution` + 1 evenly spaced points, when first used.
+
+    Calling it returns the linearly interpolated table value.
+    """
+
+    def __init__(self, function, *, resolution=1024):
+
+        self._function = function
+        self._resolution = resolution
+        self._table = None
+
+
+    def __repr__(self):
+
+        name = getattr(self._function, '__name__', repr(self._function))
+        return f'<{type(self).__name__} {name}>'
+
+
+    def _get_table(self):
+
+        if self._table is None:
+            function = self._function
+            resolution = self._resolution
+            self._table = array('d', (function(i / resolution) for i in range(resolution + 1)))
+        return self._table
+
+
+    def __call__(self, progress):
+
+        table = self._get_table()
+        position = min(max(progress, 0), 1) * self._resolution
+        index = int(position)
+        if index >= self._resolution:
+            return table[-1]
+        value = table[index]
+        return value + (table[index+1] - value) * (position - index)
+
+
+    def frames(self, total_frames):
+        """
+        Returns a sequence with the eased progress at each of the
+        `total_frames` frames of an animation: frame 1 at index 0.
+        """
+        return _frames(self, total_frames)
+
+
+
+@functools.lru_cache(maxsize=256)
+def _frames(easing, total_frames):
+
+    # Animations with equal easings and frame counts share their tables.
+
+    return array('d', (easing(frame / total_frames) for frame in range(1, total_frames + 1)))
+
+
+
+def _in_out(ease_in):
+
+    # In/out variant of the `ease_in` function: in, then mirrored.
+
+    def in_out(progress):
+        if progress < 0.5:
+            return ease_in(progress * 2) / 2
+        return 1 - ease_in((1 - progress) * 2) / 2
+    return in_out
+
+
+def _out(ease_in):
+
+    # Out variant of the `ease_in` function: mirrored.
+
+    def out(progress):
+        return 1 - ease_in(1 - progress)
+    return out
+
+
+def _linear(progress):
+
+    return progress
+
+
+def _quad(progress):
+
+    return progress ** 2
+
+
+def _cubic(progress):
+
+    return progress ** 3
+
+
+def _sine(progress):
+
+    # Exact at 1, where floating point cosine is not quite 0.
+
+    return 1 if progress >= 1 else 1 - math.cos(progress * math.pi / 2)
+
+
+def _expo(progress):
+
+    return 0 if progress <= 0 else 2 ** (10 * progress - 10)
+
+
+def _elastic(progress):
+
+    if progress <= 0 or progress >= 1:
+        return min(max(progress, 0), 1)
+    return -2 ** (10 * progress - 10) * math.sin((progress * 10 - 10.75) * 2 * math.pi / 3)
+
+
+def _bounce(progress):
+
+    # Bounces on the way in: mirrored decaying parabolas.
+
+    progress = 1 - progress
+    if progress < 1 / 2.75:
+        value = 7.5625 * progress ** 2
+    elif progress < 2 / 2.75:
+        progress -= 1.5 / 2.75
+        value = 7.5625 * progress ** 2 + 0.75
+    elif progress < 2.5 / 2.75:
+        progress -= 2.25 / 2.75
+        value = 7.5625 * progress ** 2 + 0.9375
+    else:
+        progress -= 2.625 / 2.75
+        value = 7.5625 * progress ** 2 + 0.984375
+    return 1 - value
+
+
+
+linear = Easing(_linear, resolution=1)
+
+in_quad = Easing(_quad)
+out_quad = Easing(_out(_quad))
+in_out_quad = Easing(_in_out(_quad))
+
+in_cubic = Easing(_cubic)
+out_cubic = Easing(_out(_cubic))
+in_out_cubic = Easing(_in_out(_cubic))
+
+in_sine = Easing(_sine)
+out_sine = Easing(_out(_sine))
+in_out_sine = Easing(_in_out(_sine))
+
+in_expo = Easing(_expo)
+out_expo = Easing(_out(_expo))
+in_out_expo = Easing(_in_out(_expo))
+
+in_elastic = Easing(_elastic)
+out_elastic = Easing(_out(_elastic))
+in_out_elastic = Easing(_in_out(_elastic))
+
+in_bounce = Easing(_bounce)
+out_bounce = Easing(_out(_bounce))
+in_out_bounce = Easing(_in_out(_bounce))
@@ -0,0 +1,287 @@
+# ----------------------------------------------------------------------------
+# Python A-Turtle
+# ----------------------------------------------------------------------------
+# Copyright (c) Tiago Montes.
+# See LICENSE for details.
+# ----------------------------------------------------------------------------
+
+"""
+L-system generator.
+
+Expands L-system rule sets and interprets the resulting symbols as turtle
+moves, producing polylines in chunks of bounded size. Expansion is lazy, and
+the generator's state between chunks is small, such that chunks can be
+computed, one at a time, in a process pool or thread, while the asyncio side
+draws the ones already computed.
+"""
+
+from array import array
+import asyncio
+import concurrent.futures
+import math
+import multiprocessing
+
+
+_PROCESS_WORKERS = 2
+
+# Chunks end after this many generator steps per chunk point, if not before,
+# bounding the work per chunk even when few symbols draw.
+
+_SYMBOLS_PER_POINT = 16
+
+_default_executor = None
+
+
+def _forks_processes():
+
+    # True if new processes are forked. Other start methods, like "spawn", the
+    # macOS and Windows default, re-import the `__main__` module in workers,
+    # re-running unguarded scripts. Doesn't fix the start method, if unset.
+
+    start_method = multiprocessing.get_start_method(allow_none=True)
+    if start_method is None:
+        start_method = multiprocessing.get_all_start_methods()[0]
+    return start_method == 'fork'
+
+
+def _get_default_executor():
+
+    # A process pool, if processes are forked, or a thread pool, otherwise.
+
+    global _default_executor
+
+    if _default_executor is None:
+        if _forks_processes():
+            _default_executor = concurrent.futures.ProcessPoolExecutor(
+                max_workers=_PROCESS_WORKERS,
+            )
+        else:
+            _default_executor = concurrent.futures.ThreadPoolExecutor(
+                max_workers=1,
+                thread_name_prefix='aturtle-lsystem',
+            )
+    return _default_executor
+
+
+
+def _start_cursor(iterations):
+
+    # Generator state before the first chunk: a stack of expansion frames,
+    # each a [symbol, remaining iterations, string index] list -- the axiom's
+    # frame has a None symbol -- along with the turtle state: position, turn
+    # count, push/pop stack, and whether a line is being drawn.
+
+    return ([[None, iterations, 0]], 0.0, 0.0, 0, [], False)
+
+
+
+def _generate_chunk(spec, cursor, chunk_points):
+
+    # Returns a (lines, cursor) tuple, with up to `chunk_points` line points,
+    # from up to `chunk_points` * _SYMBOLS_PER_POINT generator steps, and
+    # the generator state to continue from: None if done. Lines are flat
+    # [x0, y0, x1, y1, ...] arrays. Runs in worker processes: arguments and
+    # results must be picklable: compact array('d') lines pickle compactly.
+
+    axiom, rules, angle, step, draw, move = spec
+    frames, x, y, turns, stack, drawing = cursor
+
+    lines = []
+    line = array('d', (x, y)) if drawing else None
+    points = 0
+    symbols = 0
+    max_symbols = chunk_points * _SYMBOLS_PER_POINT
+    directions = {}
+
+    while frames:
+        # Every step counts, including expansions with no symbols to process.
+        if symbols >= max_symbols:
+            break
+        symbols += 1
+        frame = frames[-1]
+        symbol, remaining, index = frame
+        string = axiom if symbol is None else rules[symbol]
+        if index >= len(string):
+            frames.pop()
+            continue
+        frame[2] = index + 1
+        char = string[index]
+
+        if remaining and char in rules:
+            frames.append([char, remaining - 1, 0])
+            continue
+
+        if char in draw or char in move:
+            direction = directions.get(turns)
+            if direction is None:
+                theta = turns * angle * math.pi / 180.0
+                direction = directions[turns] = (step * math.cos(theta), step * math.sin(theta))
+            if char in draw:
+                if line is None:
+                    line = array('d', (x, y))
+                x += direction[0]
+                y += direction[1]
+                line.extend((x, y))
+                points += 1
+            else:
+                if line is not None:
+                    lines.append(line)
+                    line = None
+                x += direction[0]
+                y += direction[1]
+        elif char == '+':
+            turns += 1
+        elif char == '-':
+            turns -= 1
+        elif char == '[':
+            stack.append((x, y, turns))
+        elif char == ']':
+            if line is not None:
+                lines.append(line)
+                line = None
+            x, y, turns = stack.pop()
+
+        if points >= chunk_points:
+            break
+
+    if line is not None:
+        lines.append(line)
+
+    if not frames:
+        return lines, None
+    return lines, (frames, x, y, turns, stack, line is not None)
+
+
+
+class LSystem:
+    """
+    An L-system, starting from the `axiom` string, and expanded via the
+    `rules` dict, mapping symbols to replacement strings.
+
+    Expanded symbols are interpreted as turtle moves: symbols in `draw` move
+    forward by `step`, drawing, those in `move` move forward without drawing,
+    '+' and '-' rotate counterclockwise and clockwise by `angle` degrees, and
+    '[' and ']' push and pop the turtle's position and angle. Other symbols
+    are ignored.
+
+    Moves start at (0, 0), in the direction of the x axis.
+    """
+
+    def __init__(self, axiom, rules, *, angle, step=10, draw='FG', move='f'):
+
+        self.axiom = axiom
+        self.rules = dict(rules)
+        self.angle = angle
+        self.step = step
+        self.draw = draw
+        self.move = move
+
+
+    def _spec(self):
+
+        return (self.axiom, self.rules, self.angle, self.step, self.draw, self.move)
+
+
+    def expand(self, iterations):
+        """
+        Returns the string resulting from `iterations` rule set expansions.
+        """
+        string = self.axiom
+        for _ in range(iterations):
+            string = ''.join(self.rules.get(char, char) for char in string)
+        return string
+
+
+    def chunks(self, iterations, *, chunk_points=4096):
+        """
+        Generates lists of lines, drawn by the moves in the `iterations` times
+        expanded L-system, with up to `chunk_points` points per list. Lines
+        are flat [x0, y0, x1, y1, ...] array('d') buffers.
+
+        Lines split across chunks continue from their last point.
+        """
+        spec = self._spec()
+        cursor = _start_cursor(iterations)
+        while cursor is not None:
+            lines, cursor = _generate_chunk(spec, cursor, chunk_points)
+            yield lines
+
+
+    async def async_chunks(self, iterations, *, chunk_points=4096, executor=None):
+        """
+        Asynchronously generates the same chunks as `chunks`, computing each
+        in the `executor` concurrent.futures.Executor. If None, a shared one
+        is used: a process pool where processes are forked, like on Linux, or
+        a single thread, otherwise.
+
+        Process pools not forking processes, like on macOS and Windows, re-
+        import the `__main__` module in each worker: scripts passing them must
+        guard their code with an `if __name__ == '__main__':` block, or it
+        runs again, opening more windows.
+
+        The next chunk is computed while the current one is consumed.
+        """
+        loop = asyncio.get_running_loop()
+        if executor is None:
+            executor = _get_default_executor()
+        spec = self._spec()
+        cursor = _start_cursor(iterations)
+
+        future = loop.run_in_executor(executor, _generate_chunk, spec, cursor, chunk_points)
+        try:
+            while future is not None:
+                lines, cursor = await future
+                if cursor is None:
+                    future = None
+                else:
+                    future = loop.run_in_executor(
+                        executor, _generate_chunk, spec, cursor, chunk_points,
+                    )
+                yield lines
+        finally:
+            if future is not None:
+                future.cancel()
+
+
+
+def _placed(lines, anchor, angle):
+
+    # Lines relative to (0, 0) and a 0 angle, rotated by `angle` degrees and
+    # moved to `anchor`.
+
+    x0, y0 = anchor
+    angle_rad = angle * math.pi / 180.0
+    cos = math.cos(angle_rad)
+    sin = math.sin(angle_rad)
+    for line in lines:
+        placed = array('d', line)
+        xs = line[::2]
+        ys = line[1::2]
+        placed[::2] = array('d', [x0 + x * cos - y * sin for x, y in zip(xs, ys)])
+        placed[1::2] = array('d', [y0 + x * sin + y * cos for x, y in zip(xs, ys)])
+        yield placed
+
+
+
+async def async_draw(turtle, lsystem, iterations, *, chunk_points=4096,
+                     executor=None, update=None):
+    """
+    Draws the `iterations` times expanded `lsystem` with `turtle`, from its
+    position and angle, which are left unchanged.
+
+    Chunks are computed as in LSystem.async_chunks, in the `executor`, with
+    the same default and `__main__` guard requirement, and drawn as soon as
+    each is available, as bulk line items, such that the event loop keeps
+    running while large generations are computed.
+
+    The `update` value is passed to the Turtle's `draw_lines`.
+    """
+    anchor = turtle.anchor
+    angle = turtle.angle
+    chunks = lsystem.async_chunks(
+        iterations,
+        chunk_points=chunk_points,
+        executor=executor,
+    )
+    async for lines in chunks:
+        turtle.draw_lines(_placed(lines, anchor, angle), update=update)
@@ -0,0 +1,217 @@
+# ----------------------------------------------------------------------------
+# Python A-Turtle
+# ----------------------------------------------------------------------------
+# Copyright (c) Tiago Montes.
+# See LICENSE for details.
+# ----------------------------------------------------------------------------
+
+"""
+Raster paint layer.
+
+Flattens finished line items into a single backing image, behind all other
+canvas items, bounding the number of canvas items in long drawing programs.
+"""
+
+from array import array
+import time
+
+try:
+    from PIL import Image, ImageDraw, ImageTk
+except ImportError:
+    Image = ImageDraw = ImageTk = None
+
+from . import canvas as _canvas
+
+
+
+class PaintLayer:
+    """
+    A paint layer on `canvas`, covering the (x0, y0, x1, y1) `bbox` area, in
+    canvas coordinates: the visible canvas area, if None.
+
+    Line items added to it are kept as is until there are more than
+    `max_lines` of them, or until the oldest one has been added `max_age`
+    seconds ago, if not None, checked with a canvas timer, even if no lines
+    are added. At that point, they are flattened: rasterized into the
+    layer's image and deleted from the canvas.
+
+    Layers can be dedicated to a single owner, via `claim`, like Turtles do:
+    clearing a layer clears everything in it.
+
+    Requires PIL.
+    """
+
+    def __init__(self, canvas, *, bbox=None, max_lines=1000, max_age=None):
+
+        if Image is None:
+            raise RuntimeError('PaintLayer requires PIL.')
+
+        self._canvas = canvas
+        self._y_up = isinstance(canvas, _canvas.InvertedYCanvas)
+
+        if bbox is None:
+            width = canvas.winfo_width()
+            height = canvas.winfo_height()
+            if self._y_up:
+                # Window canvases have (0, 0) at the center.
+                bbox = (-width // 2, -height // 2, width - width // 2, height - height // 2)
+            else:
+                bbox = (0, 0, width, height)
+        self._bbox = bbox
+
+        self.max_lines = max_lines
+        self.max_age = max_age
+
+        x0, y0, x1, y1 = bbox
+        self._image = Image.new('RGBA', (x1 - x0, y1 - y0), (0, 0, 0, 0))
+        self._photo_image = None
+        self._image_id = None
+
+        # (line_id, coords, fill, width, time added) tuples.
+        self._lines = []
+
+        # Pending max_age check Tk timer id, if any.
+        self._age_timer = None
+
+        self._owner = None
+
+
+    def __len__(self):
+
+        return len(self._lines)
+
+
+    def claim(self, owner):
+        """
+        Dedicates the layer to `owner`. Raises ValueError if already claimed
+        by another owner.
+        """
+        if self._owner is not None and self._owner is not owner:
+            raise ValueError('PaintLayer already claimed by another owner.')
+        self._owner = owner
+
+
+    def add_line(self, line_id, coords, *, fill, width):
+        """
+        Adds the finished `line_id` line item, with the given `coords`, `fill`
+        color and line `width`, to the layer, flattening lines, if due.
+        """
+        self._lines.append((line_id, array('d', coords), fill, width, time.monotonic()))
+        if self._flatten_due():
+            self.flatten()
+        elif self._age_timer is None:
+            self._schedule_age_check()
+
+
+    def _schedule_age_check(self):
+
+        # Check again when the oldest line reaches max_age.
+
+        if self.max_age is None or not self._lines:
+            return
+        _line_id, _coords, _fill, _width, added = self._lines[0]
+        delay = max(added + self.max_age - time.monotonic(), 0)
+        self._age_timer = self._canvas.after(int(delay * 1000) + 1, self._age_check)
+
+
+    def _age_check(self):
+
+        self._age_timer = None
+        if self._flatten_due():
+            self.flatten()
+        else:
+            self._schedule_age_check()
+
+
+    def _cancel_age_check(self):
+
+        if self._age_timer is not None:
+            self._canvas.after_cancel(self._age_timer)
+            self._age_timer = None
+
+
+    def _flatten_due(self):
+
+        if len(self._lines) > self.max_lines:
+            return True
+        if self.max_age is None:
+            return False
+        _line_id, _coords, _fill, _width, added = self._lines[0]
+        return time.monotonic() - added >= self.max_age
+
+
+    def flatten(self):
+        """
+        Rasterizes all added line items into the layer's image, deleting them
+        from the canvas.
+        """
+        if not self._lines:
+            return
+
+        draw = ImageDraw.Draw(self._image)
+        line_ids = []
+        for line_id, coords, fill, width, _added in self._lines:
+            color = self._rgb(fill)
+            points = [
+                self._image_point(x, y)
+                for x, y in zip(coords[::2], coords[1::2])
+            ]
+            draw.line(points, fill=color, width=round(width), joint='curve')
+            # Round caps, like the ones on canvas lines.
+            radius = width / 2
+            for x, y in (points[0], points[-1]):
+                draw.ellipse((x - radius, y - radius, x + radius, y + radius), fill=color)
+            line_ids.append(line_id)
+        self._canvas.delete(*line_ids)
+        self._lines.clear()
+        self._cancel_age_check()
+
+        self._show()
+
+
+    def clear(self):
+        """
+        Deletes all added line items from the canvas, not rasterizing them,
+        and clears the layer's image.
+        """
+        if self._lines:
+            self._canvas.delete(*(line_id for line_id, *_rest in self._lines))
+            self._lines.clear()
+        self._cancel_age_check()
+
+        self._image = Image.new('RGBA', self._image.size, (0, 0, 0, 0))
+        if self._photo_image is not None:
+            self._photo_image.paste(self._image)
+
+
+    def _image_point(self, x, y):
+
+        # Canvas (x, y) coordinates to image ones, where y grows downwards.
+
+        x0, y0, _x1, y1 = self._bbox
+        return (x - x0, y1 - y if self._y_up else y - y0)
+
+
+    def _rgb(self, color):
+
+        # Tk colors as 8 bit (red, green, blue) tuples: Tk knows color names.
+
+        return tuple(value >> 8 for value in self._canvas.winfo_rgb(color))
+
+
+    def _show(self):
+
+        if self._photo_image is not None:
+            self._photo_image.paste(self._image)
+            return
+
+        self._photo_image = ImageTk.PhotoImage(self._image)
+        x0, y0, _x1, y1 = self._bbox
+        self._image_id = self._canvas.create_image(
+            x0,
+            y1 if self._y_up else y0,
+            image=self._photo_image,
+            anchor='nw',
+        )
+        # Behind everything else.
+        self._canvas.tag_lower(self._image_id)
@@ -0,0 +1,116 @@
+# ----------------------------------------------------------------------------
+# Python A-Turtle
+# ----------------------------------------------------------------------------
+# Copyright (c) Tiago Montes.
+# See LICENSE for details.
+# ----------------------------------------------------------------------------
+
+"""
+Asyncio and Tk event loop integration.
+"""
+
+import asyncio
+import contextlib
+
+from . import scheduler
+from . window import Window
+
+
+
+# Tcl's TCL_DONT_WAIT event processing flag, as in `_tkinter.DONT_WAIT`.
+# Not imported from `_tkinter` such that this module imports without it.
+
+_TCL_DONT_WAIT = 2
+
+# Processing at most this many Tk events in one go keeps asyncio responsive.
+
+_MAX_EVENTS_PER_PASS = 100
+
+
+
+def run(coro, *, latency=0.005, debug=None):
+    """
+    Run the `coro` coroutine in a new asyncio event loop, returning its result,
+    while servicing the Tk event queue, such that there is no need for any
+    explicit Sprite or canvas updates.
+
+    Tk events are serviced from the asyncio event loop, no later than `latency`
+    seconds after they are queued, such that Window key and mouse callbacks
+    are triggered in less than a frame. Canvas updates requested by Sprites
+    are serviced immediately, instead of running a blocking `canvas.update`.
+
+    Tk offers no portable way of waiting for its events from asyncio, so the
+    Tk event queue is polled every `latency` seconds, even when idle: larger
+    values lower the polling cost, at the expense of input responsiveness.
+
+    The `debug` argument is passed to `asyncio.run`.
+    """
+    return asyncio.run(_run_servicing_tk(coro, latency), debug=debug)
+
+
+
+async def _run_servicing_tk(coro, latency):
+
+    pump = _TkPump(latency)
+    loop = asyncio.get_running_loop()
+    scheduler.set_update_servicer(loop, pump.wake)
+    pump_task = loop.create_task(pump.run())
+    try:
+        return await coro
+    finally:
+        scheduler.set_update_servicer(loop, None)
+        pump_task.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await pump_task
+
+
+
+class _TkPump:
+
+    # Services the Tk event queue from the asyncio event loop: processes all
+    # pending Tk events, then sleeps until `latency` seconds pass or until
+    # woken up, leaving the asyncio event loop free to process its own work.
+    # Tk timer and display events can't be waited on, only polled: hence the
+    # `latency` timer, even when idle, at a small per-wakeup cost.
+
+    def __init__(self, latency):
+
+        self._latency = latency
+        self._wakeup = None
+
+
+    async def run(self):
+
+        loop = asyncio.get_running_loop()
+        while True:
+            if self.service() >= _MAX_EVENTS_PER_PASS:
+                # Possibly more pending Tk events: just yield to asyncio.
+                await asyncio.sleep(0)
+                continue
+            self._wakeup = loop.create_future()
+            handle = loop.call_later(self._latency, self.wake)
+            try:
+                await self._wakeup
+            finally:
+                handle.cancel()
+                self._wakeup = None
+
+
+    def wake(self):
+
+        if self._wakeup is not None and not self._wakeup.done():
+            self._wakeup.set_result(None)
+
+
+    def service(self):
+
+        # Process pending Tk events, including idle ones like redraws, without
+        # blocking. Returns the number of processed events.
+
+        tk = Window.tk_interpreter()
+        if tk is None:
+            return 0
+        processed = 0
+        while processed < _MAX_EVENTS_PER_PASS and tk.dooneevent(_TCL_DONT_WAIT):
+            processed += 1
+        return processed
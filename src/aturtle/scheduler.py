@@ -0,0 +1,631 @@
+# ----------------------------------------------------------------------------
+# Python A-Turtle
+# ----------------------------------------------------------------------------
+# Copyright (c) Tiago Montes.
+# See LICENSE for details.
+# ----------------------------------------------------------------------------
+
+"""
+Frame scheduler.
+
+Animations are lightweight state objects, run by a per-canvas scheduler that
+advances all of them in a single tick per frame, instead of each animation
+running its own frame loop. The scheduler also coalesces canvas updates.
+
+Frame timing is driven by a pluggable clock: wall clock time by default, or
+virtual time, advancing instantly, such that long scenes can be simulated or
+rendered in CPU time.
+"""
+
+import asyncio
+import contextlib
+import heapq
+import itertools
+import time
+import weakref
+
+from . import canvas as _canvas
+
+
+
+# Tolerance absorbing floating point errors in frame deadline computations.
+
+_EPSILON = 1e-6
+
+
+
+def _due_frame(animation, start, now):
+
+    # The frame `animation`, started at `start`, should be showing at `now`.
+
+    elapsed_frames = int((now - start) / animation.frame_seconds + _EPSILON)
+    return min(elapsed_frames + 1, animation.total_frames)
+
+
+
+class SystemClock:
+    """
+    Wall clock time: the running event loop's time, if any, or monotonic
+    time, otherwise.
+    """
+
+    def time(self):
+        """
+        The current time, in seconds.
+        """
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            return time.monotonic()
+        return loop.time()
+
+
+    async def async_sleep(self, seconds):
+        """
+        Asynchronously sleep for `seconds`.
+        """
+        await asyncio.sleep(seconds)
+
+
+    def sync_sleep(self, seconds):
+        """
+        Sleep for `seconds`, blocking while doing so.
+        """
+        time.sleep(seconds)
+
+
+
+class VirtualClock:
+    """
+    Virtual time, starting at `start` seconds, advancing instantly when
+    slept on.
+
+    Concurrent asynchronous sleepers are woken in wake time order, one wake
+    time at a time, with time advancing to it: after the running tasks had a
+    few event loop iterations to settle, such that frames on different
+    canvases keep their relative ordering.
+    """
+
+    # Event loop iterations given to running tasks before advancing time.
+
+    _SETTLE_ITERATIONS = 4
+
+    def __init__(self, start=0):
+
+        self._now = start
+
+        # (wake time, sequence number, future) tuples: a heap.
+        self._sleepers = []
+        self._sequence = itertools.count()
+        self._advance_scheduled = False
+
+
+    def time(self):
+        """
+        The current virtual time, in seconds.
+        """
+        return self._now
+
+
+    async def async_sleep(self, seconds):
+        """
+        Asynchronously sleep for `seconds` of virtual time.
+        """
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        wake_time = self._now + max(seconds, 0)
+        heapq.heappush(self._sleepers, (wake_time, next(self._sequence), future))
+        if not self._advance_scheduled:
+            self._advance_scheduled = True
+            loop.call_soon(self._advance, loop, self._SETTLE_ITERATIONS)
+        await future
+
+
+    def sync_sleep(self, seconds):
+        """
+        Advance virtual time by `seconds`, without sleeping.
+        """
+        self._now += max(seconds, 0)
+
+
+    def _advance(self, loop, iterations):
+
+        if iterations:
+            loop.call_soon(self._advance, loop, iterations - 1)
+            return
+
+        sleepers = self._sleepers
+        # Cancelled sleepers are just dropped.
+        while sleepers and sleepers[0][2].done():
+            heapq.heappop(sleepers)
+        if not sleepers:
+            self._advance_scheduled = False
+            return
+
+        wake_time = sleepers[0][0]
+        self._now = max(self._now, wake_time)
+        while sleepers and sleepers[0][0] <= wake_time:
+            _wake_time, _sequence, future = heapq.heappop(sleepers)
+            if not future.done():
+                future.set_result(None)
+
+        # Remaining sleepers are woken later, if no earlier ones show up.
+        loop.call_soon(self._advance, loop, self._SETTLE_ITERATIONS)
+
+
+
+_clock = SystemClock()
+
+
+def set_clock(clock):
+    """
+    Set the `clock` driving all animation frame timing: None restores the
+    default, wall clock time, SystemClock.
+    """
+    global _clock
+
+    _clock = SystemClock() if clock is None else clock
+
+
+def get_clock():
+    """
+    Returns the clock driving all animation frame timing.
+    """
+    return _clock
+
+
+@contextlib.contextmanager
+def virtual_time(start=0):
+    """
+    Drives all animation frame timing with a VirtualClock, starting at
+    `start`, within the context, which is returned on enter.
+    """
+    previous = _clock
+    clock = VirtualClock(start)
+    set_clock(clock)
+    try:
+        yield clock
+    finally:
+        set_clock(previous)
+
+
+
+class Animation:
+    """
+    A frame based animation, lasting `total_frames` frames, each of which
+    `frame_seconds` long.
+
+    Sub-classes implement the `step` method, called once per frame.
+    """
+
+    def __init__(self, *, total_frames, frame_seconds):
+
+        self.total_frames = total_frames
+        self.frame_seconds = frame_seconds
+
+
+    def step(self, frame):
+        """
+        Advance the animation to `frame`, going from 1 to `total_frames`.
+
+        Returns None or an awaitable, awaited for by asynchronous runs before
+        the next frame is produced.
+        """
+        raise NotImplementedError
+
+
+
+class _Running:
+
+    # Tracks a running animation's progress in a FrameScheduler.
+
+    __slots__ = ('animation', 'future', 'start', 'frame', 'paused_at', 'pending')
+
+    def __init__(self, animation, future):
+
+        self.animation = animation
+        self.future = future
+        self.start = None
+        self.frame = 0
+        self.paused_at = None
+        # Task awaiting the last step's awaitable, if any.
+        self.pending = None
+
+
+    @property
+    def waiting(self):
+
+        return self.pending is not None and not self.pending.done()
+
+
+    @property
+    def next_time(self):
+
+        return self.start + self.frame * self.animation.frame_seconds
+
+
+    def wake_time(self, now):
+
+        # When the tick loop should next tick for this animation: paused ones
+        # are checked for resumes once per frame, as are ones waiting on their
+        # step's awaitable.
+
+        if self.paused_at is not None:
+            return now + self.animation.frame_seconds
+        if self.start is None:
+            return now
+        if self.waiting:
+            return max(self.next_time, now + self.animation.frame_seconds)
+        return self.next_time
+
+
+
+class FrameScheduler:
+    """
+    Runs animations, advancing all of them in a single tick per frame.
+
+    Each animation produces frames at its own rate, but all animations due at
+    a given time are advanced in the same tick: in lock-step.
+
+    Frames are scheduled against absolute deadlines, such that computation
+    overhead does not accumulate: animations that fall behind skip frames,
+    and last for their nominal duration.
+
+    Updates to `canvas`, requested via `request_update`, are coalesced such
+    that at most one happens per frame. Likewise, callables passed to `defer`
+    within a tick are called once, at its end.
+    """
+
+    def __init__(self, canvas):
+
+        # Weak reference: schedulers are tracked in a canvas keyed weak dict.
+        self._canvas_ref = weakref.ref(canvas)
+
+        # Running animation trackers, by animation.
+        self._running = {}
+        self._task = None
+
+        # Resolved to wake the tick loop from its sleep, while sleeping.
+        self._wakeup = None
+
+        self._in_tick = False
+        self._update_pending = False
+
+        # Deferred callables, as dict keys: ordered and unique.
+        self._deferred = {}
+
+
+    def request_update(self):
+        """
+        Request a canvas update. Requests are coalesced: the update happens
+        once at the end of the current tick, if called from within one, once
+        per event loop iteration, if called with a running event loop, or
+        immediately, otherwise.
+        """
+        if self._in_tick:
+            self._update_pending = True
+            return
+
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            self._update_pending = True
+            self._flush_update(blocking=True)
+            return
+
+        if not self._update_pending:
+            self._update_pending = True
+            loop.call_soon(self._flush_update)
+
+
+    def defer(self, callback):
+        """
+        Defer calling `callback` to the end of the current tick, before the
+        canvas update, if any. Deferring equal callables calls them once.
+
+        Returns True if deferred, or False, doing nothing, if not called from
+        within a tick.
+        """
+        if not self._in_tick:
+            return False
+        self._deferred[callback] = None
+        return True
+
+
+    def _call_deferred(self):
+
+        # Deferred callables may defer others: call them too.
+
+        while self._deferred:
+            deferred = self._deferred
+            self._deferred = {}
+            for callback in deferred:
+                callback()
+
+
+    def pause(self, animation):
+        """
+        Pause the running `animation`: no frames are produced until resumed.
+        """
+        running = self._running.get(animation)
+        if running is not None and running.paused_at is None:
+            running.paused_at = _clock.time()
+
+
+    def resume(self, animation):
+        """
+        Resume the paused `animation`, shifting its remaining frames by the
+        time it was paused for.
+        """
+        running = self._running.get(animation)
+        if running is None or running.paused_at is None:
+            return
+        if running.start is not None:
+            running.start += _clock.time() - running.paused_at
+        running.paused_at = None
+
+
+    def is_paused(self, animation):
+        """
+        True if `animation` is running and paused.
+        """
+        running = self._running.get(animation)
+        return running is not None and running.paused_at is not None
+
+
+    def _flush_update(self, blocking=False):
+
+        # When not `blocking`, updates may be left to a registered servicer.
+
+        if not self._update_pending:
+            return
+        self._update_pending = False
+        servicer = None if blocking else _running_loop_update_servicer()
+        if servicer is not None:
+            servicer()
+            return
+        canvas = self._canvas_ref()
+        if canvas is not None:
+            canvas.update()
+
+
+    def add(self, animation):
+        """
+        Add `animation`, to be run to completion by the scheduler's tick,
+        returning a future that is done when it completes: cancelling it
+        removes the animation. Requires a running event loop.
+
+        Raises ValueError if `animation` is already running.
+        """
+        if animation in self._running:
+            raise ValueError('animation already running')
+
+        loop = asyncio.get_running_loop()
+        running = _Running(animation, loop.create_future())
+        self._running[animation] = running
+        running.future.add_done_callback(lambda _future: self._discard(running))
+
+        if self._task is None:
+            self._task = loop.create_task(self._tick_loop())
+        else:
+            self._wake()
+
+        return running.future
+
+
+    async def async_run(self, animation):
+        """
+        Run `animation` to completion, driven by the scheduler's tick.
+        """
+        await self.add(animation)
+
+
+    def _discard(self, running):
+
+        # Stop tracking `running`, and awaiting its last step's awaitable.
+
+        if self._running.get(running.animation) is running:
+            del self._running[running.animation]
+        if running.pending is not None:
+            running.pending.cancel()
+
+
+    def sync_run(self, animation):
+        """
+        Run `animation` to completion, blocking while doing so.
+        """
+        clock = _clock
+        start = clock.time()
+        frame = 0
+        while True:
+            due_frame = _due_frame(animation, start, clock.time())
+            if due_frame > frame:
+                frame = due_frame
+                self._in_tick = True
+                try:
+                    with self._canvas_batch():
+                        try:
+                            animation.step(frame)
+                        finally:
+                            self._call_deferred()
+                finally:
+                    self._in_tick = False
+                self._flush_update(blocking=True)
+            delay = start + frame * animation.frame_seconds - clock.time()
+            if frame == animation.total_frames and delay <= _EPSILON:
+                break
+            clock.sync_sleep(max(delay, 0))
+
+
+    async def _tick_loop(self):
+
+        # Runs while there are running animations: one iteration per tick.
+
+        try:
+            while self._running:
+                clock = _clock
+                now = clock.time()
+                self._tick(now)
+                if not self._running:
+                    break
+                next_time = min(running.wake_time(now) for running in self._running.values())
+                # Sleep only what's left of the frame after the tick's work.
+                await self._sleep(clock, max(next_time - clock.time(), 0))
+        except Exception as exc:
+            # Such as a Tcl error in a batch or update: fail all animations.
+            for running in list(self._running.values()):
+                self._complete(running, exc)
+        finally:
+            self._task = None
+
+
+    async def _sleep(self, clock, seconds):
+
+        # Sleep for `seconds` on `clock`, or until woken by `_wake`, when
+        # animations are added or their step's awaitable completes.
+
+        loop = asyncio.get_running_loop()
+        self._wakeup = wakeup = loop.create_future()
+        sleep = asyncio.ensure_future(clock.async_sleep(seconds))
+        try:
+            await asyncio.wait((sleep, wakeup), return_when=asyncio.FIRST_COMPLETED)
+        finally:
+            self._wakeup = None
+            sleep.cancel()
+            wakeup.cancel()
+
+
+    def _wake(self):
+
+        wakeup = self._wakeup
+        if wakeup is not None and not wakeup.done():
+            wakeup.set_result(None)
+
+
+    def _tick(self, now):
+
+        # Advance animations to their due frames, completing finished ones.
+        # Deferred callables are called next, and canvas update requests are
+        # coalesced into one, at the very end. Nothing is awaited: awaitables
+        # returned by steps run as tasks, outside of the tick.
+
+        self._in_tick = True
+        try:
+            with self._canvas_batch():
+                try:
+                    self._tick_animations(now)
+                finally:
+                    self._call_deferred()
+        finally:
+            self._in_tick = False
+        self._flush_update()
+
+
+    def _canvas_batch(self):
+
+        # Canvas mutations in a frame are batched, if the canvas supports it.
+
+        canvas = self._canvas_ref()
+        if canvas is None:
+            return contextlib.nullcontext()
+        return _canvas.batch(canvas)
+
+
+    def _tick_animations(self, now):
+
+        finished = []
+        for running in list(self._running.values()):
+            if running.future.done():
+                # Cancelled, not yet discarded.
+                continue
+            if running.paused_at is not None or running.waiting:
+                # Animations wait for their last step's awaitable to complete.
+                continue
+            if running.start is None:
+                # Animations join at the first tick after being added.
+                running.start = now
+            animation = running.animation
+            due_frame = _due_frame(animation, running.start, now)
+            if due_frame > running.frame:
+                # When behind, intermediate frames are skipped.
+                running.frame = due_frame
+                try:
+                    result = animation.step(due_frame)
+                except Exception as exc:
+                    self._complete(running, exc)
+                    continue
+                if result is not None:
+                    self._await_step(running, result)
+                    continue
+            if running.frame == animation.total_frames and running.next_time <= now + _EPSILON:
+                # Last frame was produced and shown for its full duration.
+                finished.append(running)
+
+        for running in finished:
+            self._complete(running)
+
+
+    def _await_step(self, running, awaitable):
+
+        # Awaits a step's `awaitable` in a task, such that it can itself await
+        # other animations on this scheduler, and slow ones only hold back
+        # their own animation. Exceptions fail it.
+
+        def step_done(task):
+            if not task.cancelled() and task.exception() is not None:
+                self._complete(running, task.exception())
+            self._wake()
+
+        running.pending = asyncio.ensure_future(awaitable)
+        running.pending.add_done_callback(step_done)
+
+
+    def _complete(self, running, exc=None):
+
+        self._discard(running)
+        if running.future.done():
+            return
+        if exc is None:
+            running.future.set_result(None)
+        else:
+            running.future.set_exception(exc)
+
+
+
+_SCHEDULERS = weakref.WeakKeyDictionary()
+
+
+def for_canvas(canvas):
+    """
+    Returns the FrameScheduler driving the animations on `canvas`.
+    """
+    try:
+        return _SCHEDULERS[canvas]
+    except KeyError:
+        frame_scheduler = _SCHEDULERS[canvas] = FrameScheduler(canvas)
+        return frame_scheduler
+
+
+
+_UPDATE_SERVICERS = weakref.WeakKeyDictionary()
+
+
+def set_update_servicer(loop, servicer):
+    """
+    Set the `servicer` callable as the one handling coalesced canvas updates
+    while the `loop` event loop runs, instead of blocking `canvas.update`
+    calls. A None `servicer` removes a previously set one.
+    """
+    if servicer is None:
+        _UPDATE_SERVICERS.pop(loop, None)
+    else:
+        _UPDATE_SERVICERS[loop] = servicer
+
+
+def _running_loop_update_servicer():
+
+    try:
+        loop = asyncio.get_running_loop()
+    except RuntimeError:
+        return None
+    return _UPDATE_SERVICERS.get(loop)
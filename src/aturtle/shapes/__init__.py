@@ -6,4 +6,5 @@
 # ----------------------------------------------------------------------------
 
 from . import bitmap
+from . import cache
 from . import vector
@@ -9,6 +9,11 @@
 Shapes.
 """
 
+import hashlib
+import weakref
+
+from . import cache
+
 
 
 class Shape:
@@ -25,6 +30,9 @@ class Shape:
 
     Image rotation code is provided by sub-classes implementing the
     `rotated_data` method.
+
+    Sub-classes implementing the `source_digest` method have rotated data
+    shared among equal shapes, via the `cache.shared` rotation cache.
     """
 
     def __init__(self, image, *, anchor, rotations, pre_rotate=True):
@@ -40,15 +48,53 @@ class Shape:
         self._rotations = rotations
         self._pre_rotate = pre_rotate
 
-        self._rotated_data = {}
-        if pre_rotate:
-            for step in range(rotations):
-                self._rotated_data[step] = self.rotated_data(
-                    image=image,
-                    around=self._anchor,
-                    step=step,
-                    rotations=rotations,
-                )
+        source_digest = self._source_digest = self.source_digest(image)
+        if source_digest is None:
+            self._rotated_data = self._create_rotated_data()
+            return
+
+        key = self._shared_cache_key(source_digest)
+        self._rotated_data = cache.shared.acquire(
+            key,
+            self._create_rotated_data,
+            nbytes=self.rotated_data_nbytes(image, rotations),
+        )
+        weakref.finalize(self, cache.shared.release, key)
+
+
+    def _create_rotated_data(self):
+
+        if not self._pre_rotate:
+            return {}
+        return self.pre_rotated_data(
+            image=self._image_source,
+            around=self._anchor,
+            rotations=self._rotations,
+        )
+
+
+    def _cache_key(self, source_digest):
+
+        # Digest identifying the rotated data: rotation code depends on type.
+
+        shape_type = type(self)
+        key = hashlib.blake2b(source_digest, digest_size=16)
+        key.update(repr((
+            shape_type.__module__,
+            shape_type.__qualname__,
+            tuple(self._anchor),
+            self._rotations,
+            self._pre_rotate,
+        )).encode())
+        return key.digest()
+
+
+    def _shared_cache_key(self, source_digest):
+
+        # Key in the shared rotation cache: sub-classes whose rotated data is
+        # bound to something else, like a Tk interpreter, add it here.
+
+        return self._cache_key(source_digest)
 
 
     @property
@@ -67,15 +113,58 @@ class Shape:
         raise NotImplementedError
 
 
+    def source_digest(self, image):
+        """
+        Returns a bytes digest of the `image` source data, such that equal
+        shapes share their rotated data, or None, the default, for no sharing.
+        """
+        return None
+
+
+    def rotated_data_nbytes(self, image, rotations):
+        """
+        Returns the estimated size, in bytes, of all `rotations` of `image`,
+        used in rotation cache accounting.
+        """
+        return 0
+
+
+    def pre_rotated_data(self, image, around, rotations):
+        """
+        Returns `image` rotated around the `around` (x, y) tuple, for all steps
+        in range(`rotations`), in an object indexable by step.
+
+        Calls `rotated_data` once per step. Sub-classes may override it with a
+        more efficient implementation.
+        """
+        return {
+            step: self.rotated_data(
+                image=image,
+                around=around,
+                step=step,
+                rotations=rotations,
+            )
+            for step in range(rotations)
+        }
+
+
+    def _step(self, angle):
+
+        # Rotation step closest to `angle`, in degrees.
+
+        rotations = self._rotations
+        return round(angle * rotations / 360) % rotations
+
+
     def __getitem__(self, angle):
         """
         Image data at the given angle, in degrees.
         """
         rotations = self._rotations
-        step = round(angle * rotations / 360) % rotations
+        step = self._step(angle)
 
         rotated_data = self._rotated_data
-        if not step in rotated_data and not self._pre_rotate:
+        if not self._pre_rotate and step not in rotated_data:
             rotated_data[step] = self.rotated_data(
                 image=self._image_source,
                 around=self._anchor,
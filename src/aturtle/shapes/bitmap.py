@@ -10,6 +10,8 @@ Bitmap Shapes.
 """
 
 import base64
+import concurrent.futures
+import hashlib
 import io
 import math
 
@@ -22,6 +24,70 @@ else:
     tkinter = None
 
 from . import base
+from . import cache
+
+
+
+# Background rotations run in worker threads: PIL releases the GIL while
+# rotating images. The executor is created on first use.
+
+_BACKGROUND_WORKERS = 2
+
+_background_executor = None
+
+
+def _get_background_executor():
+
+    global _background_executor
+
+    if _background_executor is None:
+        _background_executor = concurrent.futures.ThreadPoolExecutor(
+            max_workers=_BACKGROUND_WORKERS,
+            thread_name_prefix='aturtle-rotation',
+        )
+    return _background_executor
+
+
+
+def _rotated_pil_image(pil_image, around, step, total):
+
+    # PIL-based image rotation, safe to call from any thread.
+
+    if step == 0:
+        return pil_image
+
+    theta = 360 * step / total
+
+    return pil_image.rotate(
+        theta,
+        resample=Image.BICUBIC,
+        center=around,
+    )
+
+
+
+def _rotate_in_background(pil_image, around, rotations, ready, rotated_data):
+
+    # Runs in a worker thread, tracking rotated PIL images in `ready`, by step.
+    # PhotoImages are not created here: that must happen in the Tk thread.
+
+    for step in range(rotations):
+        if step not in rotated_data:
+            ready[step] = _rotated_pil_image(pil_image, around, step, rotations)
+
+
+
+# Distinguishes on-disk cache entries: bump when rotation output changes.
+
+_DISK_CACHE_VARIANT = b'bicubic-nearest-1'
+
+
+
+def _tcl_put(image, pixels, x, y):
+
+    # Tcl command putting the `pixels` row into `image`, starting at (x, y).
+
+    return f'{image} put {{{{{" ".join(pixels)}}}}} -to {x} {y}'
 
 
 
@@ -46,11 +112,18 @@ class Shape(base.Shape):
 
     The number of supported rotations is given by `rotations`, which must be
     a strictly positive integer.
+
+    If `background` is true, and PIL is available, pre-computation happens in
+    a background thread, not delaying creation: until a given rotation is
+    ready, indexing returns the nearest ready one, if any, or creates it.
+
+    Pre-computed rotations are stored in, and loaded from, the on-disk cache,
+    if enabled via `cache.enable_disk_cache`.
     """
 
 
     def __init__(self, filename=None, data=None, *, anchor=(0.5, 0.5),
-                 rotations=36, pre_rotate=True):
+                 rotations=36, pre_rotate=True, background=False):
 
         if not filename and not data:
             raise ValueError('Need one of filename or data arguments.')
@@ -73,13 +146,69 @@ class Shape(base.Shape):
             int(ay * height) if isinstance(ay, float) else ay,
         )
 
+        self._filename = filename
+        self._data = data
+        self._size = (width, height)
+        self._tkinter_source = None
+
+        # Background rotation requires PIL: PhotoImages are Tk thread bound.
+        background = background and pre_rotate and not tkinter
+
         super().__init__(
             image=image,
             anchor=anchor,
             rotations=rotations,
-            pre_rotate=pre_rotate,
+            pre_rotate=pre_rotate and not background,
         )
 
+        self._background_ready = None
+        self._background_future = None
+        if background:
+            self._background_ready = {}
+            self._background_future = _get_background_executor().submit(
+                _rotate_in_background,
+                image,
+                self._anchor,
+                rotations,
+                self._background_ready,
+                self._rotated_data,
+            )
+
+
+    def _shared_cache_key(self, source_digest):
+
+        # Rotated PhotoImages belong to the Tk interpreter they were created
+        # under: equal shapes only share them within the same one.
+
+        generation = b'tk-%d' % cache.tk_generation
+        return self._cache_key(source_digest + generation)
+
+
+    def source_digest(self, image):
+        """
+        Returns a digest of the source file content or data, such that equal
+        shapes share rotations, or None if the source file can't be read.
+        """
+        digest = hashlib.blake2b(b'tkinter' if tkinter else b'pil')
+        if self._filename:
+            try:
+                with open(self._filename, 'rb') as source:
+                    digest.update(source.read())
+            except OSError:
+                return None
+        else:
+            data = self._data
+            digest.update(data.encode() if isinstance(data, str) else data)
+        return digest.digest()
+
+
+    def rotated_data_nbytes(self, image, rotations):
+        """
+        Returns the estimated size, in bytes, of all `rotations` of `image`.
+        """
+        width, height = self._size
+        return width * height * 4 * rotations
+
 
     def rotated_data(self, image, around, step, rotations):
         """
@@ -97,9 +226,100 @@ class Shape(base.Shape):
         return self._rotated_pil(image, around, step, rotations)
 
 
+    def pre_rotated_data(self, image, around, rotations):
+        """
+        Returns `image` rotated around the `around` (x, y) tuple, for all steps
+        in range(`rotations`), in an object indexable by step.
+
+        If the on-disk cache is enabled, rotated images are loaded from it,
+        when available, and stored in it, otherwise.
+        """
+        disk_cache = cache.disk
+        if disk_cache is None or self._source_digest is None:
+            return super().pre_rotated_data(image, around, rotations)
+
+        # The key depends on the source content: changed sources miss it.
+        key = self._cache_key(self._source_digest + _DISK_CACHE_VARIANT).hex()
+
+        path = disk_cache.get(key)
+        if path is not None:
+            try:
+                return self._read_strip(path, rotations)
+            except Exception:
+                # Unreadable or otherwise invalid: rotate and store again.
+                pass
+
+        if tkinter:
+            rotated_data = super().pre_rotated_data(image, around, rotations)
+            frames = [rotated_data[step] for step in range(rotations)]
+        else:
+            # PIL images are stored, PhotoImages are created from them.
+            frames = [
+                _rotated_pil_image(image, around, step, rotations)
+                for step in range(rotations)
+            ]
+            rotated_data = {
+                step: ImageTk.PhotoImage(frame)
+                for step, frame in enumerate(frames)
+            }
+
+        disk_cache.put(key, lambda path: self._write_strip(frames, path))
+        return rotated_data
+
+
+    def _read_strip(self, path, rotations):
+
+        # Rotated images from the side by side frames in the `path` PNG file.
+
+        width, height = self._size
+        if tkinter:
+            strip = tkinter.PhotoImage(file=str(path))
+            strip_width, strip_height = strip.width(), strip.height()
+        else:
+            strip = Image.open(path)
+            strip.load()
+            strip_width, strip_height = strip.width, strip.height
+
+        if (strip_width, strip_height) != (width * rotations, height):
+            raise ValueError(f'Unexpected strip size in {path}.')
+
+        rotated_data = {}
+        for step in range(rotations):
+            x = step * width
+            if tkinter:
+                frame = tkinter.PhotoImage(width=width, height=height)
+                frame.tk.call(
+                    frame.name, 'copy', strip.name,
+                    '-from', x, 0, x + width, height,
+                )
+            else:
+                frame = ImageTk.PhotoImage(strip.crop((x, 0, x + width, height)))
+            rotated_data[step] = frame
+        return rotated_data
+
+
+    def _write_strip(self, frames, path):
+
+        # Writes `frames` side by side, as a PNG file, to `path`.
+
+        width, height = self._size
+        strip_size = (width * len(frames), height)
+        if tkinter:
+            strip = tkinter.PhotoImage(width=strip_size[0], height=strip_size[1])
+            for step, frame in enumerate(frames):
+                strip.tk.call(strip.name, 'copy', frame.name, '-to', step * width, 0)
+            strip.write(str(path), format='png')
+        else:
+            strip = Image.new('RGBA', strip_size)
+            for step, frame in enumerate(frames):
+                strip.paste(frame, (step * width, 0))
+            strip.save(path, format='PNG')
+
+
     def _rotated_tkinter(self, image, around, step, rotations):
 
-        # tkinter-based image rotation
+        # tkinter-based image rotation: source pixels are read in bulk, once,
+        # and rotated pixels are written in bulk, in a single Tcl evaluation.
 
         w = image.width()
         h = image.height()
@@ -107,47 +327,130 @@ class Shape(base.Shape):
         ax, ay = around
 
         theta = math.pi * 2 * step / rotations
+        cos_theta = math.cos(theta)
+        sin_theta = math.sin(theta)
+
+        # Inverse mapping tables: source coordinates contributed by x and y,
+        # offset by 0.5 such that truncating them picks the nearest pixel.
+        x_cos = [(x - ax) * cos_theta + ax + 0.5 for x in range(w)]
+        x_sin = [(x - ax) * sin_theta + ay + 0.5 for x in range(w)]
+        y_cos = [(y - ay) * cos_theta for y in range(h)]
+        y_sin = [(y - ay) * sin_theta for y in range(h)]
+
+        source_pixels = self._tkinter_source_pixels(image)
 
-        pixel_rows = []
-        transparency = {}
+        rotated = tkinter.PhotoImage(width=w, height=h)
 
+        # Blank PhotoImages are fully transparent: put opaque runs only.
+        put_commands = []
         for y in range(h):
-            pixel_row = []
+            off_y_sin = y_sin[y]
+            off_y_cos = y_cos[y]
+            run_start = None
+            run = []
             for x in range(w):
-                cos_theta = math.cos(theta)
-                sin_theta = math.sin(theta)
-                off_x = x - ax
-                off_y = y - ay
-                src_x = int(off_x * cos_theta - off_y * sin_theta) + ax
-                src_y = int(off_x * sin_theta + off_y * cos_theta) + ay
+                src_x = x_cos[x] - off_y_sin
+                src_y = x_sin[x] + off_y_cos
                 if (0 <= src_x < w) and (0 <= src_y < h):
-                    red, green, blue = image.get(src_x, src_y)
-                    transp = image.transparency_get(src_x, src_y)
+                    pixel = source_pixels[int(src_y)][int(src_x)]
                 else:
-                    red, green, blue = 255, 255, 255
-                    transp = True
-                pixel_row.append(f'#{red:02x}{green:02x}{blue:02x}')
-                transparency[(x, y)] = transp
-            pixel_rows.append(pixel_row)
-
-        rotated = image.copy()
-        rotated.put(pixel_rows)
-        for (x, y), transp in transparency.items():
-            rotated.transparency_set(x, y, transp)
+                    pixel = None
+                if pixel is not None:
+                    if run_start is None:
+                        run_start = x
+                    run.append(pixel)
+                elif run_start is not None:
+                    put_commands.append(_tcl_put(rotated, run, run_start, y))
+                    run_start = None
+                    run = []
+            if run_start is not None:
+                put_commands.append(_tcl_put(rotated, run, run_start, y))
+
+        if put_commands:
+            rotated.tk.eval('\n'.join(put_commands))
 
         return rotated
 
 
+    def _tkinter_source_pixels(self, image):
+
+        # Returns rows of '#rrggbb' pixel colors, None for transparent ones.
+        # Transparency is derived from reading the image data twice, each
+        # with a different background color, that fills transparent pixels.
+
+        if self._tkinter_source is None:
+            tk = image.tk
+            rows = tk.splitlist(tk.call(image.name, 'data'))
+            black_rows = tk.splitlist(tk.call(image.name, 'data', '-background', '#000000'))
+            white_rows = tk.splitlist(tk.call(image.name, 'data', '-background', '#ffffff'))
+            self._tkinter_source = [
+                [
+                    None if (black, white) == ('#000000', '#ffffff') else pixel
+                    for pixel, black, white in zip(
+                        tk.splitlist(row),
+                        tk.splitlist(black_row),
+                        tk.splitlist(white_row),
+                    )
+                ]
+                for row, black_row, white_row in zip(rows, black_rows, white_rows)
+            ]
+        return self._tkinter_source
+
+
     def _rotated_pil(self, pil_image, around, step, total):
 
         # PIL-based image rotation.
 
-        theta = 360 * step / total
-
-        rotated_pil_image = pil_image.rotate(
-            theta,
-            resample=Image.BICUBIC,
-            center=around,
-        )
+        rotated_pil_image = _rotated_pil_image(pil_image, around, step, total)
 
         return ImageTk.PhotoImage(rotated_pil_image)
+
+
+    def __getitem__(self, angle):
+        """
+        Image data at the given angle, in degrees.
+        """
+        ready = self._background_ready
+        if ready is None:
+            return super().__getitem__(angle)
+
+        rotations = self._rotations
+        step = self._step(angle)
+
+        rotated_data = self._rotated_data
+        if step not in rotated_data:
+            step = self._background_step(step)
+
+        if self._background_future.done() and len(rotated_data) == rotations:
+            # All rotations available: no more background work to track.
+            self._background_ready = None
+
+        return rotated_data[step]
+
+
+    def _background_step(self, step):
+
+        # Returns `step`, or the nearest one with available rotated data,
+        # creating PhotoImages from background rotated images, in Tk thread.
+        # Only if none is available, rotated data for `step` is created: the
+        # background worker will get to it, blocking here would repeat work.
+
+        rotations = self._rotations
+        rotated_data = self._rotated_data
+        ready = self._background_ready
+
+        for distance in range(rotations // 2 + 1):
+            for nearby_step in ((step - distance) % rotations, (step + distance) % rotations):
+                if nearby_step in rotated_data:
+                    return nearby_step
+                if nearby_step in ready:
+                    rotated_data[nearby_step] = ImageTk.PhotoImage(ready.pop(nearby_step))
+                    return nearby_step
+
+        rotated_data[step] = self.rotated_data(
+            image=self._image_source,
+            around=self._anchor,
+            step=step,
+            rotations=rotations,
+        )
+        return step
@@ -0,0 +1,280 @@
+# ----------------------------------------------------------------------------
+# Python A-Turtle
+# ----------------------------------------------------------------------------
+# Copyright (c) Tiago Montes.
+# See LICENSE for details.
+# ----------------------------------------------------------------------------
+
+"""
+Rotation caches.
+
+Equal shapes share their rotated data via a process wide cache, keyed by a
+digest of the shape's type, source data, anchor and rotations, and, for data
+holding Tk images, the Tk interpreter generation.
+
+Optionally, bitmap shapes persist their rotated data in an on-disk cache,
+enabled via `enable_disk_cache`, such that it can be loaded by subsequent
+processes, instead of being recomputed.
+"""
+
+import collections
+import os
+import pathlib
+import sys
+
+
+
+class _Entry:
+
+    __slots__ = ('data', 'nbytes', 'references')
+
+    def __init__(self, data, nbytes):
+
+        self.data = data
+        self.nbytes = nbytes
+        self.references = 0
+
+
+
+class RotationCache:
+    """
+    A reference counted cache of rotated shape data.
+
+    Data in use by at least one shape is always kept. Data no longer in use
+    is kept as long as the estimated size of all cached data does not exceed
+    `max_bytes`, with the least recently used data being evicted first.
+    """
+
+    def __init__(self, max_bytes=64 * 1024 * 1024):
+
+        self._max_bytes = max_bytes
+        self._entries = {}
+        self._unused = collections.OrderedDict()
+        self._nbytes = 0
+
+
+    @property
+    def max_bytes(self):
+        """
+        Size ceiling, in bytes, above which data no longer in use is evicted.
+        """
+        return self._max_bytes
+
+
+    @max_bytes.setter
+    def max_bytes(self, value):
+
+        self._max_bytes = value
+        self._evict()
+
+
+    @property
+    def nbytes(self):
+        """
+        Estimated size, in bytes, of all cached data.
+        """
+        return self._nbytes
+
+
+    def __len__(self):
+
+        return len(self._entries)
+
+
+    def acquire(self, key, factory, nbytes):
+        """
+        Returns the data cached under `key`, taking a reference to it. If not
+        cached, it is created by calling `factory` and is accounted for as
+        being `nbytes` long.
+
+        Each `acquire` must be paired with a `release`.
+        """
+        entry = self._entries.get(key)
+        if entry is None:
+            entry = self._entries[key] = _Entry(factory(), nbytes)
+            self._nbytes += nbytes
+        else:
+            self._unused.pop(key, None)
+        entry.references += 1
+        self._evict()
+        return entry.data
+
+
+    def release(self, key):
+        """
+        Drops a reference to the data cached under `key`, previously obtained
+        with `acquire`.
+        """
+        entry = self._entries.get(key)
+        if entry is None:
+            return
+        entry.references -= 1
+        if entry.references <= 0:
+            self._unused[key] = None
+            self._evict()
+
+
+    def clear(self):
+        """
+        Evicts all cached data no longer in use.
+        """
+        while self._unused:
+            self._drop(self._unused.popitem(last=False)[0])
+
+
+    def _evict(self):
+
+        while self._unused and self._nbytes > self._max_bytes:
+            self._drop(self._unused.popitem(last=False)[0])
+
+
+    def _drop(self, key):
+
+        entry = self._entries.pop(key)
+        self._nbytes -= entry.nbytes
+
+
+
+shared = RotationCache()
+
+
+
+# Tk interpreter generation, bumped by `tk_destroyed`: shapes whose rotated
+# data holds Tk images, like bitmap ones, key it by generation, such that
+# equal shapes created under a new interpreter don't share dead images.
+
+tk_generation = 0
+
+
+def tk_destroyed():
+    """
+    Called when the Tk interpreter is destroyed: starts a new generation and
+    evicts all cached data no longer in use.
+    """
+    global tk_generation
+
+    tk_generation += 1
+    shared.clear()
+
+
+
+class DiskCache:
+    """
+    A size bounded on-disk cache of files, each stored under a hex `key`, in
+    the `directory` directory.
+
+    When the total size of cached files exceeds `max_bytes`, the least
+    recently used ones are deleted. Failing file system operations are not
+    raised: the cache is a best effort one.
+    """
+
+    _SUFFIX = '.png'
+
+    def __init__(self, directory, max_bytes=256 * 1024 * 1024):
+
+        self._directory = pathlib.Path(directory)
+        self._max_bytes = max_bytes
+
+
+    @property
+    def directory(self):
+        """
+        The directory holding the cached files.
+        """
+        return self._directory
+
+
+    def get(self, key):
+        """
+        Returns the path to the file cached under `key`, or None.
+        """
+        path = self._directory / (key + self._SUFFIX)
+        try:
+            # Track usage recency in the modification time.
+            os.utime(path)
+        except OSError:
+            return None
+        return path
+
+
+    def put(self, key, write):
+        """
+        Caches the file written by the `write` callable, under `key`. It is
+        called with a temporary path, such that no partially written files
+        are ever cached.
+        """
+        path = self._directory / (key + self._SUFFIX)
+        temp_path = path.with_name(f'{key}-{os.getpid()}.tmp')
+        try:
+            self._directory.mkdir(parents=True, exist_ok=True)
+            write(temp_path)
+            os.replace(temp_path, path)
+        except Exception:
+            # Writers may fail in many ways: the cache is left unchanged.
+            return
+        finally:
+            if temp_path.exists():
+                temp_path.unlink()
+        self._evict()
+
+
+    def _evict(self):
+
+        try:
+            entries = [
+                (entry.stat(), entry)
+                for entry in self._directory.iterdir()
+                if entry.suffix == self._SUFFIX
+            ]
+        except OSError:
+            return
+
+        total_bytes = sum(stat.st_size for stat, _entry in entries)
+        entries.sort(key=lambda stat_entry: stat_entry[0].st_mtime)
+        for stat, entry in entries:
+            if total_bytes <= self._max_bytes:
+                break
+            try:
+                entry.unlink()
+            except OSError:
+                continue
+            total_bytes -= stat.st_size
+
+
+
+disk = None
+
+
+def enable_disk_cache(directory=None, max_bytes=256 * 1024 * 1024):
+    """
+    Enables the on-disk cache of rotated bitmap shapes, in `directory`, with
+    up to `max_bytes`. If `directory` is None, a per-user cache directory is
+    used.
+    """
+    global disk
+
+    if directory is None:
+        directory = _user_cache_directory()
+    disk = DiskCache(directory, max_bytes)
+
+
+def disable_disk_cache():
+    """
+    Disables the on-disk cache of rotated bitmap shapes.
+    """
+    global disk
+
+    disk = None
+
+
+def _user_cache_directory():
+
+    # Platform dependent per-user cache directory.
+
+    if sys.platform == 'win32':
+        base = os.environ.get('LOCALAPPDATA') or pathlib.Path.home() / 'AppData' / 'Local'
+        return pathlib.Path(base) / 'aturtle' / 'Cache'
+    if sys.platform == 'darwin':
+        return pathlib.Path.home() / 'Library' / 'Caches' / 'aturtle'
+    base = os.environ.get('XDG_CACHE_HOME') or pathlib.Path.home() / '.cache'
+    return pathlib.Path(base) / 'aturtle'
@@ -6,13 +6,22 @@
 # ----------------------------------------------------------------------------
 
 import asyncio
+import bisect
 import contextlib
 import math
 
+from .. import easing as _easing
+from .. import scheduler
 from .. utils import syncer
 
 
 
+# Tolerance below which no eased progress is considered to remain.
+
+_EPSILON = 1e-9
+
+
+
 class AnimationError(Exception):
     """
     Sprite animation error.
@@ -70,6 +79,359 @@ class _ConcurrentAnimationContexts:
 
 
 
+class _SpriteAnimation(scheduler.Animation):
+    """
+    Sprite animation, lasting `seconds` at `fps` frames per second, with
+    progress changed via the `easing` callable, if not None. Table backed
+    easing.Easing objects provide the eased progress for all frames at once.
+
+    Sub-classes implement the `apply` method which, once per frame, updates
+    the sprite and returns the value passed to `callback`, if not None, along
+    with the eased progress.
+    """
+    def __init__(self, sprite, *, seconds, easing, callback, fps, update):
+
+        super().__init__(
+            # Fast speed / low fps lead to 0 total_frames. Have at least 1.
+            total_frames=max(int(seconds * fps), 1),
+            frame_seconds=1 / fps,
+        )
+        self._sprite = sprite
+        self._easing = easing
+        if isinstance(easing, _easing.Easing):
+            self._eased_frames = easing.frames(self.total_frames)
+        else:
+            self._eased_frames = None
+        self._callback = callback
+        self._update = update
+        self._prev_eased_progress = 0
+        self.frame = 0
+
+
+    def step(self, frame):
+
+        self.frame = frame
+
+        if self._eased_frames is not None:
+            eased_progress = self._eased_frames[frame-1]
+        elif self._easing:
+            eased_progress = self._easing(frame / self.total_frames)
+        else:
+            eased_progress = frame / self.total_frames
+        value = self.apply(eased_progress, self._prev_eased_progress)
+        self._prev_eased_progress = eased_progress
+        if self._callback:
+            return self._callback(eased_progress, value)
+        return None
+
+
+    def apply(self, eased_progress, prev_eased_progress):
+        """
+        Update the sprite to the given `eased_progress`, returning the value
+        to be passed to the callback.
+        """
+        raise NotImplementedError
+
+
+
+class _MoveAnimation(_SpriteAnimation):
+
+    def __init__(self, sprite, dx, dy, **kwargs):
+
+        super().__init__(sprite, **kwargs)
+        self._dx = dx
+        self._dy = dy
+
+
+    def apply(self, eased_progress, prev_eased_progress):
+
+        eased_delta = eased_progress - prev_eased_progress
+        sprite = self._sprite
+        sprite.direct_move(self._dx * eased_delta, self._dy * eased_delta, update=self._update)
+        return sprite.anchor
+
+
+
+class _MoveToAnimation(_SpriteAnimation):
+
+    def __init__(self, sprite, x, y, *, speed, **kwargs):
+
+        self._start_x, self._start_y = sprite.anchor
+        self._dx = x - self._start_x
+        self._dy = y - self._start_y
+        distance = (self._dx ** 2 + self._dy ** 2) ** 0.5
+        super().__init__(sprite, seconds=distance / speed, **kwargs)
+
+
+    def retarget(self, x, y):
+
+        # From the current position, cover the remaining eased progress
+        # towards (x, y): no jumps, same remaining duration.
+
+        remaining = 1 - self._prev_eased_progress
+        current_x, current_y = self._sprite.anchor
+        if abs(remaining) < _EPSILON:
+            self._start_x, self._start_y = x, y
+            self._dx = self._dy = 0
+            return
+        self._dx = (x - current_x) / remaining
+        self._dy = (y - current_y) / remaining
+        self._start_x = current_x - self._dx * self._prev_eased_progress
+        self._start_y = current_y - self._dy * self._prev_eased_progress
+
+
+    def apply(self, eased_progress, prev_eased_progress):
+
+        frame_x = self._start_x + self._dx * eased_progress
+        frame_y = self._start_y + self._dy * eased_progress
+        sprite = self._sprite
+        sprite.direct_move_to(frame_x, frame_y, update=self._update)
+        return sprite.anchor
+
+
+
+class _ForwardAnimation(_SpriteAnimation):
+
+    # Tracks concurrent updates to the sprite's angle, on every frame.
+
+    def __init__(self, sprite, delta, **kwargs):
+
+        super().__init__(sprite, **kwargs)
+        self._delta = delta
+
+
+    def apply(self, eased_progress, prev_eased_progress):
+
+        eased_delta = (eased_progress - prev_eased_progress) * self._delta
+        sprite = self._sprite
+        angle_rad = sprite.angle * math.pi / 180.0
+        frame_dx = eased_delta * math.cos(angle_rad)
+        frame_dy = eased_delta * math.sin(angle_rad)
+        sprite.direct_move(frame_dx, frame_dy, update=self._update)
+        return sprite.anchor
+
+
+
+class _RotateAnimation(_SpriteAnimation):
+
+    def __init__(self, sprite, dangle, *, around, **kwargs):
+
+        super().__init__(sprite, **kwargs)
+        self._dangle = dangle
+        self._around = around
+
+
+    def apply(self, eased_progress, prev_eased_progress):
+
+        eased_delta = eased_progress - prev_eased_progress
+        sprite = self._sprite
+        sprite.direct_rotate(self._dangle * eased_delta, around=self._around, update=self._update)
+        return sprite.angle
+
+
+
+class _RotateToAnimation(_SpriteAnimation):
+
+    # Rotates along the shortest path.
+
+    def __init__(self, sprite, angle, *, around, speed, **kwargs):
+
+        self._start_angle = sprite.angle
+        dangle = (angle - self._start_angle) % 360
+        if dangle > 180:
+            dangle = dangle - 360
+        self._dangle = dangle
+        self._around = around
+        super().__init__(sprite, seconds=abs(dangle / speed), **kwargs)
+
+
+    def retarget(self, angle):
+
+        # Like _MoveToAnimation.retarget, along the shortest path.
+
+        remaining = 1 - self._prev_eased_progress
+        current = self._sprite.angle
+        dangle = (angle - current + 180) % 360 - 180
+        if abs(remaining) < _EPSILON:
+            self._start_angle = current + dangle
+            self._dangle = 0
+            return
+        self._dangle = dangle / remaining
+        self._start_angle = current - self._dangle * self._prev_eased_progress
+
+
+    def apply(self, eased_progress, prev_eased_progress):
+
+        frame_angle = self._start_angle + self._dangle * eased_progress
+        sprite = self._sprite
+        sprite.direct_rotate_to(frame_angle, around=self._around, update=self._update)
+        return sprite.angle
+
+
+
+class _FollowPathAnimation(_SpriteAnimation):
+
+    # Moves along the polyline from the sprite's anchor through `points`, at
+    # constant speed, optionally rotating towards each point's angle. The
+    # callback value is the list of path points passed through since the
+    # previous frame, ending with the sprite's anchor.
+
+    def __init__(self, sprite, points, *, angles, around, speed, **kwargs):
+
+        points = [sprite.anchor, *points]
+        if len(points) < 2:
+            points.append(sprite.anchor)
+        if angles is not None:
+            angles = [sprite.angle, *angles]
+            if len(angles) != len(points):
+                raise ValueError('angles and points must have the same length')
+
+        # Cumulative arc length at each point, computed once.
+        distances = [0]
+        for (x0, y0), (x1, y1) in zip(points, points[1:]):
+            distances.append(distances[-1] + math.hypot(x1 - x0, y1 - y0))
+
+        self._points = points
+        self._angles = angles
+        self._around = around
+        self._distances = distances
+        self._next_vertex = 1
+        super().__init__(sprite, seconds=distances[-1] / speed, **kwargs)
+
+
+    def apply(self, eased_progress, prev_eased_progress):
+
+        points = self._points
+        distances = self._distances
+        distance = eased_progress * distances[-1]
+
+        # Segment `index` goes from points[index-1] to points[index].
+        index = bisect.bisect_left(distances, distance, 1, len(points) - 1)
+        segment = distances[index] - distances[index-1]
+        fraction = (distance - distances[index-1]) / segment if segment else 1
+
+        (x0, y0), (x1, y1) = points[index-1], points[index]
+        sprite = self._sprite
+        sprite.direct_move_to(
+            x0 + (x1 - x0) * fraction,
+            y0 + (y1 - y0) * fraction,
+            update=self._update,
+        )
+        if self._angles is not None:
+            angle0 = self._angles[index-1]
+            dangle = (self._angles[index] - angle0 + 180) % 360 - 180
+            sprite.direct_rotate_to(
+                angle0 + dangle * fraction,
+                around=self._around,
+                update=self._update,
+            )
+
+        passed = points[self._next_vertex:index]
+        self._next_vertex = max(self._next_vertex, index)
+        return [*passed, sprite.anchor]
+
+
+
+class AnimationHandle:
+    """
+    A running Sprite animation, as started by the Sprite's `start_*` methods.
+
+    Awaiting it waits for the animation to complete, or to be cancelled.
+    """
+
+    def __init__(self, frame_scheduler, animation, future):
+
+        self._scheduler = frame_scheduler
+        self._animation = animation
+        self._future = future
+
+
+    def __await__(self):
+
+        return self._wait().__await__()
+
+
+    async def _wait(self):
+
+        await asyncio.wait([self._future])
+        if not self._future.cancelled():
+            self._future.result()
+
+
+    @property
+    def progress(self):
+        """
+        Linear animation progress, from 0 to 1.
+        """
+        animation = self._animation
+        return animation.frame / animation.total_frames
+
+
+    @property
+    def remaining(self):
+        """
+        Remaining animation time, in seconds, not counting pauses.
+        """
+        if self._future.done():
+            return 0
+        animation = self._animation
+        return (animation.total_frames - animation.frame) * animation.frame_seconds
+
+
+    @property
+    def paused(self):
+        """
+        True if the animation is paused.
+        """
+        return self._scheduler.is_paused(self._animation)
+
+
+    def pause(self):
+        """
+        Pause the animation.
+        """
+        self._scheduler.pause(self._animation)
+
+
+    def resume(self):
+        """
+        Resume the paused animation.
+        """
+        self._scheduler.resume(self._animation)
+
+
+    def cancel(self):
+        """
+        Cancel the animation, leaving the Sprite where it is.
+        """
+        self._future.cancel()
+
+
+    def done(self):
+        """
+        True if the animation completed or was cancelled.
+        """
+        return self._future.done()
+
+
+    def retarget(self, *target):
+        """
+        Redirect the animation to a new target: an (x, y) position for moves
+        started with `start_move_to`, or an angle for rotations started with
+        `start_rotate_to`. The animation's frame loop, timing and easing are
+        kept: the Sprite smoothly heads to the new target from where it is.
+
+        Raises AnimationError for other animations or if done.
+        """
+        retarget = getattr(self._animation, 'retarget', None)
+        if retarget is None:
+            raise AnimationError(f'cannot retarget {type(self._animation).__name__}')
+        if self._future.done():
+            raise AnimationError('cannot retarget finished animation')
+        retarget(*target)
+
+
+
 class Sprite:
 
     """
@@ -99,9 +461,9 @@ class Sprite:
         angle is the Sprite's angle at the time. Callback results are awaited
         for in by asynchronous animation methods.
 
-        Movement and rotation animations generate an aproximation of `fps`
-        frames per second (the computation overhead is not accounted for in
-        the inter-frame delays).
+        Movement and rotation animations generate `fps` frames per second,
+        scheduled against absolute deadlines: when falling behind, frames are
+        skipped such that animations last for their nominal duration.
 
         When `update` is true, the output canvas is updated automatically on
         movement or rotation.
@@ -125,6 +487,13 @@ class Sprite:
         self._movement = _ConcurrentAnimationContexts('moves')
         self._rotation = _ConcurrentAnimationContexts('rotates')
 
+        self._scheduler = scheduler.for_canvas(canvas)
+
+        # Canvas item changes, deferred to the end of the current frame.
+        self._deferred = False
+        self._pending_move = None
+        self._pending_rotation = False
+
 
     @property
     def canvas(self):
@@ -193,7 +562,7 @@ class Sprite:
         """
         sprite_x, sprite_y = self._anchor
         self._anchor = (sprite_x + dx, sprite_y + dy)
-        self._canvas.move(self._id, dx, dy)
+        self._move_item(dx, dy)
         self.update(update=update)
 
 
@@ -236,9 +605,10 @@ class Sprite:
             cos_theta = math.cos(angle_rad)
             new_x = old_x * cos_theta - old_y * sin_theta + cx
             new_y = old_x * sin_theta + old_y * cos_theta + cy
-            self._canvas.move(self._id, new_x - old_x - cx, new_y - old_y - cy)
+            self._move_item(new_x - old_x - cx, new_y - old_y - cy)
             self._anchor = (new_x, new_y)
 
+        self._rotate_item()
         self.update(update=update)
 
 
@@ -253,6 +623,198 @@ class Sprite:
         self.direct_rotate(angle-self._angle, around=around, update=update)
 
 
+    # ------------------------------------------------------------------------
+    # Canvas item changes.
+    #
+    # Within animation frames, canvas item changes are deferred to the end of
+    # the frame, such that concurrent moves and rotations result in a single
+    # change per kind, if not in a single, fused, one. Outside of frames, they
+    # are applied immediately.
+
+    def _defer(self):
+
+        if not self._deferred:
+            self._deferred = self._scheduler.defer(self._apply_deferred)
+        return self._deferred
+
+
+    def _move_item(self, dx, dy):
+
+        if not self._defer():
+            self._canvas.move(self._id, dx, dy)
+            return
+        if self._pending_move is None:
+            self._pending_move = (dx, dy)
+        else:
+            pending_dx, pending_dy = self._pending_move
+            self._pending_move = (pending_dx + dx, pending_dy + dy)
+
+
+    def _rotate_item(self):
+
+        if not self._defer():
+            self._show_rotation()
+            return
+        self._pending_rotation = True
+
+
+    def _show_rotation(self):
+        """
+        Update the canvas item to the Sprite's current angle.
+        """
+
+
+    def _apply_deferred(self):
+
+        move = self._pending_move
+        rotation = self._pending_rotation
+        self._deferred = False
+        self._pending_move = None
+        self._pending_rotation = False
+        self._apply_changes(move, rotation)
+
+
+    def _apply_changes(self, move, rotation):
+        """
+        Apply the accumulated `move`, a (dx, dy) tuple, if not None, and show
+        the current angle, if `rotation` is true. Sub-classes may fuse both in
+        a single canvas item change.
+        """
+        if move is not None:
+            self._canvas.move(self._id, *move)
+        if rotation:
+            self._show_rotation()
+
+
+    # ------------------------------------------------------------------------
+    # Animation creation, shared by the async and start methods.
+
+    def _move_animation(self, dx, dy, *, speed, easing, callback, fps, update):
+
+        speed = self._m_speed if speed is None else speed
+        easing = self._m_easing if easing is None else easing
+        callback = self._m_callback if callback is None else callback
+        fps = self._fps if fps is None else fps
+
+        distance = (dx ** 2 + dy ** 2) ** 0.5
+        return _MoveAnimation(
+            self,
+            dx,
+            dy,
+            seconds=distance / speed,
+            easing=easing,
+            callback=callback,
+            fps=fps,
+            update=update,
+        )
+
+
+    def _move_to_animation(self, x, y, *, speed, easing, callback, fps, update):
+
+        speed = self._m_speed if speed is None else speed
+        easing = self._m_easing if easing is None else easing
+        callback = self._m_callback if callback is None else callback
+        fps = self._fps if fps is None else fps
+
+        return _MoveToAnimation(
+            self,
+            x,
+            y,
+            speed=speed,
+            easing=easing,
+            callback=callback,
+            fps=fps,
+            update=update,
+        )
+
+
+    def _forward_animation(self, delta, *, speed, easing, callback, fps, update):
+
+        speed = self._m_speed if speed is None else speed
+        easing = self._m_easing if easing is None else easing
+        callback = self._m_callback if callback is None else callback
+        fps = self._fps if fps is None else fps
+
+        return _ForwardAnimation(
+            self,
+            delta,
+            seconds=abs(delta) / speed,
+            easing=easing,
+            callback=callback,
+            fps=fps,
+            update=update,
+        )
+
+
+    def _rotate_animation(self, dangle, *, around, speed, easing, callback, fps,
+                          update):
+
+        speed = self._r_speed if speed is None else speed
+        easing = self._r_easing if easing is None else easing
+        callback = self._r_callback if callback is None else callback
+        fps = self._fps if fps is None else fps
+
+        return _RotateAnimation(
+            self,
+            dangle,
+            around=around,
+            seconds=abs(dangle / speed),
+            easing=easing,
+            callback=callback,
+            fps=fps,
+            update=update,
+        )
+
+
+    def _rotate_to_animation(self, angle, *, around, speed, easing, callback,
+                             fps, update):
+
+        speed = self._r_speed if speed is None else speed
+        easing = self._r_easing if easing is None else easing
+        callback = self._r_callback if callback is None else callback
+        fps = self._fps if fps is None else fps
+
+        return _RotateToAnimation(
+            self,
+            angle,
+            around=around,
+            speed=speed,
+            easing=easing,
+            callback=callback,
+            fps=fps,
+            update=update,
+        )
+
+
+    def _follow_path_animation(self, points, *, angles, around, speed, easing,
+                               callback, fps, update):
+
+        speed = self._m_speed if speed is None else speed
+        easing = self._m_easing if easing is None else easing
+        callback = self._m_callback if callback is None else callback
+        fps = self._fps if fps is None else fps
+
+        return _FollowPathAnimation(
+            self,
+            points,
+            angles=angles,
+            around=around,
+            speed=speed,
+            easing=easing,
+            callback=callback,
+            fps=fps,
+            update=update,
+        )
+
+
+    @contextlib.contextmanager
+    def _follow_path_context(self, angles):
+
+        rotation = self._rotation.absolute() if angles is not None else contextlib.nullcontext()
+        with self._movement.absolute(), rotation:
+            yield
+
+
     # ------------------------------------------------------------------------
     # Async animated movement and rotation methods.
 
@@ -265,31 +827,16 @@ class Sprite:
         ride the init-time values.
         """
         with self._movement.relative(), contextlib.suppress(asyncio.CancelledError):
-
-            speed = self._m_speed if speed is None else speed
-            easing = self._m_easing if easing is None else easing
-            callback = self._m_callback if callback is None else callback
-            fps = self._fps if fps is None else fps
-
-            distance = (dx ** 2 + dy ** 2) ** 0.5
-            total_seconds = distance / speed
-            # Fast speed / low fps lead to 0 total_frames. Have at least 1.
-            total_frames = max(int(total_seconds * fps), 1)
-            frame_seconds = 1 / fps
-
-            frame_dx = dx / total_frames
-            frame_dy = dy / total_frames
-
-            prev_eased_progress = 0
-            for frame in range(1, total_frames+1):
-                progress = frame / total_frames
-                eased_progress = easing(progress) if easing else progress
-                eased_delta = (eased_progress - prev_eased_progress) * total_frames
-                self.direct_move(frame_dx * eased_delta, frame_dy * eased_delta, update=update)
-                if callback:
-                    await callback(eased_progress, self._anchor)
-                await asyncio.sleep(frame_seconds)
-                prev_eased_progress = eased_progress
+            animation = self._move_animation(
+                dx,
+                dy,
+                speed=speed,
+                easing=easing,
+                callback=callback,
+                fps=fps,
+                update=update,
+            )
+            await self._scheduler.async_run(animation)
 
 
     async def async_move_to(self, x, y, *, speed=None, easing=None, callback=None,
@@ -301,31 +848,16 @@ class Sprite:
         ride the init-time values.
         """
         with self._movement.absolute(), contextlib.suppress(asyncio.CancelledError):
-
-            speed = self._m_speed if speed is None else speed
-            easing = self._m_easing if easing is None else easing
-            callback = self._m_callback if callback is None else callback
-            fps = self._fps if fps is None else fps
-
-            start_x, start_y = self._anchor
-            dx = x - start_x
-            dy = y - start_y
-
-            distance = (dx ** 2 + dy ** 2) ** 0.5
-            total_seconds = distance / speed
-            # Fast speed / low fps lead to 0 total_frames. Have at least 1.
-            total_frames = max(int(total_seconds * fps), 1)
-            frame_seconds = 1 / fps
-
-            for frame in range(1, total_frames+1):
-                progress = frame / total_frames
-                eased_progress = easing(progress) if easing else progress
-                frame_x = start_x + dx * eased_progress
-                frame_y = start_y + dy * eased_progress
-                self.direct_move_to(frame_x, frame_y, update=update)
-                if callback:
-                    await callback(eased_progress, self._anchor)
-                await asyncio.sleep(frame_seconds)
+            animation = self._move_to_animation(
+                x,
+                y,
+                speed=speed,
+                easing=easing,
+                callback=callback,
+                fps=fps,
+                update=update,
+            )
+            await self._scheduler.async_run(animation)
 
 
     async def async_forward(self, delta, *, track_angle=True, speed=None,
@@ -357,33 +889,15 @@ class Sprite:
             return
 
         with self._movement.relative(), contextlib.suppress(asyncio.CancelledError):
-
-            speed = self._m_speed if speed is None else speed
-            easing = self._m_easing if easing is None else easing
-            callback = self._m_callback if callback is None else callback
-            fps = self._fps if fps is None else fps
-
-            distance = abs(delta)
-            total_seconds = distance / speed
-            # Fast speed / low fps lead to 0 total_frames. Have at least 1.
-            total_frames = max(int(total_seconds * fps), 1)
-            frame_seconds = 1 / fps
-
-            prev_eased_progress = 0
-            for frame in range(1, total_frames+1):
-                angle_rad = self._angle * math.pi / 180.0
-                frame_dx = delta * math.cos(angle_rad) / total_frames
-                frame_dy = delta * math.sin(angle_rad) / total_frames
-
-                progress = frame / total_frames
-                eased_progress = easing(progress) if easing else progress
-                eased_delta = (eased_progress - prev_eased_progress) * total_frames
-
-                self.direct_move(frame_dx * eased_delta, frame_dy * eased_delta, update=update)
-                if callback:
-                    await callback(eased_progress, self._anchor)
-                await asyncio.sleep(frame_seconds)
-                prev_eased_progress = eased_progress
+            animation = self._forward_animation(
+                delta,
+                speed=speed,
+                easing=easing,
+                callback=callback,
+                fps=fps,
+                update=update,
+            )
+            await self._scheduler.async_run(animation)
 
 
     async def async_rotate(self, dangle, *, around=None, speed=None, easing=None,
@@ -397,29 +911,16 @@ class Sprite:
         ride the init-time values.
         """
         with self._rotation.relative(), contextlib.suppress(asyncio.CancelledError):
-
-            speed = self._r_speed if speed is None else speed
-            easing = self._r_easing if easing is None else easing
-            callback = self._r_callback if callback is None else callback
-            fps = self._fps if fps is None else fps
-
-            total_seconds = abs(dangle / speed)
-            # Fast speed / low fps lead to 0 total_frames. Have at least 1.
-            total_frames = max(int(total_seconds * fps), 1)
-            frame_seconds = 1 / fps
-
-            frame_dangle = dangle / total_frames
-
-            prev_eased_progress = 0
-            for frame in range(1, total_frames+1):
-                progress = frame / total_frames
-                eased_progress = easing(progress) if easing else progress
-                eased_delta = (eased_progress - prev_eased_progress) * total_frames
-                self.direct_rotate(frame_dangle * eased_delta, around=around, update=update)
-                if callback:
-                    await callback(eased_progress, self._angle)
-                await asyncio.sleep(frame_seconds)
-                prev_eased_progress = eased_progress
+            animation = self._rotate_animation(
+                dangle,
+                around=around,
+                speed=speed,
+                easing=easing,
+                callback=callback,
+                fps=fps,
+                update=update,
+            )
+            await self._scheduler.async_run(animation)
 
 
     async def async_rotate_to(self, angle, *, around=None, speed=None, easing=None,
@@ -434,30 +935,193 @@ class Sprite:
         ride the init-time values.
         """
         with self._rotation.absolute(), contextlib.suppress(asyncio.CancelledError):
+            animation = self._rotate_to_animation(
+                angle,
+                around=around,
+                speed=speed,
+                easing=easing,
+                callback=callback,
+                fps=fps,
+                update=update,
+            )
+            await self._scheduler.async_run(animation)
 
-            speed = self._r_speed if speed is None else speed
-            easing = self._r_easing if easing is None else easing
-            callback = self._r_callback if callback is None else callback
-            fps = self._fps if fps is None else fps
 
-            start_angle = self._angle
-            dangle = (angle - start_angle) % 360
-            if dangle > 180:
-                dangle = dangle - 360
+    async def async_follow_path(self, points, *, angles=None, around=None,
+                                speed=None, easing=None, callback=None,
+                                fps=None, update=None):
+        """
+        Animated move of the Sprite along the path from its anchor through the
+        (x, y) `points`, at constant speed, as a single animation: `easing`
+        applies to the whole path.
 
-            total_seconds = abs(dangle / speed)
-            # Fast speed / low fps lead to 0 total_frames. Have at least 1.
-            total_frames = max(int(total_seconds * fps), 1)
-            frame_seconds = 1 / fps
+        If `angles` is not None, it should have one angle per point: the
+        Sprite rotates to each of them as it moves towards the corresponding
+        point, taking the shortest path, around `around`, as in `rotate_to`.
 
-            for frame in range(1, total_frames+1):
-                progress = frame / total_frames
-                eased_progress = easing(progress) if easing else progress
-                frame_angle = start_angle + dangle * eased_progress
-                self.direct_rotate_to(frame_angle, around=around, update=update)
-                if callback:
-                    await callback(eased_progress, self._angle)
-                await asyncio.sleep(frame_seconds)
+        The callback, if any, is called with the eased progress and a list of
+        the path points passed through since the previous frame, ending with
+        the Sprite's anchor.
+
+        The `speed`, `easing`, `callback`, `fps`, and `update` arguments over-
+        ride the init-time values.
+        """
+        with self._follow_path_context(angles), contextlib.suppress(asyncio.CancelledError):
+            animation = self._follow_path_animation(
+                points,
+                angles=angles,
+                around=around,
+                speed=speed,
+                easing=easing,
+                callback=callback,
+                fps=fps,
+                update=update,
+            )
+            await self._scheduler.async_run(animation)
+
+
+    # ------------------------------------------------------------------------
+    # Started animated movement and rotation methods.
+    #
+    # Like the async ones, but added to the frame scheduler right away, and
+    # returning an AnimationHandle to control them while running. Require a
+    # running event loop.
+
+    def _start(self, context, create_animation, *args, **kwargs):
+
+        # Concurrency is checked right away: the `context` is held until the
+        # animation's future is done.
+
+        with contextlib.ExitStack() as stack:
+            stack.enter_context(context)
+            animation = create_animation(*args, **kwargs)
+            future = self._scheduler.add(animation)
+            release = stack.pop_all().close
+        future.add_done_callback(lambda _future: release())
+        return AnimationHandle(self._scheduler, animation, future)
+
+
+    def start_move(self, dx, dy, *, speed=None, easing=None, callback=None,
+                   fps=None, update=None):
+        """
+        Starts an animated move, as in `async_move`, returning its handle.
+        """
+        return self._start(
+            self._movement.relative(),
+            self._move_animation,
+            dx,
+            dy,
+            speed=speed,
+            easing=easing,
+            callback=callback,
+            fps=fps,
+            update=update,
+        )
+
+
+    def start_move_to(self, x, y, *, speed=None, easing=None, callback=None,
+                      fps=None, update=None):
+        """
+        Starts an animated move, as in `async_move_to`, returning its handle,
+        which supports retargeting to another (x, y) position.
+        """
+        return self._start(
+            self._movement.absolute(),
+            self._move_to_animation,
+            x,
+            y,
+            speed=speed,
+            easing=easing,
+            callback=callback,
+            fps=fps,
+            update=update,
+        )
+
+
+    def start_forward(self, delta, *, track_angle=True, speed=None, easing=None,
+                      callback=None, fps=None, update=None):
+        """
+        Starts an animated move, as in `async_forward`, returning its handle.
+        """
+        if not track_angle:
+            angle_rad = self._angle * math.pi / 180.0
+            return self.start_move(
+                delta * math.cos(angle_rad),
+                delta * math.sin(angle_rad),
+                speed=speed,
+                easing=easing,
+                callback=callback,
+                fps=fps,
+                update=update,
+            )
+        return self._start(
+            self._movement.relative(),
+            self._forward_animation,
+            delta,
+            speed=speed,
+            easing=easing,
+            callback=callback,
+            fps=fps,
+            update=update,
+        )
+
+
+    def start_rotate(self, dangle, *, around=None, speed=None, easing=None,
+                     callback=None, fps=None, update=None):
+        """
+        Starts an animated rotation, as in `async_rotate`, returning its
+        handle.
+        """
+        return self._start(
+            self._rotation.relative(),
+            self._rotate_animation,
+            dangle,
+            around=around,
+            speed=speed,
+            easing=easing,
+            callback=callback,
+            fps=fps,
+            update=update,
+        )
+
+
+    def start_rotate_to(self, angle, *, around=None, speed=None, easing=None,
+                        callback=None, fps=None, update=None):
+        """
+        Starts an animated rotation, as in `async_rotate_to`, returning its
+        handle, which supports retargeting to another angle.
+        """
+        return self._start(
+            self._rotation.absolute(),
+            self._rotate_to_animation,
+            angle,
+            around=around,
+            speed=speed,
+            easing=easing,
+            callback=callback,
+            fps=fps,
+            update=update,
+        )
+
+
+    def start_follow_path(self, points, *, angles=None, around=None, speed=None,
+                          easing=None, callback=None, fps=None, update=None):
+        """
+        Starts an animated move, as in `async_follow_path`, returning its
+        handle.
+        """
+        return self._start(
+            self._follow_path_context(angles),
+            self._follow_path_animation,
+            points,
+            angles=angles,
+            around=around,
+            speed=speed,
+            easing=easing,
+            callback=callback,
+            fps=fps,
+            update=update,
+        )
 
 
     # ------------------------------------------------------------------------
@@ -479,6 +1143,7 @@ class Sprite:
     sync_forward = syncer.create_sync_func(async_forward, name_mapper)
     sync_rotate = syncer.create_sync_func(async_rotate, name_mapper)
     sync_rotate_to = syncer.create_sync_func(async_rotate_to, name_mapper)
+    sync_follow_path = syncer.create_sync_func(async_follow_path, name_mapper)
 
     del name_mapper
 
@@ -490,9 +1155,12 @@ class Sprite:
         Update the output canvas depending on `update` and its init-time value.
         Updates if `update` is true, or if it is None and the init-time update
         value is true. Otherwise no update happens.
+
+        Updates are coalesced by the canvas' frame scheduler, such that at
+        most one happens per animation frame or event loop iteration.
         """
         if update or (update is None and self._update):
-            self._canvas.update()
+            self._scheduler.request_update()
 
 
     def delete(self):
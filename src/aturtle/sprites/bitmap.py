@@ -31,12 +31,7 @@ class Sprite(base.Sprite):
         )
 
 
-    def direct_rotate(self, angle, *, around=None, update=None):
-
-        # Rotate anchor point and update angle.
-        super().direct_rotate(angle, around=around, update=False)
+    def _show_rotation(self):
 
         # Use the pre-rendered shape for the new orientation.
         self._canvas.itemconfig(self._id, image=self._shape[self._angle])
-
-        self.update(update=update)
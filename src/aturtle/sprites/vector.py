@@ -47,12 +47,16 @@ class Sprite(base.Sprite):
         return self._offset_shape_coords(self._angle)
 
 
-    def direct_rotate(self, angle, *, around=None, update=None):
-
-        # Rotate anchor point and update angle.
-        super().direct_rotate(angle, around=around, update=False)
+    def _show_rotation(self):
 
         # Use the shape for the new orientation.
         self._canvas.coords(self._id, self._offset_shape_coords(self._angle))
 
-        self.update(update=update)
+
+    def _apply_changes(self, move, rotation):
+
+        # Rewriting coordinates for the rotation also accounts for the move.
+        if rotation:
+            self._show_rotation()
+        else:
+            super()._apply_changes(move, rotation)
@@ -6,13 +6,112 @@
 # ----------------------------------------------------------------------------
 
 import contextlib
+import functools
+import itertools
+import math
 
+from . import canvas as _canvas
+from . utils import polyline
 from . utils import syncer
 
 
 
 _LINE_COLOR = '#cccccc'
 _LINE_WIDTH = 3
+_LINE_TOLERANCE = 0.5
+
+# Lines are drawn in chunks of, at most, this many points: each a canvas item.
+
+_LINE_CHUNK_POINTS = 64
+
+# Tolerance absorbing floating point errors in position comparisons.
+
+_EPSILON = 1e-6
+
+# Numbers for unique per-Turtle canvas tags.
+
+_TAG_NUMBERS = itertools.count(1)
+
+
+
+@functools.lru_cache(maxsize=128)
+def _arc_chords(radius, extent, steps):
+
+    # Chord vertices of an arc of `extent` degrees and `radius`, in `steps`,
+    # relative to a Turtle at (0, 0), with a 0 angle: a tuple of (x, y, angle)
+    # tuples, where `angle` is the Turtle's rotation at that vertex.
+    # Positive radii place the center to the left, rotating counterclockwise.
+
+    sign = 1 if radius >= 0 else -1
+    chords = []
+    for step in range(1, steps + 1):
+        angle = sign * extent * step / steps
+        theta = angle * math.pi / 180.0
+        chords.append((radius * math.sin(theta), radius * (1 - math.cos(theta)), angle))
+    return tuple(chords)
+
+
+def _arc_steps(radius, extent):
+
+    # Default number of arc steps: more for larger radii and extents.
+
+    return 1 + int(min(11 + abs(radius) / 6.0, 59.0) * abs(extent) / 360)
+
+
+
+class _InstantGeometry:
+
+    # Tracks the Turtle's pose and pending lines, while in instant mode.
+
+    def __init__(self, anchor, angle):
+
+        self.anchor = anchor
+        self.angle = angle
+
+        # (polyline.Simplifier, line color, line width) tuples.
+        self.lines = []
+        self._line = None
+
+
+    def move_to(self, x, y, *, down, line_color, line_width, line_tolerance):
+
+        if not down:
+            self._line = None
+        else:
+            if self._line is None or self._line[1:] != (line_color, line_width):
+                # Pen down, or style change: start a new line.
+                simplifier = polyline.Simplifier(*self.anchor, tolerance=line_tolerance)
+                self._line = (simplifier, line_color, line_width)
+                self.lines.append(self._line)
+            simplifier, _line_color, _line_width = self._line
+            simplifier.add(x, y)
+        self.anchor = (x, y)
+
+
+    def take_lines(self):
+
+        # Returns pending lines: subsequent moves start new ones.
+
+        lines = self.lines
+        self.lines = []
+        self._line = None
+        return lines
+
+
+    def forward(self, delta, **kwargs):
+
+        angle_rad = self.angle * math.pi / 180.0
+        x, y = self.anchor
+        self.move_to(
+            x + delta * math.cos(angle_rad),
+            y + delta * math.sin(angle_rad),
+            **kwargs,
+        )
+
+
+    def rotate(self, angle):
+
+        self.angle = (self.angle + angle) % 360
 
 
 
@@ -23,7 +122,8 @@ class Turtle:
     """
 
     def __init__(self, sprite, *, down=True, line_color=_LINE_COLOR,
-                 line_width=_LINE_WIDTH):
+                 line_width=_LINE_WIDTH, line_tolerance=_LINE_TOLERANCE,
+                 paint_layer=None):
         """
         Initialize Turtle to be visually represented with the given `sprite`.
 
@@ -31,25 +131,61 @@ class Turtle:
         canvas, following its movement. No lines are drawn otherwise.
 
         Lines are drawn in the given `line_color` and `line_width`.
+
+        Lines are simplified as they are drawn, merging points that are within
+        `line_tolerance` pixels of a straight segment. Zero disables it.
+
+        If `paint_layer` is not None, it should be an aturtle.paint.PaintLayer
+        on the `sprite`'s canvas: finished lines are added to it, such that
+        they are eventually flattened into its image. Layers are cleared along
+        with the Turtle and cannot be shared: each Turtle claims its own.
+
+        All lines are tagged with the Turtle's unique `tag`.
         """
 
         self._canvas = sprite.canvas
         self._sprite = sprite
+        self._home = (sprite.anchor, sprite.angle)
+        self._tag = f'turtle-{next(_TAG_NUMBERS)}'
 
         self.down = down
         self.line_color = line_color
         self.line_width = line_width
+        self.line_tolerance = line_tolerance
+        self.paint_layer = paint_layer
+        if paint_layer is not None:
+            paint_layer.claim(self)
 
         self._line_id = None
-        self._line_coords = None
+        self._line = None
+        self._line_style = None
         self._lines = []
 
+        # Ids of cleared, hidden, line items, reused by subsequent lines.
+        self._free_line_ids = []
+
+        # Not None while in instant mode.
+        self._instant = None
+
+        # While true, movements continue the current line, if possible.
+        self._join_lines = False
+
+
+    @property
+    def tag(self):
+        """
+        The canvas tag on all line items drawn by the Turtle.
+        """
+        return self._tag
+
 
     @property
     def anchor(self):
         """
         The turtle's anchor position in the canvas, as an (x, y) tuple.
         """
+        if self._instant is not None:
+            return self._instant.anchor
         return self._sprite.anchor
 
 
@@ -58,9 +194,174 @@ class Turtle:
         """
         The turtle's rotation angle, in degrees.
         """
+        if self._instant is not None:
+            return self._instant.angle
         return self._sprite.angle
 
 
+    @contextlib.contextmanager
+    def instant(self):
+        """
+        Context manager in which the Turtle's movement and rotation methods,
+        both async and sync, take no time: they only track the Turtle's pose
+        and the lines to be drawn, not changing the canvas.
+
+        On exit, tracked lines are drawn in as few canvas operations as
+        possible, and the sprite is moved and rotated to the final pose. Use
+        `flush` to do so without exiting.
+        """
+        if self._instant is not None:
+            # Nested: the outermost one flushes.
+            yield
+            return
+
+        self._instant = _InstantGeometry(self.anchor, self.angle)
+        try:
+            yield
+        finally:
+            self.flush()
+            self._instant = None
+
+
+    def flush(self):
+        """
+        Draws the lines tracked in instant mode, and moves and rotates the
+        sprite to the tracked pose. Does nothing if not in instant mode.
+        """
+        geometry = self._instant
+        if geometry is None:
+            return
+
+        lines = [
+            (simplifier.coords, line_color, line_width)
+            for simplifier, line_color, line_width in geometry.take_lines()
+        ]
+        with self._canvas_batch():
+            self._create_lines(lines)
+            self._sprite.direct_move_to(*geometry.anchor)
+            self._sprite.direct_rotate_to(geometry.angle)
+
+
+    def draw_lines(self, lines, *, update=None):
+        """
+        Draws the given `lines`, each a flat [x0, y0, x1, y1, ...] sequence of
+        canvas coordinates, as line items in the current line color and
+        width, behind the sprite, in as few canvas operations as possible.
+
+        Unlike movements, the Turtle's position and angle are left unchanged.
+
+        The `update` value is passed to the underlying Sprite's update.
+        """
+        style = (self.line_color, self.line_width)
+        with self._canvas_batch():
+            self._create_lines((coords, *style) for coords in lines)
+        self._sprite.update(update)
+
+
+    def _canvas_batch(self):
+
+        # Canvas mutations are batched, if the canvas supports it.
+
+        return _canvas.batch(self._canvas)
+
+
+    def _create_lines(self, lines):
+
+        # Creates line items from (coords, line color, line width) tuples.
+
+        line_id = None
+        for coords, line_color, line_width in lines:
+            line_id = self._create_line(coords, line_color, line_width)
+            if self.paint_layer is not None:
+                self.paint_layer.add_line(
+                    line_id,
+                    coords,
+                    fill=line_color,
+                    width=line_width,
+                )
+            else:
+                self._lines.append(line_id)
+        if line_id is not None:
+            # Lines were created in order: in front of the last is enough.
+            self._sprite.to_front(of=line_id)
+
+
+    def _create_line(self, coords, line_color, line_width):
+
+        # Returns a new line item id: a cleared one, if available.
+
+        canvas = self._canvas
+        if not self._free_line_ids:
+            return canvas.create_line(
+                coords,
+                fill=line_color,
+                width=line_width,
+                capstyle='round',
+                tags=self._tag,
+            )
+
+        line_id = self._free_line_ids.pop()
+        canvas.coords(line_id, coords)
+        canvas.itemconfig(line_id, fill=line_color, width=line_width, state='normal')
+        # In front of other lines, like a newly created one.
+        canvas.tag_raise(line_id)
+        return line_id
+
+
+    def clear(self):
+        """
+        Removes all lines drawn by the Turtle from the canvas, with a single
+        canvas operation, leaving its position and angle unchanged. The
+        Turtle's paint layer, if any, is cleared as well.
+
+        Line items are hidden, not deleted, and reused by subsequent lines.
+        """
+        if self._instant is not None:
+            self._instant.take_lines()
+        self._canvas.itemconfig(self._tag, state='hidden')
+        self._free_line_ids.extend(self._lines)
+        self._forget_lines()
+
+
+    def reset(self):
+        """
+        Deletes all line items drawn by the Turtle, with a single canvas
+        operation, and moves and rotates it back to its initial position and
+        angle. The Turtle's paint layer, if any, is cleared as well.
+        """
+        anchor, angle = self._home
+        if self._instant is not None:
+            self._instant.take_lines()
+            self._instant.anchor = anchor
+            self._instant.angle = angle
+        self._canvas.delete(self._tag)
+        self._free_line_ids.clear()
+        self._forget_lines()
+        self._sprite.direct_move_to(*anchor)
+        self._sprite.direct_rotate_to(angle)
+
+
+    def _forget_lines(self):
+
+        self._lines.clear()
+        if self.paint_layer is not None:
+            self.paint_layer.clear()
+        self._line_id = None
+        self._line = polyline.Simplifier(*self._sprite.anchor, tolerance=self.line_tolerance)
+
+
+    def _instant_kwargs(self, down):
+
+        # Keyword arguments for instant mode geometry tracking moves.
+
+        return dict(
+            down=self.down if down is None else down,
+            line_color=self.line_color,
+            line_width=self.line_width,
+            line_tolerance=self.line_tolerance,
+        )
+
+
     @contextlib.contextmanager
     def _down_override(self, down):
 
@@ -74,24 +375,98 @@ class Turtle:
             self.down = save_down
 
 
-    async def _async_draw_line(self, _progress, anchor):
-        """
-        Sprite movement callback to handle line drawing.
-        """
-        self._line_coords.extend(anchor)
+    def _new_line(self, x, y):
+
+        # Following line drawing starts a new line at (x, y).
+
+        if self._line_id and self.paint_layer is not None:
+            # The current line is finished: hand it over to the paint layer.
+            line_color, line_width = self._line_style
+            self._lines.remove(self._line_id)
+            self.paint_layer.add_line(
+                self._line_id,
+                self._line.coords,
+                fill=line_color,
+                width=line_width,
+            )
+        self._line_id = None
+        self._line = polyline.Simplifier(x, y, tolerance=self.line_tolerance)
+
+
+    def _start_line(self):
+
+        # Movement drawing starts a new line, unless joining lines and the
+        # current one ends at the sprite's position, with the current style.
+
+        x, y = self._sprite.anchor
+        if self._join_lines and self._line_id:
+            end_x, end_y = self._line.coords[-2:]
+            same_style = self._line_style == (self.line_color, self.line_width)
+            if same_style and math.hypot(x - end_x, y - end_y) <= _EPSILON:
+                return
+        self._new_line(x, y)
+
+
+    @contextlib.contextmanager
+    def _joining_lines(self):
+
+        save_join_lines = self._join_lines
+        self._join_lines = True
+        try:
+            yield
+        finally:
+            self._join_lines = save_join_lines
+
+
+    def _draw_points(self, points):
+
+        # Extends the current line through `points`. Long lines are split in
+        # chunks, each a separate canvas line item, such that the per-frame
+        # cost of updating the current chunk is bounded.
+
+        pending = False
+        for x, y in points:
+            if len(self._line.coords) >= _LINE_CHUNK_POINTS * 2:
+                # Current chunk is full: the next one starts at its last point.
+                if pending:
+                    self._flush_line()
+                self._new_line(*self._line.coords[-2:])
+            self._line.add(x, y)
+            pending = True
+        self._flush_line()
+
+
+    def _flush_line(self):
+
+        # Updates the current line's canvas item, creating it, if needed.
+
         if self._line_id:
-            self._canvas.coords(self._line_id, self._line_coords)
+            self._canvas.coords(self._line_id, self._line.coords)
         else:
-            self._line_id = self._canvas.create_line(
-                self._line_coords,
-                fill=self.line_color,
-                width=self.line_width,
-                capstyle='round',
+            self._line_id = self._create_line(
+                self._line.coords,
+                self.line_color,
+                self.line_width,
             )
+            self._line_style = (self.line_color, self.line_width)
             self._sprite.to_front(of=self._line_id)
             self._lines.append(self._line_id)
 
 
+    async def _async_draw_line(self, _progress, anchor):
+        """
+        Sprite movement callback to handle line drawing.
+        """
+        self._draw_points((anchor,))
+
+
+    async def _async_draw_path(self, _progress, points):
+        """
+        Sprite path following callback to handle line drawing.
+        """
+        self._draw_points(points)
+
+
     async def async_forward(self, delta, *, down=None, track_angle=True,
                             speed=None, easing=None, fps=None, update=None):
         """
@@ -107,8 +482,11 @@ class Turtle:
         The `speed`, `easing`, `fps`, and `update` values are passed to the
         underlying Sprite's animated movement operation.
         """
-        self._line_id = None
-        self._line_coords = list(self._sprite.anchor)
+        if self._instant is not None:
+            self._instant.forward(delta, **self._instant_kwargs(down))
+            return
+
+        self._start_line()
         with self._down_override(down):
             await self._sprite.async_forward(
                 delta,
@@ -131,8 +509,12 @@ class Turtle:
         The `speed`, `easing`, `fps`, and `update` values are passed to
         the underlying Sprite's animated movement operation.
         """
-        self._line_id = None
-        self._line_coords = list(self._sprite.anchor)
+        if self._instant is not None:
+            x, y = self._instant.anchor
+            self._instant.move_to(x + dx, y + dy, **self._instant_kwargs(down))
+            return
+
+        self._start_line()
         with self._down_override(down):
             await self._sprite.async_move(
                 dx, dy,
@@ -154,8 +536,11 @@ class Turtle:
         The `speed`, `easing`, `fps`, and `update` values are passed to
         the underlying Sprite's animated movement operation.
         """
-        self._line_id = None
-        self._line_coords = list(self._sprite.anchor)
+        if self._instant is not None:
+            self._instant.move_to(x, y, **self._instant_kwargs(down))
+            return
+
+        self._start_line()
         with self._down_override(down):
             await self._sprite.async_move_to(
                 x, y,
@@ -167,6 +552,95 @@ class Turtle:
             )
 
 
+    async def async_path(self, points, *, down=None, speed=None, easing=None,
+                         fps=None, update=None):
+        """
+        Animated move of the Turtle along the path through the given (x, y)
+        `points`, as a single animation, drawing a single line.
+
+        The `down` argument overrides the current down state, if not None.
+
+        The `speed`, `easing`, `fps`, and `update` values are passed to
+        the underlying Sprite's animated path following operation.
+        """
+        if self._instant is not None:
+            kwargs = self._instant_kwargs(down)
+            for x, y in points:
+                self._instant.move_to(x, y, **kwargs)
+            return
+
+        self._start_line()
+        with self._down_override(down):
+            await self._sprite.async_follow_path(
+                points,
+                callback=self._async_draw_path if self.down else None,
+                speed=speed,
+                easing=easing,
+                fps=fps,
+                update=update,
+            )
+
+
+    def _arc_path(self, radius, extent, steps):
+
+        # Absolute (x, y) points and angles along the arc, from the Turtle's
+        # current position and angle.
+
+        if steps is None:
+            steps = _arc_steps(radius, extent)
+        x0, y0 = self.anchor
+        angle0 = self.angle
+        angle0_rad = angle0 * math.pi / 180.0
+        cos = math.cos(angle0_rad)
+        sin = math.sin(angle0_rad)
+
+        points = []
+        angles = []
+        for x, y, angle in _arc_chords(radius, extent, steps):
+            points.append((x0 + x * cos - y * sin, y0 + x * sin + y * cos))
+            angles.append(angle0 + angle)
+        return points, angles
+
+
+    async def async_circle(self, radius, extent=360, steps=None, *, down=None,
+                           speed=None, easing=None, fps=None, update=None):
+        """
+        Animated move of the Turtle along an arc of `extent` degrees, a full
+        circle by default, with the given `radius`, rotating as it goes.
+
+        The center is `radius` units to the left of the Turtle: positive radii
+        draw counterclockwise, negative ones clockwise. The arc is drawn as
+        `steps` chords, a radius dependent amount if None, in a single
+        animation, drawing a single line.
+
+        The `down` argument overrides the current down state, if not None.
+
+        The `speed`, `easing`, `fps`, and `update` values are passed to
+        the underlying Sprite's animated path following operation.
+        """
+        points, angles = self._arc_path(radius, extent, steps)
+
+        if self._instant is not None:
+            kwargs = self._instant_kwargs(down)
+            for x, y in points:
+                self._instant.move_to(x, y, **kwargs)
+            if angles:
+                self._instant.rotate(angles[-1] - self._instant.angle)
+            return
+
+        self._start_line()
+        with self._down_override(down):
+            await self._sprite.async_follow_path(
+                points,
+                angles=angles,
+                callback=self._async_draw_path if self.down else None,
+                speed=speed,
+                easing=easing,
+                fps=fps,
+                update=update,
+            )
+
+
     async def async_left(self, angle, *, speed=None, easing=None, fps=None,
                          update=None):
         """
@@ -175,6 +649,10 @@ class Turtle:
         The `speed`, `easing`, `fps`, and `update` values are passed to the
         underlying Sprite's animated movement operation.
         """
+        if self._instant is not None:
+            self._instant.rotate(angle)
+            return
+
         await self._sprite.async_rotate(
             angle,
             speed=speed,
@@ -192,6 +670,10 @@ class Turtle:
         The `speed`, `easing`, `fps`, and `update` values are passed to the
         underlying Sprite's animated movement operation.
         """
+        if self._instant is not None:
+            self._instant.rotate(-angle)
+            return
+
         await self._sprite.async_rotate(
             -angle,
             speed=speed,
@@ -219,10 +701,248 @@ class Turtle:
         return name
 
     _sync_draw_line = syncer.create_sync_func(_async_draw_line, name_mapper)
+    _sync_draw_path = syncer.create_sync_func(_async_draw_path, name_mapper)
     sync_forward = syncer.create_sync_func(async_forward, name_mapper)
     sync_move = syncer.create_sync_func(async_move, name_mapper)
     sync_move_to = syncer.create_sync_func(async_move_to, name_mapper)
+    sync_path = syncer.create_sync_func(async_path, name_mapper)
+    sync_circle = syncer.create_sync_func(async_circle, name_mapper)
     sync_left = syncer.create_sync_func(async_left, name_mapper)
     sync_right = syncer.create_sync_func(async_right, name_mapper)
 
     del name_mapper
+
+
+
+class _Command:
+
+    # A buffered CommandQueue command: `name` is a Turtle method name suffix.
+
+    __slots__ = ('name', 'args', 'kwargs', 'style')
+
+    def __init__(self, name, args, kwargs, style):
+
+        self.name = name
+        self.args = args
+        self.kwargs = kwargs
+        self.style = style
+
+
+    def merge(self, other):
+
+        # Merges the `other` command, that follows this one, into it. Returns
+        # True if done, such that running this command alone is equivalent to
+        # running both; returns False otherwise, leaving this one unchanged.
+
+        if other.name != self.name or other.kwargs != self.kwargs:
+            return False
+
+        if self.name == 'rotate':
+            self.args[0] += other.args[0]
+            return True
+
+        if other.style != self.style:
+            return False
+
+        # With the pen down, drawn paths must not change: merged movements
+        # must go in the same direction. With the pen up, only the final
+        # position matters.
+        down = self.kwargs['down']
+
+        if self.name == 'forward':
+            # No rotation in between: same heading.
+            delta = self.args[0]
+            other_delta = other.args[0]
+            if down and delta * other_delta < 0:
+                return False
+            self.args[0] = delta + other_delta
+            return True
+
+        if self.name == 'move':
+            dx, dy = self.args
+            other_dx, other_dy = other.args
+            cross = dx * other_dy - dy * other_dx
+            dot = dx * other_dx + dy * other_dy
+            if down and (abs(cross) > _EPSILON or dot < 0):
+                return False
+            self.args[:] = (dx + other_dx, dy + other_dy)
+            return True
+
+        if self.name == 'move_to' and not down:
+            self.args[:] = other.args
+            return True
+
+        return False
+
+
+    def is_noop(self):
+
+        if self.name in ('move_to', 'path', 'circle'):
+            return False
+        return not any(self.args)
+
+
+
+class CommandQueue:
+    """
+    Buffers movement, path, arc and rotation commands for a Turtle,
+    optimizing them before they run.
+
+    Consecutive forward movements are fused into one, as are consecutive
+    rotations, with opposing ones cancelling out. When run, consecutive pen
+    down movements draw a single line item, instead of one per movement.
+
+    The pen state, line color and line width are captured when commands are
+    buffered: later changes to the Turtle's settings do not affect them.
+    """
+
+    def __init__(self, turtle):
+
+        self._turtle = turtle
+        self._commands = []
+
+
+    def __len__(self):
+
+        return len(self._commands)
+
+
+    def _add(self, name, args, **kwargs):
+
+        turtle = self._turtle
+        if 'down' in kwargs and kwargs['down'] is None:
+            kwargs['down'] = turtle.down
+        command = _Command(name, list(args), kwargs, (turtle.line_color, turtle.line_width))
+
+        commands = self._commands
+        if commands and commands[-1].merge(command):
+            if commands[-1].is_noop():
+                commands.pop()
+            return
+        if not command.is_noop():
+            commands.append(command)
+
+
+    def forward(self, delta, *, down=None, track_angle=True, speed=None,
+                easing=None, fps=None, update=None):
+        """
+        Buffers a Turtle forward movement. See Turtle.async_forward.
+        """
+        self._add(
+            'forward', (delta,),
+            down=down, track_angle=track_angle, speed=speed, easing=easing,
+            fps=fps, update=update,
+        )
+
+
+    def move(self, dx, dy, *, down=None, speed=None, easing=None, fps=None,
+             update=None):
+        """
+        Buffers a Turtle relative movement. See Turtle.async_move.
+        """
+        self._add(
+            'move', (dx, dy),
+            down=down, speed=speed, easing=easing, fps=fps, update=update,
+        )
+
+
+    def move_to(self, x, y, *, down=None, speed=None, easing=None, fps=None,
+                update=None):
+        """
+        Buffers a Turtle absolute movement. See Turtle.async_move_to.
+        """
+        self._add(
+            'move_to', (x, y),
+            down=down, speed=speed, easing=easing, fps=fps, update=update,
+        )
+
+
+    def path(self, points, *, down=None, speed=None, easing=None, fps=None,
+             update=None):
+        """
+        Buffers a Turtle path movement. See Turtle.async_path.
+        """
+        self._add(
+            'path', (list(points),),
+            down=down, speed=speed, easing=easing, fps=fps, update=update,
+        )
+
+
+    def circle(self, radius, extent=360, steps=None, *, down=None, speed=None,
+               easing=None, fps=None, update=None):
+        """
+        Buffers a Turtle arc movement. See Turtle.async_circle.
+        """
+        self._add(
+            'circle', (radius, extent, steps),
+            down=down, speed=speed, easing=easing, fps=fps, update=update,
+        )
+
+
+    def left(self, angle, *, speed=None, easing=None, fps=None, update=None):
+        """
+        Buffers a Turtle counterclockwise rotation. See Turtle.async_left.
+        """
+        self._add(
+            'rotate', (angle,),
+            speed=speed, easing=easing, fps=fps, update=update,
+        )
+
+
+    def right(self, angle, *, speed=None, easing=None, fps=None, update=None):
+        """
+        Buffers a Turtle clockwise rotation. See Turtle.async_right.
+        """
+        self.left(-angle, speed=speed, easing=easing, fps=fps, update=update)
+
+
+    def _take_commands(self):
+
+        # Buffered commands, with the Turtle style they were buffered with,
+        # emptying the queue.
+
+        commands = self._commands
+        self._commands = []
+        for command in commands:
+            self._turtle.line_color, self._turtle.line_width = command.style
+            yield command.name, command.args, command.kwargs
+
+
+    async def async_run(self):
+        """
+        Runs the buffered commands, emptying the queue. Commands buffered
+        while running are left in the queue.
+        """
+        turtle = self._turtle
+        save_style = (turtle.line_color, turtle.line_width)
+        try:
+            with turtle._joining_lines():
+                for name, args, kwargs in self._take_commands():
+                    if name == 'forward':
+                        await self._turtle.async_forward(*args, **kwargs)
+                    elif name == 'move':
+                        await self._turtle.async_move(*args, **kwargs)
+                    elif name == 'move_to':
+                        await self._turtle.async_move_to(*args, **kwargs)
+                    elif name == 'path':
+                        await self._turtle.async_path(*args, **kwargs)
+                    elif name == 'circle':
+                        await self._turtle.async_circle(*args, **kwargs)
+                    else:
+                        await self._turtle.async_left(*args, **kwargs)
+        finally:
+            turtle.line_color, turtle.line_width = save_style
+
+
+    # The synchronous version of `async_run` is automatically generated by
+    # the code in the `syncer` module, like the Turtle's sync methods.
+
+    def name_mapper(name):
+        # Only maps names starting with `async_`.
+        if name.startswith('async_'):
+            return name[1:]
+        return name
+
+    sync_run = syncer.create_sync_func(async_run, name_mapper)
+
+    del name_mapper
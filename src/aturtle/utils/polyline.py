@@ -0,0 +1,121 @@
+# ----------------------------------------------------------------------------
+# Python A-Turtle
+# ----------------------------------------------------------------------------
+# Copyright (c) Tiago Montes.
+# See LICENSE for details.
+# ----------------------------------------------------------------------------
+
+"""
+Polyline module.
+
+Online polyline simplification: points are merged into the last segment of
+a polyline as they are added, for as long as all the merged points are within
+a given distance of that segment.
+"""
+
+from array import array
+import math
+
+
+
+def _normalized(angle):
+
+    # The `angle`, in radians, normalized to the [-pi, pi) range.
+
+    return (angle + math.pi) % (2 * math.pi) - math.pi
+
+
+
+class Simplifier:
+    """
+    Builds a simplified polyline, in `coords`, from points added one at a
+    time, such that all added points are within `tolerance` of it.
+
+    The last point in `coords` is always the last added point. Previous ones
+    are vertices where the added points changed direction beyond `tolerance`.
+    Coordinates are stored in a compact, flat, array('d') buffer.
+
+    Uses a sleeve-fitting approach: each added point restricts the directions
+    the last segment, from its fixed start, can take to a cone. Points with
+    directions outside of the cone start a new segment.
+    """
+
+    def __init__(self, x, y, *, tolerance):
+
+        self._tolerance = tolerance
+        self.coords = array('d', (x, y))
+        self._restart(x, y)
+
+
+    def _restart(self, x, y):
+
+        # The last segment starts at (x, y), with no direction restrictions.
+
+        self._start = (x, y)
+        self._reference = None
+        self._cone = None
+        self._max_distance = 0
+
+
+    def add(self, x, y):
+        """
+        Adds the (x, y) point to the polyline.
+        """
+        if self._tolerance <= 0 or len(self.coords) == 2:
+            self._append(x, y)
+            return
+
+        if not self._fits(x, y):
+            # Last point becomes a fixed vertex, starting the next segment.
+            self._restart(*self.coords[-2:])
+            self._append(x, y)
+            return
+
+        # Point replaces the last one, extending the last segment.
+        coords = self.coords
+        coords[-2] = x
+        coords[-1] = y
+
+
+    def _append(self, x, y):
+
+        self.coords.extend((x, y))
+        self._fits(x, y)
+
+
+    def _fits(self, x, y):
+
+        # True if, with the segment ending at (x, y), all the points added
+        # since it started are within tolerance. Restricts the cone, if so.
+
+        tolerance = self._tolerance
+        start_x, start_y = self._start
+        dx = x - start_x
+        dy = y - start_y
+        distance = math.hypot(dx, dy)
+
+        if distance < self._max_distance:
+            # Moving back towards the start: farther points, beyond the
+            # segment's end, might not be within tolerance.
+            return False
+
+        if distance <= tolerance:
+            # Close to the start, any direction is fine, unless restricted.
+            return self._cone is None
+
+        direction = math.atan2(dy, dx)
+        if self._reference is None:
+            self._reference = direction
+        relative = _normalized(direction - self._reference)
+        spread = math.asin(tolerance / distance)
+
+        if self._cone is not None:
+            low, high = self._cone
+            if not low <= relative <= high:
+                return False
+            self._cone = (max(low, relative - spread), min(high, relative + spread))
+        else:
+            self._cone = (relative - spread, relative + spread)
+
+        self._max_distance = max(self._max_distance, distance)
+        return True
@@ -8,6 +8,7 @@
 import tkinter
 
 from . import canvas
+from . shapes import cache
 
 
 
@@ -283,12 +284,26 @@ class Window:
             raise RuntimeError('Must be last to close.')
 
         self._tk_window.destroy()
+        if is_root:
+            # Cached rotated images belong to the now destroyed Tk instance.
+            cache.tk_destroyed()
 
         Window._windows.remove(self)
         self.canvas = None
         self._tk_window = None
 
 
+    @classmethod
+    def tk_interpreter(cls):
+        """
+        Returns the Tk interpreter shared by all Windows, that of the first
+        created one, or None if there are no open Windows.
+        """
+        if not cls._windows:
+            return None
+        return cls._windows[0]._tk_window.tk
+
+
     @classmethod
     def close_all(cls, strict=True):
         """
@@ -303,6 +318,7 @@ class Window:
 
         root = cls._windows[0]._tk_window
         root.destroy()
+        cache.tk_destroyed()
 
         for window in cls._windows:
             window._tk_window = None
@@ -5,24 +5,45 @@
 # See LICENSE for details.
 # ----------------------------------------------------------------------------
 
-from unittest import mock
+import asyncio
 
 
 
-class Sleep:
+class Loop:
+
+    # Delegates to the real running loop, except for `time`, which tracks the
+    # fake asyncio module's virtual time.
+
+    def __init__(self, fake_asyncio, loop):
+        self._fake_asyncio = fake_asyncio
+        self._loop = loop
+
+    def time(self):
+        return self._fake_asyncio.time
+
+    def __getattr__(self, name):
+        return getattr(self._loop, name)
 
-    def __await__(self):
-        yield
 
 
 class Asyncio:
 
-    class CancelledError(Exception):
-        pass
+    # Delegates to the real asyncio module, except for `sleep`, which tracks
+    # the requested durations, advances virtual time, and only yields control
+    # to the event loop. Setting `lag` makes sleeps take longer than asked.
 
     def __init__(self):
         self.sleep_call_args = []
+        self.time = 0
+        self.lag = 0
 
     def sleep(self, seconds):
         self.sleep_call_args.append(seconds)
-        return Sleep()
+        self.time += seconds + self.lag
+        return asyncio.sleep(0)
+
+    def get_running_loop(self):
+        return Loop(self, asyncio.get_running_loop())
+
+    def __getattr__(self, name):
+        return getattr(asyncio, name)
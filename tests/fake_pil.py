@@ -5,6 +5,7 @@
 # See LICENSE for details.
 # ----------------------------------------------------------------------------
 
+import pathlib
 from unittest import mock
 
 
@@ -21,11 +22,34 @@ class PILImage:
 
     @classmethod
     def open(cls, *args, **kwargs):
-        return cls(*args, **kwargs)
+        image = cls(*args, **kwargs)
+        if args and isinstance(args[0], pathlib.Path):
+            # Saved by `save`: read back the stored size.
+            image.width, image.height = map(int, args[0].read_text().split('x'))
+        return image
+
+    @classmethod
+    def new(cls, _mode, size):
+        image = cls()
+        image.width, image.height = size
+        return image
 
     def convert(self, _format):
         return self
 
+    def load(self):
+        pass
+
+    def crop(self, box):
+        x0, y0, x1, y1 = box
+        return self.new('RGBA', (x1 - x0, y1 - y0))
+
+    def paste(self, _image, _position):
+        pass
+
+    def save(self, path, **_kwargs):
+        pathlib.Path(path).write_text(f'{self.width}x{self.height}')
+
     rotate = mock.Mock()
 
     @classmethod
@@ -0,0 +1,26 @@
+# ----------------------------------------------------------------------------
+# Python A-Turtle
+# ----------------------------------------------------------------------------
+# Copyright (c) Tiago Montes.
+# See LICENSE for details.
+# ----------------------------------------------------------------------------
+
+from unittest import mock
+
+
+
+class Time:
+
+    # A virtual time `time` module: `sleep` is a mock that advances the time
+    # returned by `monotonic`. Setting `lag` makes sleeps take longer than asked.
+
+    def __init__(self):
+        self.now = 0
+        self.lag = 0
+        self.sleep = mock.Mock(side_effect=self._sleep)
+
+    def monotonic(self):
+        return self.now
+
+    def _sleep(self, seconds):
+        self.now += seconds + self.lag
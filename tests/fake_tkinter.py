@@ -28,6 +28,12 @@ class Canvas:
         self.itemconfig = mock.Mock()
         self.tag_lower = mock.Mock()
         self.tag_raise = mock.Mock()
+        self.after = mock.Mock(return_value='after#1')
+        self.after_cancel = mock.Mock()
+        self.tk = mock.Mock()
+
+    def __str__(self):
+        return '.canvas'
 
 
 
@@ -47,6 +53,8 @@ class Window:
         self.after_cancel = mock.Mock()
         self.update = mock.Mock()
         self.destroy = mock.Mock()
+        self.tk = mock.Mock()
+        self.tk.dooneevent = mock.Mock(return_value=0)
 
     FULL_GEOMETRY_RE = re.compile(r'^(\d+)x(\d+)\+(\d+)\+(\d+)$')
     MOVE_GEOMETRY_RE = re.compile(r'^\+(\d+)\+(\d+)$')
@@ -86,19 +94,38 @@ class Toplevel(Window):
 
 class PhotoImage:
 
-    def __init__(self):
+    # Pixels are given as rows of '#rrggbb' strings, with None for transparent
+    # ones, and are read back in bulk via `tk.call(name, 'data', ...)`.
+
+    def __init__(self, width=42, height=24, pixels=None):
+        self.name = f'pyimage{id(self)}'
         self.copies = 0
-        self.width = mock.Mock(return_value=42)
-        self.height = mock.Mock(return_value=24)
+        self.width = mock.Mock(return_value=width)
+        self.height = mock.Mock(return_value=height)
         self.get = mock.Mock(return_value=(10, 20, 30))
         self.put = mock.Mock()
         self.transparency_get = mock.Mock(return_value=False)
         self.transparency_set = mock.Mock()
+        self.pixels = pixels or [['#0a141e'] * width for _ in range(height)]
+        self.tk = mock.Mock()
+        self.tk.call = mock.Mock(side_effect=self._tk_call)
+        self.tk.splitlist = mock.Mock(side_effect=tuple)
+
+    def _tk_call(self, name, command, *args):
+        assert name == self.name and command == 'data'
+        background = args[1] if args else '#000000'
+        return tuple(
+            tuple(background if pixel is None else pixel for pixel in row)
+            for row in self.pixels
+        )
 
     def copy(self):
         self.copies += 1
         return PhotoImage()
 
+    def __str__(self):
+        return self.name
+
 
 
 class Module:
@@ -5,16 +5,19 @@
 # See LICENSE for details.
 # ----------------------------------------------------------------------------
 
-import collections
+import asyncio
 import contextlib
 import math
 from unittest import mock
 
+from aturtle import easing as easing_module
+from aturtle import scheduler
 from aturtle.sprites import base
 
 from . import base as test_base
 from . import fake_tkinter
 from . import fake_asyncio
+from . import fake_time
 
 
 
@@ -554,7 +557,7 @@ class AsyncAnimationBase(test_base.TestCase):
         self.asyncio = fake_asyncio.Asyncio()
         self._exit_stack = contextlib.ExitStack()
         self._exit_stack.enter_context(
-            mock.patch('aturtle.sprites.base.asyncio', self.asyncio)
+            mock.patch('aturtle.scheduler.asyncio', self.asyncio)
         )
 
 
@@ -565,15 +568,10 @@ class AsyncAnimationBase(test_base.TestCase):
 
     def _run_coroutines(self, *coros):
 
-        ready = collections.deque(coros)
-        while ready:
-            coro = ready.popleft()
-            try:
-                coro.send(None)
-            except StopIteration:
-                pass
-            else:
-                ready.append(coro)
+        async def run_all():
+            await asyncio.gather(*coros)
+
+        asyncio.run(run_all())
 
 
 
@@ -1239,6 +1237,116 @@ class TestAsyncRotateToAnimation(AsyncAnimationBase):
 
 
 
+class TestAsyncFollowPathAnimation(AsyncAnimationBase):
+
+    def setUp(self):
+
+        super().setUp()
+        self.sprite = base.Sprite(canvas=self.canvas, shape=None, anchor=(0, 0))
+
+
+    def test_async_follow_path_moves_anchor_to_last_point(self):
+
+        coro = self.sprite.async_follow_path([(30, 0), (30, 40)], speed=70, fps=10)
+        self._run_coroutines(coro)
+
+        self.assert_almost_equal_anchor(self.sprite.anchor, (30, 40), places=1)
+
+
+    def test_async_follow_path_is_a_single_constant_speed_animation(self):
+
+        data = []
+        def cb(progress, points):
+            data.append(points[-1])
+
+        coro = self.sprite.async_follow_path(
+            [(30, 0), (30, 40)], speed=70, fps=10, callback=cb,
+        )
+        self._run_coroutines(coro)
+
+        # Path length is 70 and speed is 70: 10 frames, each 7 units long,
+        # unless crossing the corner.
+        self.assertEqual(len(self.asyncio.sleep_call_args), 10)
+        distances = [
+            math.hypot(x1 - x0, y1 - y0)
+            for (x0, y0), (x1, y1) in zip(data, data[1:])
+            if x0 == x1 or y0 == y1
+        ]
+        for distance in distances:
+            self.assertAlmostEqual(distance, 7, places=3)
+
+
+    def test_async_follow_path_callback_includes_passed_vertices(self):
+
+        data = []
+        def cb(progress, points):
+            data.extend(points)
+
+        coro = self.sprite.async_follow_path(
+            [(30, 0), (30, 40)], speed=70, fps=10, callback=cb,
+        )
+        self._run_coroutines(coro)
+
+        self.assertIn((30, 0), data)
+        self.assert_almost_equal_anchor(data[-1], (30, 40), places=1)
+
+
+    def test_async_follow_path_with_easing_applies_to_the_whole_path(self):
+
+        def easing(progress):
+            return 0 if progress < 0.5 else 1
+
+        coro = self.sprite.async_follow_path(
+            [(30, 0), (30, 40)], speed=70, fps=10, easing=easing,
+        )
+        self._run_coroutines(coro)
+
+        canvas_move_calls = self.canvas.move.call_args_list
+        self.assertEqual(len(canvas_move_calls), 10, 'canvas.move call count')
+        _shape_id, dx, dy = canvas_move_calls[4].args
+        self.assertAlmostEqual(dx, 30, places=1)
+        self.assertAlmostEqual(dy, 40, places=1)
+
+
+    def test_async_follow_path_with_angles_rotates(self):
+
+        coro = self.sprite.async_follow_path(
+            [(30, 0), (30, 40)], angles=[0, 90], speed=70, fps=10,
+        )
+        self._run_coroutines(coro)
+
+        self.assertAlmostEqual(self.sprite.angle, 90)
+
+
+    def test_async_follow_path_with_mismatched_angles_fails(self):
+
+        with self.assertRaises(ValueError):
+            self._run_coroutines(
+                self.sprite.async_follow_path([(30, 0), (30, 40)], angles=[90])
+            )
+
+
+    def test_async_follow_path_with_no_points_works(self):
+
+        coro = self.sprite.async_follow_path([], speed=70, fps=10)
+        self._run_coroutines(coro)
+
+        self.assert_almost_equal_anchor(self.sprite.anchor, (0, 0), places=1)
+
+
+    def test_async_follow_path_fails_with_running_async_move_to(self):
+
+        async def follow_path_while_moving_to():
+            await asyncio.gather(
+                self.sprite.async_move_to(100, 100),
+                self.sprite.async_follow_path([(30, 0)]),
+            )
+
+        with self.assertRaises(base.AnimationError):
+            asyncio.run(follow_path_while_moving_to())
+
+
+
 class TestAsyncAnimationConcurrency(AsyncAnimationBase):
 
     def setUp(self):
@@ -1323,6 +1431,23 @@ class TestAsyncAnimationConcurrency(AsyncAnimationBase):
         self.assertAlmostEqual(self.sprite.angle, 30, places=1)
 
 
+    def test_concurrent_sprites_with_update_update_canvas_once_per_frame(self):
+
+        sprites = [
+            base.Sprite(canvas=self.canvas, shape=None, update=True)
+            for _ in range(5)
+        ]
+        coros = [
+            sprite.async_move(40, 30, speed=50, fps=10)
+            for sprite in sprites
+        ]
+
+        self._run_coroutines(*coros)
+
+        # 10 frames, each with a single coalesced canvas update.
+        self.assertEqual(self.canvas.update.call_count, 10)
+
+
     def test_concurrent_async_move_to_fails(self):
 
         coro_h = self.sprite.async_move_to(40, 0, speed=40, fps=10)
@@ -1378,16 +1503,256 @@ class TestAsyncAnimationConcurrency(AsyncAnimationBase):
 
 
 
+class TestAsyncNestedAnimations(AsyncAnimationBase):
+
+    def test_callback_awaiting_animation_on_same_canvas(self):
+
+        sprite = base.Sprite(canvas=self.canvas, shape=None)
+        other = base.Sprite(canvas=self.canvas, shape=None)
+
+        async def callback(_progress, _anchor):
+            if other.anchor == (0, 0):
+                await other.async_move(0, 30, speed=30, fps=10)
+
+        async def move_with_timeout():
+            await asyncio.wait_for(
+                sprite.async_move(100, 0, speed=100, fps=10, callback=callback),
+                timeout=5,
+            )
+
+        asyncio.run(move_with_timeout())
+
+        self.assert_almost_equal_anchor(sprite.anchor, (100, 0), places=1)
+        self.assert_almost_equal_anchor(other.anchor, (0, 30), places=1)
+
+
+
+class TestAnimationHandles(AsyncAnimationBase):
+
+    def setUp(self):
+
+        super().setUp()
+        self.sprite = base.Sprite(canvas=self.canvas, shape=None)
+
+
+    async def _until_progress(self, handle, progress):
+
+        while handle.progress < progress:
+            await asyncio.sleep(0)
+
+
+    def test_start_move_handle_awaits_completion(self):
+
+        async def start_and_await():
+            handle = self.sprite.start_move(40, 30, speed=50, fps=10)
+            self.assertEqual(handle.progress, 0)
+            self.assertAlmostEqual(handle.remaining, 1)
+            await handle
+            return handle
+
+        handle = asyncio.run(start_and_await())
+
+        self.assert_almost_equal_anchor(self.sprite.anchor, (40, 30), places=1)
+        self.assertTrue(handle.done())
+        self.assertEqual(handle.progress, 1)
+        self.assertEqual(handle.remaining, 0)
+
+
+    def test_handle_pauses_right_after_start(self):
+
+        async def start_and_pause():
+            handle = self.sprite.start_move(40, 0, speed=400, fps=10)
+            handle.pause()
+            self.assertTrue(handle.paused)
+            for _ in range(20):
+                await asyncio.sleep(0)
+            self.assertEqual(handle.progress, 0)
+            handle.resume()
+            self.assertFalse(handle.paused)
+            await handle
+
+        asyncio.run(start_and_pause())
+
+        self.assert_almost_equal_anchor(self.sprite.anchor, (40, 0), places=1)
+
+
+    def test_start_requires_running_event_loop(self):
+
+        with self.assertRaises(RuntimeError):
+            self.sprite.start_move(40, 30)
+
+
+    def test_start_checks_concurrency_right_away(self):
+
+        async def start_twice():
+            handle = self.sprite.start_move_to(40, 30)
+            try:
+                with self.assertRaises(base.AnimationError):
+                    self.sprite.start_move(10, 10)
+            finally:
+                handle.cancel()
+
+        asyncio.run(start_twice())
+
+
+    def test_cancel_stops_animation_and_releases_sprite(self):
+
+        async def start_and_cancel():
+            handle = self.sprite.start_move_to(40, 0, speed=40, fps=10)
+            await self._until_progress(handle, 0.3)
+            handle.cancel()
+            await handle
+            self.assertTrue(handle.done())
+            # Sprite no longer busy.
+            await self.sprite.async_move_to(0, 0, speed=40, fps=10)
+
+        asyncio.run(start_and_cancel())
+
+        self.assert_almost_equal_anchor(self.sprite.anchor, (0, 0), places=1)
+        self.assertLess(len(self.asyncio.sleep_call_args), 20)
+
+
+    def test_cancel_before_first_frame(self):
+
+        async def start_and_cancel():
+            handle = self.sprite.start_move(40, 0)
+            handle.cancel()
+            await handle
+
+        asyncio.run(start_and_cancel())
+
+        self.assert_almost_equal_anchor(self.sprite.anchor, (0, 0), places=1)
+
+
+    def test_pause_and_resume(self):
+
+        async def start_pause_and_resume():
+            handle = self.sprite.start_move(40, 0, speed=40, fps=10)
+            await self._until_progress(handle, 0.3)
+            handle.pause()
+            self.assertTrue(handle.paused)
+            anchor = self.sprite.anchor
+            remaining = handle.remaining
+            paused_time = self.asyncio.time
+            while self.asyncio.time < paused_time + 1:
+                await asyncio.sleep(0)
+            self.assertEqual(self.sprite.anchor, anchor)
+            self.assertEqual(handle.remaining, remaining)
+            paused_time = self.asyncio.time - paused_time
+            handle.resume()
+            self.assertFalse(handle.paused)
+            await handle
+            return paused_time
+
+        paused_time = asyncio.run(start_pause_and_resume())
+
+        self.assertGreater(paused_time, 0.5)
+        self.assert_almost_equal_anchor(self.sprite.anchor, (40, 0), places=1)
+        # Frames are shifted by the time paused for, not skipped.
+        self.assertAlmostEqual(self.asyncio.time, 1 + paused_time, places=3)
+
+
+    def test_retarget_move_to(self):
+
+        async def start_and_retarget():
+            handle = self.sprite.start_move_to(40, 0, speed=40, fps=10)
+            await self._until_progress(handle, 0.5)
+            x, y = self.sprite.anchor
+            handle.retarget(x, 40)
+            while self.sprite.anchor[1] == 0:
+                await asyncio.sleep(0)
+            # No jumps: heads from where it was, 40 units in 5 frames.
+            self.assert_almost_equal_anchor(self.sprite.anchor, (x, 8), places=3)
+            await handle
+
+        asyncio.run(start_and_retarget())
+
+        self.assert_almost_equal_anchor(self.sprite.anchor, (20, 40), places=3)
+        # Same frame loop: same duration.
+        self.assertAlmostEqual(self.asyncio.time, 1, places=3)
+
+
+    def test_retarget_move_to_with_easing(self):
+
+        async def start_and_retarget():
+            handle = self.sprite.start_move_to(40, 0, speed=40, fps=10, easing=easing_module.in_out_cubic)
+            await self._until_progress(handle, 0.5)
+            handle.retarget(-40, 0)
+            await handle
+
+        asyncio.run(start_and_retarget())
+
+        self.assert_almost_equal_anchor(self.sprite.anchor, (-40, 0), places=3)
+
+
+    def test_retarget_rotate_to_takes_shortest_path(self):
+
+        angles = []
+        def callback(_progress, angle):
+            angles.append(angle)
+
+        async def start_and_retarget():
+            handle = self.sprite.start_rotate_to(90, speed=90, fps=10, callback=callback)
+            await self._until_progress(handle, 0.5)
+            handle.retarget(-90)
+            await handle
+
+        asyncio.run(start_and_retarget())
+
+        self.assertAlmostEqual(self.sprite.angle, 270, places=3)
+        # Heads back through 0, not through 180.
+        self.assertTrue(all(angle < 90 or angle > 269 for angle in angles))
+
+
+    def test_retarget_unsupported_animation_raises(self):
+
+        async def start_and_retarget():
+            handle = self.sprite.start_move(40, 0)
+            try:
+                with self.assertRaises(base.AnimationError):
+                    handle.retarget(10, 10)
+            finally:
+                handle.cancel()
+
+        asyncio.run(start_and_retarget())
+
+
+    def test_retarget_finished_animation_raises(self):
+
+        async def start_await_and_retarget():
+            handle = self.sprite.start_move_to(40, 0, speed=400)
+            await handle
+            with self.assertRaises(base.AnimationError):
+                handle.retarget(10, 10)
+
+        asyncio.run(start_await_and_retarget())
+
+
+    def test_start_forward_rotate_and_follow_path(self):
+
+        async def start_all():
+            await self.sprite.start_forward(10, speed=100, fps=10)
+            await self.sprite.start_rotate(90, speed=900, fps=10)
+            await self.sprite.start_forward(10, track_angle=False, speed=100, fps=10)
+            await self.sprite.start_follow_path([(0, 0)], angles=[0], speed=100, fps=10)
+
+        asyncio.run(start_all())
+
+        self.assert_almost_equal_anchor(self.sprite.anchor, (0, 0), places=3)
+        self.assertAlmostEqual(self.sprite.angle, 0, places=3)
+
+
+
 class SyncAnimationBase(test_base.TestCase):
 
     def setUp(self):
 
         self.canvas = fake_tkinter.Canvas()
 
-        self.time = mock.Mock()
+        self.time = fake_time.Time()
         self._exit_stack = contextlib.ExitStack()
         self._exit_stack.enter_context(
-            mock.patch('aturtle.sprites.base.time', self.time)
+            mock.patch('aturtle.scheduler.time', self.time)
         )
 
 
@@ -1436,6 +1801,27 @@ class TestSyncMoveAnimation(SyncAnimationBase):
         # asyncio.sleep awaits are called in alternating turns.
 
 
+    def test_sync_move_with_table_easing_reads_frames_at_once(self):
+
+        calls = []
+        def function(progress):
+            calls.append(progress)
+            return progress ** 2
+
+        easing = easing_module.Easing(function, resolution=10)
+        self.sprite.sync_move(40, 30, speed=50, fps=10, easing=easing)
+
+        # The easing function is only called to fill in the table.
+        self.assertEqual(len(calls), 11)
+
+        canvas_move_calls = self.canvas.move.call_args_list
+        self.assertEqual(len(canvas_move_calls), 10, 'canvas.move call count')
+        _shape_id, dx, dy = canvas_move_calls[0].args
+        self.assertAlmostEqual(dx, 0.4, places=3)
+        self.assertAlmostEqual(dy, 0.3, places=3)
+        self.assert_almost_equal_anchor(self.sprite.anchor, (40, 30), places=3)
+
+
     def test_sync_move_with_speed_and_easing_progresses_non_linearly(self):
 
         def easing(progress):
@@ -1970,6 +2356,81 @@ class TestSyncRotateToAnimation(SyncAnimationBase):
 
 
 
+class TestSyncFollowPathAnimation(SyncAnimationBase):
+
+    def setUp(self):
+
+        super().setUp()
+        self.sprite = base.Sprite(canvas=self.canvas, shape=None, anchor=(0, 0))
+
+
+    def test_sync_follow_path_moves_anchor_to_last_point(self):
+
+        self.sprite.sync_follow_path([(30, 0), (30, 40)], speed=70, fps=10)
+
+        self.assert_almost_equal_anchor(self.sprite.anchor, (30, 40), places=1)
+        self.assertEqual(len(self.time.sleep.call_args_list), 10)
+
+
+    def test_sync_follow_path_calls_callback(self):
+
+        data = []
+        def cb(progress, points):
+            data.extend(points)
+
+        self.sprite.sync_follow_path(
+            [(30, 0), (30, 40)], speed=70, fps=10, callback=cb,
+        )
+
+        self.assertIn((30, 0), data)
+        self.assert_almost_equal_anchor(data[-1], (30, 40), places=1)
+
+
+
+class TestVirtualTimeScene(test_base.TestCase):
+
+    def setUp(self):
+
+        self.canvas = fake_tkinter.Canvas()
+        self._exit_stack = contextlib.ExitStack()
+        self.clock = self._exit_stack.enter_context(scheduler.virtual_time())
+
+
+    def tearDown(self):
+
+        self._exit_stack.close()
+
+
+    def test_sync_ten_minute_scene(self):
+
+        sprite = base.Sprite(canvas=self.canvas, shape=None)
+        sprite.sync_move(300, 0, speed=1, fps=10)
+        sprite.sync_rotate(90, speed=0.3, fps=10)
+
+        self.assert_almost_equal_anchor(sprite.anchor, (300, 0), places=3)
+        self.assertAlmostEqual(sprite.angle, 90, places=3)
+        self.assertAlmostEqual(self.clock.time(), 600, places=3)
+
+
+    def test_async_ten_minute_scene(self):
+
+        mover = base.Sprite(canvas=self.canvas, shape=None)
+        rotator = base.Sprite(canvas=self.canvas, shape=None)
+
+        async def scene():
+            await asyncio.gather(
+                mover.async_move(600, 0, speed=1, fps=10),
+                rotator.async_rotate(90, speed=0.15, fps=10),
+            )
+
+        asyncio.run(scene())
+
+        self.assert_almost_equal_anchor(mover.anchor, (600, 0), places=3)
+        self.assertAlmostEqual(rotator.angle, 90, places=3)
+        self.assertAlmostEqual(self.clock.time(), 600, places=3)
+
+
+
 class TestRegressionSpriteInitializedWithUpdateTrue(test_base.TestCase):
 
     def setUp(self):
@@ -6,9 +6,14 @@
 # ----------------------------------------------------------------------------
 
 import base64
+import concurrent.futures
+import pathlib
+import tempfile
 import unittest
+from unittest import mock
 
 from aturtle.shapes import bitmap
+from aturtle.shapes import cache
 
 from . import fake_pil
 from . import fake_tkinter
@@ -187,41 +192,109 @@ class TestShapeCreationNoPreRotatePIL(_PILBasedTests):
 
 class TestShapeCreationPreRotateTk(_TkBasedTests):
 
-    def test_create_generates_rotation_minus_one_PhotoImage_copies(self):
+    def test_create_generates_rotation_minus_one_PhotoImages(self):
 
         rotations = 8
-        shape = bitmap.Shape(filename='filename', rotations=rotations)
-        straight = shape[0]
+        _shape = bitmap.Shape(filename='filename', rotations=rotations)
 
-        self.assertEqual(straight.copies, rotations-1)
+        # One for the source image, one per non-zero rotation step.
+        photoimage_init_calls = self.tkinter.photoimage_init_calls
+        self.assertEqual(len(photoimage_init_calls), rotations)
 
 
-    def test_copy_creation_calls_PhotoImage_get_and_transparency_get(self):
+    def test_create_reads_source_pixels_in_bulk_once(self):
 
-        rotations = 2
+        rotations = 8
         shape = bitmap.Shape(filename='filename', rotations=rotations)
         straight = shape[0]
 
-        # PhotoImage.get and .transparency_get called:
-        # - More than once...
-        # - ...and, at most, width x height x (rotations - 1).
-        max_calls = straight.width() * straight.height() * (rotations-1)
-        get_calls = straight.get.call_count
-        self.assertGreater(get_calls, 0)
-        self.assertLessEqual(get_calls, max_calls)
+        # Pixel data, then pixel data with two different backgrounds.
+        self.assertEqual(straight.tk.call.call_count, 3)
+        straight.get.assert_not_called()
+        straight.transparency_get.assert_not_called()
 
 
-    def test_copy_creation_calls_PhotoImage_put_and_transparency_set(self):
+    def test_create_writes_rotated_pixels_in_one_tcl_evaluation(self):
 
         rotations = 2
         shape = bitmap.Shape(filename='filename', rotations=rotations)
         inverted = shape[180]
 
-        # PhotoImage.put called once.
-        # PhotoImage.transparency_set called width x height.
-        self.assertEqual(inverted.put.call_count, 1)
-        tset_calls = inverted.width() * inverted.height()
-        self.assertEqual(inverted.transparency_set.call_count, tset_calls)
+        inverted.tk.eval.assert_called_once()
+        inverted.put.assert_not_called()
+        inverted.transparency_set.assert_not_called()
+
+
+
+class TestTkRotation(_TkBasedTests):
+
+    def _rotated_puts(self, pixels, around, step, rotations):
+
+        # Returns the rotated image's Tcl put commands, split in words.
+
+        shape = bitmap.Shape(filename='filename', pre_rotate=False)
+        source = fake_tkinter.PhotoImage(
+            width=len(pixels[0]),
+            height=len(pixels),
+            pixels=pixels,
+        )
+        rotated = shape._rotated_tkinter(source, around, step, rotations)
+        if not rotated.tk.eval.called:
+            return []
+        [script], _kwargs = rotated.tk.eval.call_args
+        return [line.split(' ', 2)[2] for line in script.split('\n')]
+
+
+    def test_rotation_step_0_puts_all_opaque_pixels(self):
+
+        pixels = [
+            ['#000001', '#000002'],
+            ['#000003', '#000004'],
+        ]
+        puts = self._rotated_puts(pixels, around=(0, 0), step=0, rotations=4)
+
+        self.assertEqual(puts, [
+            '{{#000001 #000002}} -to 0 0',
+            '{{#000003 #000004}} -to 0 1',
+        ])
+
+
+    def test_rotation_does_not_put_transparent_pixels(self):
+
+        pixels = [
+            ['#000001', None, '#000003'],
+            [None, None, None],
+        ]
+        puts = self._rotated_puts(pixels, around=(0, 0), step=0, rotations=4)
+
+        self.assertEqual(puts, [
+            '{{#000001}} -to 0 0',
+            '{{#000003}} -to 2 0',
+        ])
+
+
+    def test_rotation_by_180_degrees_around_center(self):
+
+        pixels = [
+            ['#000001', '#000002', '#000003'],
+            ['#000004', '#000005', '#000006'],
+            ['#000007', '#000008', '#000009'],
+        ]
+        puts = self._rotated_puts(pixels, around=(1, 1), step=2, rotations=4)
+
+        self.assertEqual(puts, [
+            '{{#000009 #000008 #000007}} -to 0 0',
+            '{{#000006 #000005 #000004}} -to 0 1',
+            '{{#000003 #000002 #000001}} -to 0 2',
+        ])
+
+
+    def test_fully_transparent_rotation_does_not_evaluate_tcl(self):
+
+        pixels = [[None, None], [None, None]]
+        puts = self._rotated_puts(pixels, around=(0, 0), step=1, rotations=4)
+
+        self.assertEqual(puts, [])
 
 
 
@@ -246,6 +319,241 @@ class TestShapeCreationPreRotatePIL(_PILBasedTests):
         self.assertEqual(self.pil_image.rotate.call_count, rotations-1)
 
 
+class TestSharedRotationsPIL(_PILBasedTests):
+
+    def setUp(self):
+
+        super().setUp()
+        self.cache = cache.RotationCache()
+        patcher = mock.patch('aturtle.shapes.cache.shared', self.cache)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+
+    def test_equal_data_shapes_rotate_once(self):
+
+        rotations = 4
+        shapes = [
+            bitmap.Shape(data=b'c29tZS1kYXRh', rotations=rotations)
+            for _ in range(10)
+        ]
+
+        self.assertEqual(self.pil_image.rotate.call_count, rotations-1)
+        for shape in shapes:
+            self.assertIs(shape[90], shapes[0][90])
+
+
+    def test_equal_shapes_do_not_share_across_tk_interpreters(self):
+
+        rotations = 4
+        with mock.patch('aturtle.shapes.cache.tk_generation', 0):
+            shape1 = bitmap.Shape(data=b'c29tZS1kYXRh', rotations=rotations)
+            cache.tk_destroyed()
+            shape2 = bitmap.Shape(data=b'c29tZS1kYXRh', rotations=rotations)
+
+        self.assertEqual(self.pil_image.rotate.call_count, 2 * (rotations-1))
+        self.assertIsNot(shape1._rotated_data, shape2._rotated_data)
+
+
+    def test_different_data_shapes_rotate_each(self):
+
+        rotations = 4
+        _shape1 = bitmap.Shape(data=b'c29tZS1kYXRh', rotations=rotations)
+        _shape2 = bitmap.Shape(data=b'b3RoZXItZGF0YQ==', rotations=rotations)
+
+        self.assertEqual(self.pil_image.rotate.call_count, 2 * (rotations-1))
+
+
+    def test_unreadable_file_shapes_do_not_share(self):
+
+        rotations = 4
+        _shape1 = bitmap.Shape(filename='no-such-file', rotations=rotations)
+        _shape2 = bitmap.Shape(filename='no-such-file', rotations=rotations)
+
+        self.assertEqual(self.pil_image.rotate.call_count, 2 * (rotations-1))
+        self.assertEqual(len(self.cache), 0)
+
+
+
+class TestBackgroundRotationPIL(_PILBasedTests):
+
+    def _stalled_background_executor(self):
+
+        # Background work is submitted, but never runs.
+        executor = mock.Mock()
+        executor.submit.return_value = concurrent.futures.Future()
+        return mock.patch(
+            'aturtle.shapes.bitmap._get_background_executor',
+            return_value=executor,
+        )
+
+
+    def test_background_rotation_creates_all_rotations(self):
+
+        rotations = 8
+        shape = bitmap.Shape(filename='filename', rotations=rotations, background=True)
+        shape._background_future.result()
+
+        self.assertEqual(self.pil_image.rotate.call_count, rotations-1)
+
+
+    def test_background_rotation_does_not_create_PhotoImages(self):
+
+        shape = bitmap.Shape(filename='filename', rotations=8, background=True)
+        shape._background_future.result()
+
+        self.assertEqual(len(self.pil_image_tk.photoimage_calls), 0)
+
+
+    def test_access_after_background_rotation_creates_one_PhotoImage(self):
+
+        shape = bitmap.Shape(filename='filename', rotations=8, background=True)
+        shape._background_future.result()
+
+        _image = shape[90]
+        _image = shape[90]
+        self.assertEqual(len(self.pil_image_tk.photoimage_calls), 1)
+        self.assertEqual(self.pil_image.rotate.call_count, 7)
+
+
+    def test_access_all_after_background_rotation_stops_tracking(self):
+
+        rotations = 8
+        shape = bitmap.Shape(filename='filename', rotations=rotations, background=True)
+        shape._background_future.result()
+
+        for step in range(rotations):
+            _image = shape[step * 360 / rotations]
+        self.assertIsNone(shape._background_ready)
+
+
+    def test_access_with_no_background_rotation_ready_creates_it(self):
+
+        with self._stalled_background_executor():
+            shape = bitmap.Shape(filename='filename', rotations=8, background=True)
+
+        _image = shape[90]
+        self.assertEqual(self.pil_image.rotate.call_count, 1)
+        self.assertEqual(len(self.pil_image_tk.photoimage_calls), 1)
+
+
+    def test_access_with_adjacent_rotation_ready_returns_it(self):
+
+        with self._stalled_background_executor():
+            shape = bitmap.Shape(filename='filename', rotations=8, background=True)
+
+        _image = shape[90]
+        _image = shape[135]
+        self.assertEqual(self.pil_image.rotate.call_count, 1)
+        self.assertEqual(len(self.pil_image_tk.photoimage_calls), 1)
+
+
+    def test_access_with_distant_rotation_ready_returns_it(self):
+
+        with self._stalled_background_executor():
+            shape = bitmap.Shape(filename='filename', rotations=8, background=True)
+
+        _image = shape[90]
+        _image = shape[270]
+        self.assertEqual(self.pil_image.rotate.call_count, 1)
+        self.assertEqual(len(self.pil_image_tk.photoimage_calls), 1)
+        self.assertEqual(set(shape._rotated_data), {2})
+
+
+    def test_access_returns_nearest_background_rotated_image(self):
+
+        with self._stalled_background_executor():
+            shape = bitmap.Shape(filename='filename', rotations=8, background=True)
+
+        # Background rotated steps 1 and 5: step 5 is nearest to 180 degrees.
+        shape._background_ready[1] = self.pil_image
+        shape._background_ready[5] = self.pil_image
+        _image = shape[180]
+
+        self.assertEqual(self.pil_image.rotate.call_count, 0)
+        self.assertEqual(set(shape._rotated_data), {5})
+        self.assertEqual(set(shape._background_ready), {1})
+
+
+
+class TestBackgroundRotationTk(_TkBasedTests):
+
+    def test_background_rotation_is_not_used(self):
+
+        rotations = 8
+        shape = bitmap.Shape(filename='filename', rotations=rotations, background=True)
+        straight = shape[0]
+
+        self.assertIsNone(shape._background_future)
+        self.assertEqual(len(self.tkinter.photoimage_init_calls), rotations)
+
+
+
+class TestDiskCachePIL(_PILBasedTests):
+
+    def setUp(self):
+
+        super().setUp()
+        temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(temp_dir.cleanup)
+        self.directory = pathlib.Path(temp_dir.name)
+        cache.enable_disk_cache(self.directory)
+        self.addCleanup(cache.disable_disk_cache)
+
+
+    def _create_shape(self, **kwargs):
+
+        # No in-memory sharing: each shape is created from scratch.
+        with mock.patch('aturtle.shapes.cache.shared', cache.RotationCache()):
+            return bitmap.Shape(data=b'c29tZS1kYXRh', rotations=4, **kwargs)
+
+
+    def test_first_create_rotates_and_stores_one_strip(self):
+
+        _shape = self._create_shape()
+
+        self.assertEqual(self.pil_image.rotate.call_count, 3)
+        [strip_path] = self.directory.iterdir()
+        self.assertEqual(strip_path.read_text(), f'{42 * 4}x24')
+
+
+    def test_second_create_loads_without_rotating(self):
+
+        _shape1 = self._create_shape()
+        _shape2 = self._create_shape()
+
+        self.assertEqual(self.pil_image.rotate.call_count, 3)
+        self.assertEqual(len(self.pil_image_tk.photoimage_calls), 8)
+
+
+    def test_different_anchor_does_not_load(self):
+
+        _shape1 = self._create_shape()
+        _shape2 = self._create_shape(anchor=(1, 1))
+
+        self.assertEqual(self.pil_image.rotate.call_count, 6)
+        self.assertEqual(len(list(self.directory.iterdir())), 2)
+
+
+    def test_invalid_strip_rotates_and_stores_again(self):
+
+        _shape1 = self._create_shape()
+        [strip_path] = self.directory.iterdir()
+        strip_path.write_text('1x1')
+        _shape2 = self._create_shape()
+
+        self.assertEqual(self.pil_image.rotate.call_count, 6)
+        self.assertEqual(strip_path.read_text(), f'{42 * 4}x24')
+
+
+    def test_no_pre_rotate_does_not_store(self):
+
+        _shape = self._create_shape(pre_rotate=False)
+
+        self.assertEqual(list(self.directory.iterdir()), [])
+
+
+
 class ShapeAnchorTestsMixin:
 
     def test_int_anchor_is_taken_as_is(self):
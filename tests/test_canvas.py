@@ -5,7 +5,9 @@
 # See LICENSE for details.
 # ----------------------------------------------------------------------------
 
+from array import array
 import contextlib
+import tkinter
 import unittest
 from unittest import mock
 
@@ -180,11 +182,23 @@ class TestInvertedTkYCanvas(unittest.TestCase):
         )
 
 
+    def test_create_line_passes_tags_to_Canvas_create_line(self):
+
+        c = canvas.InvertedYCanvas(self.master, None)
+
+        _item_id = c.create_line([], fill='fill', width=42, capstyle='capstyle', tags='tag')
+
+        wrapped_tkinter_canvas = self.tkinter.canvases[0]
+        wrapped_tkinter_canvas.create_line.assert_called_with(
+            mock.ANY, fill='fill', width=42, capstyle='capstyle', tags='tag',
+        )
+
+
     def test_move_calls_canvas_move_with_same_item_id(self):
 
         c = canvas.InvertedYCanvas(self.master, None)
 
-        c.move(42, 0, 0)
+        c.move(42, 1, 2)
 
         wrapped_tkinter_canvas = self.tkinter.canvases[0]
         wrapped_tkinter_canvas.move.assert_called_with(42, mock.ANY, mock.ANY)
@@ -222,6 +236,18 @@ class TestInvertedTkYCanvas(unittest.TestCase):
         )
 
 
+    def test_coords_takes_array_coords(self):
+
+        c = canvas.InvertedYCanvas(self.master, None)
+
+        c.coords(None, array('d', [1, 2, 3, 4]))
+
+        wrapped_tkinter_canvas = self.tkinter.canvases[0]
+        wrapped_tkinter_canvas.coords.assert_called_with(
+            mock.ANY, [1, -2, 3, -4]
+        )
+
+
     def test_attribute_access_returns_tkinter_Canvas_attribute(self):
 
         c = canvas.InvertedYCanvas(self.master, None)
@@ -232,8 +258,6 @@ class TestInvertedTkYCanvas(unittest.TestCase):
             'xview_scroll',
             'yview_scroll',
             'update',
-            'delete',
-            'itemconfig',
             'tag_lower',
             'tag_raise',
         )
@@ -244,3 +268,385 @@ class TestInvertedTkYCanvas(unittest.TestCase):
                 result = getattr(c, name)
                 underlying = getattr(wrapped_tkinter_canvas, name)
                 self.assertIs(result, underlying)
+
+
+    def test_itemconfig_calls_canvas_itemconfig(self):
+
+        c = canvas.InvertedYCanvas(self.master, None)
+
+        c.itemconfig(42, image='image')
+
+        wrapped_tkinter_canvas = self.tkinter.canvases[0]
+        wrapped_tkinter_canvas.itemconfig.assert_called_once_with(42, image='image')
+
+
+
+class TestBatch(unittest.TestCase):
+
+    def test_canvas_without_batch_support_gets_no_op_batch(self):
+
+        for target in (mock.Mock(), fake_tkinter.Canvas()):
+            with self.subTest(target=target):
+                with canvas.batch(target):
+                    pass
+                if isinstance(target, mock.Mock):
+                    target.batch.assert_not_called()
+
+
+    def test_batching_canvas_batches(self):
+
+        class BatchingCanvas:
+            def batch(self):
+                return 'batch context'
+
+        self.assertEqual(canvas.batch(BatchingCanvas()), 'batch context')
+
+
+
+class TestTclWord(unittest.TestCase):
+
+    def setUp(self):
+
+        try:
+            self.tcl = tkinter.Tcl()
+        except Exception:
+            self.skipTest('Tcl not available')
+
+
+    def test_words_round_trip_through_tcl(self):
+
+        values = [
+            'red', 'light blue', 'a{b', 'a b}', 'x\\', '$x [y]', '"q";',
+            'two\nlines\tand\rtabs', '', 42, 1.5,
+        ]
+        for value in values:
+            with self.subTest(value=value):
+                word = canvas._tcl_word(value)
+                self.assertEqual(self.tcl.eval(f'lindex [list {word}] 0'), str(value))
+
+
+    def test_tuples_are_tcl_lists(self):
+
+        word = canvas._tcl_word((3, 5))
+        self.assertEqual(self.tcl.eval(f'llength [lindex [list {word}] 0]'), '2')
+
+
+    def test_tuple_items_round_trip_through_tcl(self):
+
+        items = ('a b', 'c}', '{d', '', 'e\\', 'f\ng')
+        word = canvas._tcl_word(items)
+        for index, item in enumerate(items):
+            with self.subTest(item=item):
+                result = self.tcl.eval(f'lindex [lindex [list {word}] 0] {index}')
+                self.assertEqual(result, item)
+
+
+    def test_words_match_tkinter_for_plain_values(self):
+
+        self.assertEqual(canvas._tcl_word('red'), 'red')
+        self.assertEqual(canvas._tcl_word(42), '42')
+        self.assertEqual(canvas._tcl_word((3, 5)), '{3 5}')
+
+
+
+class TestInvertedTkYCanvasElision(unittest.TestCase):
+
+    def setUp(self):
+
+        self.tkinter = fake_tkinter.Module(
+            screen_width=SCREEN_WIDTH,
+            screen_height=SCREEN_HEIGHT,
+        )
+        self.master = self.tkinter.Tk()
+
+        self._exit_stack = contextlib.ExitStack()
+        self._exit_stack.enter_context(
+            mock.patch('aturtle.canvas.tkinter', self.tkinter)
+        )
+
+        self.canvas = canvas.InvertedYCanvas(self.master, None)
+        self.wrapped_tkinter_canvas = self.tkinter.canvases[0]
+
+
+    def tearDown(self):
+
+        self._exit_stack.close()
+
+
+    def test_zero_distance_move_dropped(self):
+
+        self.canvas.move(42, 0, 0)
+
+        self.wrapped_tkinter_canvas.move.assert_not_called()
+
+
+    def _create_polygon(self):
+
+        return self.canvas.create_polygon([0, 0, 1, 1], fill='', outline='', width=1)
+
+
+    def test_same_coords_dropped(self):
+
+        item_id = self._create_polygon()
+        self.canvas.coords(item_id, [1, 2, 3, 4])
+        self.canvas.coords(item_id, array('d', [1, 2, 3, 4]))
+
+        self.wrapped_tkinter_canvas.coords.assert_called_once()
+
+
+    def test_non_polygon_coords_not_cached(self):
+
+        self.canvas.coords(42, [1, 2, 3, 4])
+        self.canvas.coords(42, [1, 2, 3, 4])
+
+        self.assertEqual(self.wrapped_tkinter_canvas.coords.call_count, 2)
+        self.assertEqual(self.canvas._item_coords, {})
+
+
+    def test_different_coords_passed(self):
+
+        item_id = self._create_polygon()
+        self.canvas.coords(item_id, [1, 2, 3, 4])
+        self.canvas.coords(item_id, [1, 2, 3, 5])
+
+        self.assertEqual(self.wrapped_tkinter_canvas.coords.call_count, 2)
+
+
+    def test_created_polygon_coords_are_cached(self):
+
+        item_id = self.canvas.create_polygon([1, 2, 3, 4], fill='', outline='', width=1)
+        self.canvas.coords(item_id, [1, 2, 3, 4])
+
+        self.wrapped_tkinter_canvas.coords.assert_not_called()
+
+
+    def test_move_invalidates_cached_coords(self):
+
+        item_id = self._create_polygon()
+        self.canvas.move(item_id, 1, 1)
+        self.canvas.coords(item_id, [0, 0, 1, 1])
+        self.canvas.coords(item_id, [0, 0, 1, 1])
+
+        self.wrapped_tkinter_canvas.coords.assert_called_once()
+
+
+    def test_tag_move_invalidates_cached_coords(self):
+
+        item_id = self._create_polygon()
+        self.canvas.move('tag', 1, 1)
+        self.canvas.coords(item_id, [0, 0, 1, 1])
+
+        self.wrapped_tkinter_canvas.coords.assert_called_once()
+
+
+    def test_same_options_dropped(self):
+
+        self.canvas.itemconfig(42, image='image', state='normal')
+        self.canvas.itemconfig(42, image='image')
+        self.canvas.itemconfig(42, state='normal')
+
+        self.wrapped_tkinter_canvas.itemconfig.assert_called_once()
+
+
+    def test_different_options_passed(self):
+
+        self.canvas.itemconfig(42, image='image')
+        self.canvas.itemconfig(42, image='other')
+        self.canvas.itemconfig(42, image='other', state='hidden')
+
+        self.assertEqual(self.wrapped_tkinter_canvas.itemconfig.call_count, 3)
+
+
+    def test_created_image_is_cached(self):
+
+        item_id = self.canvas.create_image(0, 0, image='image', anchor='sw')
+        self.canvas.itemconfig(item_id, image='image')
+
+        self.wrapped_tkinter_canvas.itemconfig.assert_not_called()
+
+
+    def test_tag_changes_invalidate_all_cached_options(self):
+
+        self.canvas.itemconfig(42, state='normal')
+        self.canvas.itemconfig('tag', state='hidden')
+        self.canvas.itemconfig(42, state='normal')
+
+        self.assertEqual(self.wrapped_tkinter_canvas.itemconfig.call_count, 3)
+
+
+    def test_delete_forgets_and_deletes(self):
+
+        item_id = self._create_polygon()
+        self.canvas.itemconfig(item_id, fill='red')
+        self.canvas.delete(item_id)
+        self.canvas.itemconfig(item_id, fill='red')
+
+        self.wrapped_tkinter_canvas.delete.assert_called_once_with(item_id)
+        self.assertEqual(self.wrapped_tkinter_canvas.itemconfig.call_count, 2)
+        self.assertNotIn(item_id, self.canvas._item_coords)
+
+
+    def test_delegated_item_changes_invalidate_cache(self):
+
+        self.wrapped_tkinter_canvas.itemconfigure = mock.Mock()
+
+        self.canvas.itemconfig(42, image='image')
+        self.canvas.itemconfigure(42, image='other')
+        self.canvas.itemconfig(42, image='image')
+
+        self.assertEqual(self.wrapped_tkinter_canvas.itemconfig.call_count, 2)
+
+
+    def test_batched_same_coords_dropped(self):
+
+        tk_eval = self.wrapped_tkinter_canvas.tk.eval
+
+        item_id = self._create_polygon()
+        with self.canvas.batch():
+            self.canvas.coords(item_id, [1, 2])
+            self.canvas.coords(item_id, [1, 2])
+            self.canvas.move(item_id, 0, 0)
+
+        tk_eval.assert_called_once_with('.canvas coords 42 1 -2')
+
+
+
+class TestInvertedTkYCanvasBatch(unittest.TestCase):
+
+    def setUp(self):
+
+        self.tkinter = fake_tkinter.Module(
+            screen_width=SCREEN_WIDTH,
+            screen_height=SCREEN_HEIGHT,
+        )
+        self.master = self.tkinter.Tk()
+
+        self._exit_stack = contextlib.ExitStack()
+        self._exit_stack.enter_context(
+            mock.patch('aturtle.canvas.tkinter', self.tkinter)
+        )
+
+        self.canvas = canvas.InvertedYCanvas(self.master, None)
+        self.wrapped_tkinter_canvas = self.tkinter.canvases[0]
+
+
+    def tearDown(self):
+
+        self._exit_stack.close()
+
+
+    def test_batched_calls_not_passed_to_canvas(self):
+
+        with self.canvas.batch():
+            self.canvas.move(42, 1, 2)
+            self.canvas.coords(42, [1, 2, 3, 4])
+            self.canvas.itemconfig(42, image='image')
+
+        self.wrapped_tkinter_canvas.move.assert_not_called()
+        self.wrapped_tkinter_canvas.coords.assert_not_called()
+        self.wrapped_tkinter_canvas.itemconfig.assert_not_called()
+
+
+    def test_batched_calls_evaluated_in_single_script_on_exit(self):
+
+        tk_eval = self.wrapped_tkinter_canvas.tk.eval
+
+        with self.canvas.batch():
+            self.canvas.move(42, 1, 2)
+            self.canvas.coords(24, [1, 2, 3.5, 4])
+            self.canvas.itemconfig(42, image='pyimage1')
+            tk_eval.assert_not_called()
+
+        tk_eval.assert_called_once_with(
+            '.canvas move 42 1 -2\n'
+            '.canvas coords 24 1 -2 3.5 -4\n'
+            '.canvas itemconfigure 42 -image pyimage1'
+        )
+
+
+    def test_batch_with_no_calls_evaluates_nothing(self):
+
+        with self.canvas.batch():
+            pass
+
+        self.wrapped_tkinter_canvas.tk.eval.assert_not_called()
+
+
+    def test_nested_batches_evaluated_once_on_outermost_exit(self):
+
+        tk_eval = self.wrapped_tkinter_canvas.tk.eval
+
+        with self.canvas.batch():
+            with self.canvas.batch():
+                self.canvas.move(42, 1, 2)
+            tk_eval.assert_not_called()
+            self.canvas.move(42, 3, 4)
+
+        tk_eval.assert_called_once_with(
+            '.canvas move 42 1 -2\n'
+            '.canvas move 42 3 -4'
+        )
+
+
+    def test_batched_string_values_quoted(self):
+
+        tk_eval = self.wrapped_tkinter_canvas.tk.eval
+
+        with self.canvas.batch():
+            self.canvas.itemconfig('some tag', fill='light blue')
+
+        tk_eval.assert_called_once_with(
+            '.canvas itemconfigure {some tag} -fill {light blue}'
+        )
+
+
+    def test_batched_tuple_values_are_tcl_lists(self):
+
+        tk_eval = self.wrapped_tkinter_canvas.tk.eval
+
+        with self.canvas.batch():
+            self.canvas.itemconfig(42, dash=(3, 5))
+
+        tk_eval.assert_called_once_with('.canvas itemconfigure 42 -dash {3 5}')
+
+
+    def test_batched_brace_and_backslash_values_escaped(self):
+
+        tk_eval = self.wrapped_tkinter_canvas.tk.eval
+
+        with self.canvas.batch():
+            self.canvas.itemconfig(42, text='a{b', tags='c}\\')
+
+        tk_eval.assert_called_once_with(
+            '.canvas itemconfigure 42 -text a\\{b -tags c\\}\\\\'
+        )
+
+
+    def test_other_calls_submit_batch_first(self):
+
+        tk_eval = self.wrapped_tkinter_canvas.tk.eval
+        create_line = self.wrapped_tkinter_canvas.create_line
+
+        calls = mock.Mock()
+        tk_eval.side_effect = lambda *_args: calls.eval()
+        create_line.side_effect = lambda *_args, **_kwargs: calls.create_line()
+
+        with self.canvas.batch():
+            self.canvas.move(42, 1, 2)
+            self.canvas.create_line([], fill='fill', width=1, capstyle='round')
+            self.canvas.move(42, 3, 4)
+
+        self.assertEqual(
+            calls.mock_calls,
+            [mock.call.eval(), mock.call.create_line(), mock.call.eval()],
+        )
+
+
+    def test_delegated_attribute_access_submits_batch_first(self):
+
+        tk_eval = self.wrapped_tkinter_canvas.tk.eval
+
+        with self.canvas.batch():
+            self.canvas.move(42, 1, 2)
+            self.canvas.tag_raise(42)
+            tk_eval.assert_called_once_with('.canvas move 42 1 -2')
@@ -0,0 +1,135 @@
+# ----------------------------------------------------------------------------
+# Python A-Turtle
+# ----------------------------------------------------------------------------
+# Copyright (c) Tiago Montes.
+# See LICENSE for details.
+# ----------------------------------------------------------------------------
+
+import math
+import unittest
+
+from aturtle import easing
+
+
+
+EASINGS = {
+    name: value
+    for name, value in vars(easing).items()
+    if isinstance(value, easing.Easing)
+}
+
+
+
+class TestEasing(unittest.TestCase):
+
+    def test_table_values_are_exact(self):
+
+        e = easing.Easing(lambda progress: progress ** 2, resolution=4)
+        for progress in (0, 0.25, 0.5, 0.75, 1):
+            with self.subTest(progress=progress):
+                self.assertEqual(e(progress), progress ** 2)
+
+
+    def test_values_between_table_points_are_interpolated(self):
+
+        e = easing.Easing(lambda progress: progress ** 2, resolution=2)
+        self.assertAlmostEqual(e(0.25), 0.125)
+        self.assertAlmostEqual(e(0.75), 0.625)
+
+
+    def test_progress_is_clamped(self):
+
+        e = easing.Easing(lambda progress: progress ** 2, resolution=4)
+        self.assertEqual(e(-1), 0)
+        self.assertEqual(e(2), 1)
+
+
+    def test_function_called_once_per_table_point(self):
+
+        calls = []
+        def function(progress):
+            calls.append(progress)
+            return progress
+
+        e = easing.Easing(function, resolution=8)
+        for progress in (0.1, 0.2, 0.3):
+            e(progress)
+        e.frames(100)
+
+        self.assertEqual(calls, [i / 8 for i in range(9)])
+
+
+    def test_frames(self):
+
+        e = easing.Easing(lambda progress: progress ** 2, resolution=4)
+        self.assertEqual(list(e.frames(4)), [0.0625, 0.25, 0.5625, 1])
+
+
+    def test_frames_are_shared(self):
+
+        self.assertIs(easing.in_quad.frames(10), easing.in_quad.frames(10))
+
+
+    def test_repr_has_function_name(self):
+
+        self.assertIn('_cubic', repr(easing.in_cubic))
+
+
+
+class TestCurves(unittest.TestCase):
+
+    def test_all_standard_curves_present(self):
+
+        for curve in ('quad', 'cubic', 'sine', 'expo', 'elastic', 'bounce'):
+            for variant in ('in', 'out', 'in_out'):
+                with self.subTest(curve=curve, variant=variant):
+                    self.assertIn(f'{variant}_{curve}', EASINGS)
+
+
+    def test_curves_start_at_0_and_end_at_1(self):
+
+        for name, e in EASINGS.items():
+            with self.subTest(name=name):
+                self.assertAlmostEqual(e(0), 0, places=9)
+                self.assertEqual(e(1), 1)
+                self.assertEqual(e.frames(7)[-1], 1)
+
+
+    def test_in_out_curves_are_symmetric(self):
+
+        for name, e in EASINGS.items():
+            if not name.startswith('in_out_'):
+                continue
+            with self.subTest(name=name):
+                self.assertAlmostEqual(e(0.5), 0.5)
+                self.assertAlmostEqual(e(0.2), 1 - e(0.8), places=9)
+
+
+    def test_out_curves_mirror_in_curves(self):
+
+        for name, e in EASINGS.items():
+            if not name.startswith('out_'):
+                continue
+            in_e = EASINGS['in_' + name[4:]]
+            with self.subTest(name=name):
+                self.assertAlmostEqual(e(0.3), 1 - in_e(0.7), places=9)
+
+
+    def test_curve_values(self):
+
+        self.assertAlmostEqual(easing.in_quad(0.5), 0.25)
+        self.assertAlmostEqual(easing.in_cubic(0.5), 0.125)
+        self.assertAlmostEqual(easing.out_sine(0.5), math.sqrt(2) / 2)
+        self.assertAlmostEqual(easing.in_expo(0.5), 2 ** -5)
+        self.assertAlmostEqual(easing.out_bounce(0.5), 0.765625)
+        self.assertAlmostEqual(easing.linear(0.3), 0.3)
+
+
+    def test_interpolation_error_is_small(self):
+
+        for progress in (0.1234, 0.5678, 0.9012):
+            with self.subTest(progress=progress):
+                expected = 1 - math.cos(progress * math.pi / 2)
+                self.assertAlmostEqual(easing.in_sine(progress), expected, places=5)
+                expected = progress ** 3
+                self.assertAlmostEqual(easing.in_cubic(progress), expected, places=5)
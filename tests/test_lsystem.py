@@ -0,0 +1,290 @@
+# ----------------------------------------------------------------------------
+# Python A-Turtle
+# ----------------------------------------------------------------------------
+# Copyright (c) Tiago Montes.
+# See LICENSE for details.
+# ----------------------------------------------------------------------------
+
+import asyncio
+import concurrent.futures
+import itertools as it
+import pickle
+import unittest
+from unittest import mock
+
+from aturtle import lsystem
+from aturtle import turtle
+from aturtle.sprites import base as sprite_base
+
+from . import base
+from . import fake_tkinter
+
+
+
+def koch(**kwargs):
+
+    return lsystem.LSystem('F', {'F': 'F+F--F+F'}, angle=60, step=1, **kwargs)
+
+
+
+def points(lines):
+
+    return [
+        (round(x, 6), round(y, 6))
+        for line in lines
+        for x, y in zip(line[::2], line[1::2])
+    ]
+
+
+
+class TestExpand(unittest.TestCase):
+
+    def test_zero_iterations_is_axiom(self):
+
+        self.assertEqual(koch().expand(0), 'F')
+
+
+    def test_iterations_replace_symbols(self):
+
+        self.assertEqual(koch().expand(1), 'F+F--F+F')
+        self.assertEqual(
+            koch().expand(2),
+            'F+F--F+F+F+F--F+F--F+F--F+F+F+F--F+F',
+        )
+
+
+    def test_symbols_without_rules_are_kept(self):
+
+        system = lsystem.LSystem('AB', {'A': 'AB'}, angle=90)
+        self.assertEqual(system.expand(2), 'ABBB')
+
+
+
+class TestChunks(base.TestCase):
+
+    def test_draw_symbols_draw_a_single_line(self):
+
+        system = lsystem.LSystem('F+F+F', {}, angle=90, step=10)
+
+        [lines] = system.chunks(0)
+
+        self.assert_almost_equal_coords(lines[0], [0, 0, 10, 0, 10, 10, 0, 10], places=6)
+        self.assertEqual(len(lines), 1)
+
+
+    def test_move_symbols_split_lines(self):
+
+        system = lsystem.LSystem('FfF', {}, angle=90, step=10)
+
+        [lines] = system.chunks(0)
+
+        self.assertEqual(len(lines), 2)
+        self.assert_almost_equal_coords(lines[1], [20, 0, 30, 0], places=6)
+
+
+    def test_push_and_pop_branch(self):
+
+        system = lsystem.LSystem('F[+F]F', {}, angle=90, step=10)
+
+        [lines] = system.chunks(0)
+
+        self.assertEqual(len(lines), 2)
+        self.assert_almost_equal_coords(lines[0], [0, 0, 10, 0, 10, 10], places=6)
+        self.assert_almost_equal_coords(lines[1], [10, 0, 20, 0], places=6)
+
+
+    def test_lazy_expansion_matches_expand(self):
+
+        system = koch()
+        expected = lsystem.LSystem(system.expand(4), {}, angle=60, step=1)
+
+        self.assertEqual(
+            points(it.chain.from_iterable(system.chunks(4))),
+            points(it.chain.from_iterable(expected.chunks(0))),
+        )
+
+
+    def test_chunks_are_bounded_and_continuous(self):
+
+        system = koch()
+
+        chunks = list(system.chunks(4, chunk_points=100))
+
+        # 4 ** 4 moves: 256 points.
+        self.assertEqual(len(chunks), 3)
+        for chunk_lines, next_lines in zip(chunks, chunks[1:]):
+            self.assertLessEqual(sum(len(line) // 2 - 1 for line in chunk_lines), 100)
+            self.assertEqual(chunk_lines[-1][-2:], next_lines[0][:2])
+
+
+    def test_chunks_without_drawing_are_bounded(self):
+
+        # Only turns and moves: no points, yet many symbols.
+        system = lsystem.LSystem('X', {'X': 'X+f-X'}, angle=90)
+        spec = system._spec()
+        cursor = lsystem._start_cursor(12)
+
+        lines, cursor = lsystem._generate_chunk(spec, cursor, 10)
+
+        self.assertEqual(lines, [])
+        self.assertIsNotNone(cursor)
+        self.assertGreater(len(list(system.chunks(12, chunk_points=10))), 1)
+
+
+    def test_chunk_state_is_picklable(self):
+
+        system = koch()
+        cursor = lsystem._start_cursor(4)
+        _lines, cursor = lsystem._generate_chunk(system._spec(), cursor, 10)
+
+        self.assertEqual(pickle.loads(pickle.dumps(cursor)), cursor)
+
+
+
+class TestAsyncChunks(unittest.TestCase):
+
+    def setUp(self):
+
+        self.executor = concurrent.futures.ThreadPoolExecutor(max_workers=1)
+
+
+    def tearDown(self):
+
+        self.executor.shutdown()
+
+
+    def _collect(self, system, iterations, **kwargs):
+
+        async def collect():
+            return [
+                lines
+                async for lines in system.async_chunks(iterations, **kwargs)
+            ]
+
+        return asyncio.run(collect())
+
+
+    def test_async_chunks_match_chunks(self):
+
+        system = koch()
+
+        self.assertEqual(
+            self._collect(system, 4, chunk_points=100, executor=self.executor),
+            list(system.chunks(4, chunk_points=100)),
+        )
+
+
+    def test_async_chunks_run_in_executor(self):
+
+        system = koch()
+        executor = mock.Mock(wraps=self.executor)
+
+        self._collect(system, 4, chunk_points=100, executor=executor)
+
+        self.assertEqual(executor.submit.call_count, 3)
+
+
+    def test_async_chunks_default_to_a_shared_executor(self):
+
+        system = koch()
+
+        with mock.patch('aturtle.lsystem._default_executor', self.executor):
+            chunks = self._collect(system, 2)
+
+        self.assertEqual(chunks, list(system.chunks(2)))
+
+
+
+class TestDefaultExecutor(unittest.TestCase):
+
+    def setUp(self):
+
+        patcher = mock.patch('aturtle.lsystem._default_executor', None)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+
+    def _default_executor(self, start_method):
+
+        with mock.patch('multiprocessing.get_start_method', return_value=start_method):
+            executor = lsystem._get_default_executor()
+        self.addCleanup(executor.shutdown)
+        return executor
+
+
+    def test_process_pool_when_forking(self):
+
+        executor = self._default_executor('fork')
+
+        self.assertIsInstance(executor, concurrent.futures.ProcessPoolExecutor)
+
+
+    def test_thread_pool_when_spawning(self):
+
+        for start_method in ('spawn', 'forkserver'):
+            with self.subTest(start_method=start_method):
+                lsystem._default_executor = None
+                executor = self._default_executor(start_method)
+                self.assertIsInstance(executor, concurrent.futures.ThreadPoolExecutor)
+
+
+    def test_platform_default_start_method_when_unset(self):
+
+        with mock.patch('multiprocessing.get_all_start_methods', return_value=['spawn']):
+            executor = self._default_executor(None)
+
+        self.assertIsInstance(executor, concurrent.futures.ThreadPoolExecutor)
+
+
+    def test_executor_is_shared(self):
+
+        executor = self._default_executor('spawn')
+
+        self.assertIs(lsystem._get_default_executor(), executor)
+
+
+
+class TestAsyncDraw(base.TestCase):
+
+    def setUp(self):
+
+        self.canvas = fake_tkinter.Canvas()
+        self.canvas.create_line.side_effect = it.count(100)
+        self.sprite = sprite_base.Sprite(self.canvas, shape=None, anchor=(5, 5), angle=90)
+        self.t = turtle.Turtle(self.sprite, line_color='pink', line_width=5)
+        self.executor = concurrent.futures.ThreadPoolExecutor(max_workers=1)
+
+
+    def tearDown(self):
+
+        self.executor.shutdown()
+
+
+    def test_draws_one_line_item_per_chunk_line(self):
+
+        system = koch()
+
+        asyncio.run(lsystem.async_draw(
+            self.t, system, 4, chunk_points=100, executor=self.executor,
+        ))
+
+        self.assertEqual(self.canvas.create_line.call_count, 3)
+        self.canvas.create_line.assert_called_with(
+            mock.ANY,
+            fill='pink',
+            width=5,
+            capstyle='round',
+            tags=self.t.tag,
+        )
+        self.assertEqual(self.t._lines, [100, 101, 102])
+
+
+    def test_draws_from_turtle_pose(self):
+
+        system = lsystem.LSystem('F', {}, angle=90, step=10)
+
+        asyncio.run(lsystem.async_draw(self.t, system, 0, executor=self.executor))
+
+        [coords], _kwargs = self.canvas.create_line.call_args
+        self.assert_almost_equal_coords(coords, [5, 5, 5, 15], places=6)
+        self.assertEqual(self.sprite.anchor, (5, 5))
@@ -0,0 +1,290 @@
+# ----------------------------------------------------------------------------
+# Python A-Turtle
+# ----------------------------------------------------------------------------
+# Copyright (c) Tiago Montes.
+# See LICENSE for details.
+# ----------------------------------------------------------------------------
+
+import contextlib
+import unittest
+from unittest import mock
+
+from aturtle import canvas
+from aturtle import paint
+
+from . import fake_tkinter
+
+
+
+class _PaintLayerTests(unittest.TestCase):
+
+    def setUp(self):
+
+        self._exit_stack = contextlib.ExitStack()
+        self.image = self._exit_stack.enter_context(mock.patch('aturtle.paint.Image'))
+        self.image_draw = self._exit_stack.enter_context(mock.patch('aturtle.paint.ImageDraw'))
+        self.image_tk = self._exit_stack.enter_context(mock.patch('aturtle.paint.ImageTk'))
+        self.time = self._exit_stack.enter_context(mock.patch('aturtle.paint.time'))
+        self.time.monotonic.return_value = 0
+
+        self.canvas = self._create_canvas()
+        self.canvas.winfo_width = mock.Mock(return_value=200)
+        self.canvas.winfo_height = mock.Mock(return_value=100)
+        self.canvas.winfo_rgb = mock.Mock(return_value=(0xff00, 0x8000, 0x0000))
+
+
+    def _create_canvas(self):
+
+        return fake_tkinter.Canvas()
+
+
+    def tearDown(self):
+
+        self._exit_stack.close()
+
+
+    @property
+    def draw(self):
+
+        return self.image_draw.Draw.return_value
+
+
+
+class TestPaintLayer(_PaintLayerTests):
+
+    def test_create_without_PIL_raises_RuntimeError(self):
+
+        with mock.patch('aturtle.paint.Image', None):
+            with self.assertRaises(RuntimeError):
+                _layer = paint.PaintLayer(self.canvas)
+
+
+    def test_create_image_sized_as_canvas(self):
+
+        _layer = paint.PaintLayer(self.canvas)
+
+        self.image.new.assert_called_once_with('RGBA', (200, 100), (0, 0, 0, 0))
+
+
+    def test_create_image_sized_as_bbox(self):
+
+        _layer = paint.PaintLayer(self.canvas, bbox=(-10, -20, 30, 40))
+
+        self.image.new.assert_called_once_with('RGBA', (40, 60), (0, 0, 0, 0))
+
+
+    def test_lines_up_to_max_lines_are_kept(self):
+
+        layer = paint.PaintLayer(self.canvas, max_lines=3)
+        for line_id in range(3):
+            layer.add_line(line_id, [0, 0, 10, 10], fill='orange', width=2)
+
+        self.assertEqual(len(layer), 3)
+        self.canvas.delete.assert_not_called()
+        self.canvas.create_image.assert_not_called()
+
+
+    def test_lines_beyond_max_lines_are_flattened(self):
+
+        layer = paint.PaintLayer(self.canvas, max_lines=3)
+        for line_id in range(4):
+            layer.add_line(line_id, [0, 0, 10, 10], fill='orange', width=2)
+
+        self.assertEqual(len(layer), 0)
+        self.assertEqual(self.draw.line.call_count, 4)
+        self.canvas.delete.assert_called_once_with(0, 1, 2, 3)
+
+
+    def test_lines_older_than_max_age_are_flattened(self):
+
+        layer = paint.PaintLayer(self.canvas, max_age=10)
+        layer.add_line(1, [0, 0, 10, 10], fill='orange', width=2)
+        self.time.monotonic.return_value = 9
+        layer.add_line(2, [0, 0, 10, 10], fill='orange', width=2)
+        self.assertEqual(len(layer), 2)
+
+        self.time.monotonic.return_value = 10
+        layer.add_line(3, [0, 0, 10, 10], fill='orange', width=2)
+        self.assertEqual(len(layer), 0)
+
+
+    def test_lines_older_than_max_age_are_flattened_by_timer(self):
+
+        layer = paint.PaintLayer(self.canvas, max_age=10)
+        layer.add_line(1, [0, 0, 10, 10], fill='orange', width=2)
+        layer.add_line(2, [0, 0, 10, 10], fill='orange', width=2)
+
+        # A single timer, for when the oldest line is due.
+        self.canvas.after.assert_called_once_with(10001, mock.ANY)
+        age_check = self.canvas.after.call_args.args[1]
+
+        self.time.monotonic.return_value = 10
+        age_check()
+
+        self.assertEqual(len(layer), 0)
+        self.canvas.delete.assert_called_once_with(1, 2)
+
+
+    def test_early_age_check_reschedules(self):
+
+        layer = paint.PaintLayer(self.canvas, max_age=10)
+        layer.add_line(1, [0, 0, 10, 10], fill='orange', width=2)
+        age_check = self.canvas.after.call_args.args[1]
+
+        self.time.monotonic.return_value = 4
+        age_check()
+
+        self.assertEqual(len(layer), 1)
+        self.assertEqual(self.canvas.after.call_args.args[0], 6001)
+
+
+    def test_no_timer_without_max_age(self):
+
+        layer = paint.PaintLayer(self.canvas)
+        layer.add_line(1, [0, 0, 10, 10], fill='orange', width=2)
+
+        self.canvas.after.assert_not_called()
+
+
+    def test_flatten_and_clear_cancel_timer(self):
+
+        layer = paint.PaintLayer(self.canvas, max_age=10)
+        layer.add_line(1, [0, 0, 10, 10], fill='orange', width=2)
+        layer.flatten()
+
+        self.canvas.after_cancel.assert_called_once_with('after#1')
+
+        layer.add_line(2, [0, 0, 10, 10], fill='orange', width=2)
+        layer.clear()
+
+        self.assertEqual(self.canvas.after_cancel.call_count, 2)
+
+
+    def test_flattened_lines_drawn_in_Tk_color_and_width(self):
+
+        layer = paint.PaintLayer(self.canvas, bbox=(0, 0, 100, 100))
+        layer.add_line(1, [0, 0, 10, 20, 30, 40], fill='orange', width=3)
+        layer.flatten()
+
+        self.canvas.winfo_rgb.assert_called_once_with('orange')
+        self.draw.line.assert_called_once_with(
+            [(0, 0), (10, 20), (30, 40)],
+            fill=(0xff, 0x80, 0x00),
+            width=3,
+            joint='curve',
+        )
+
+
+    def test_first_flatten_creates_image_behind_everything(self):
+
+        layer = paint.PaintLayer(self.canvas, bbox=(-10, -20, 30, 40))
+        layer.add_line(1, [0, 0, 10, 10], fill='orange', width=2)
+        layer.flatten()
+
+        self.canvas.create_image.assert_called_once_with(
+            -10, -20,
+            image=self.image_tk.PhotoImage.return_value,
+            anchor='nw',
+        )
+        self.canvas.tag_lower.assert_called_once_with(24)
+
+
+    def test_further_flattens_update_the_image(self):
+
+        layer = paint.PaintLayer(self.canvas)
+        for line_id in range(3):
+            layer.add_line(line_id, [0, 0, 10, 10], fill='orange', width=2)
+            layer.flatten()
+
+        self.canvas.create_image.assert_called_once()
+        photo_image = self.image_tk.PhotoImage.return_value
+        self.assertEqual(photo_image.paste.call_count, 2)
+
+
+    def test_flatten_with_no_lines_does_nothing(self):
+
+        layer = paint.PaintLayer(self.canvas)
+        layer.flatten()
+
+        self.draw.line.assert_not_called()
+        self.canvas.create_image.assert_not_called()
+
+
+
+    def test_clear_deletes_added_lines_at_once(self):
+
+        layer = paint.PaintLayer(self.canvas)
+        for line_id in range(3):
+            layer.add_line(line_id, [0, 0, 10, 10], fill='orange', width=2)
+        layer.clear()
+
+        self.assertEqual(len(layer), 0)
+        self.canvas.delete.assert_called_once_with(0, 1, 2)
+        self.draw.line.assert_not_called()
+
+
+    def test_clear_clears_the_shown_image(self):
+
+        layer = paint.PaintLayer(self.canvas)
+        layer.add_line(1, [0, 0, 10, 10], fill='orange', width=2)
+        layer.flatten()
+        layer.clear()
+
+        self.assertEqual(self.image.new.call_count, 2)
+        photo_image = self.image_tk.PhotoImage.return_value
+        photo_image.paste.assert_called_once_with(self.image.new.return_value)
+
+
+    def test_claim_by_same_owner_is_allowed(self):
+
+        layer = paint.PaintLayer(self.canvas)
+        owner = object()
+        layer.claim(owner)
+        layer.claim(owner)
+
+
+    def test_claim_by_another_owner_raises_ValueError(self):
+
+        layer = paint.PaintLayer(self.canvas)
+        layer.claim(object())
+        with self.assertRaises(ValueError):
+            layer.claim(object())
+
+
+
+class TestPaintLayerInvertedYCanvas(_PaintLayerTests):
+
+    def _create_canvas(self):
+
+        tkinter = fake_tkinter.Module(screen_width=640, screen_height=480)
+        with mock.patch('aturtle.canvas.tkinter', tkinter):
+            inverted_y_canvas = canvas.InvertedYCanvas(tkinter.Tk(), 'white')
+        self.tk_canvas = tkinter.canvases[0]
+        return inverted_y_canvas
+
+
+    def test_default_bbox_is_centered_at_origin(self):
+
+        layer = paint.PaintLayer(self.canvas)
+        layer.add_line(1, [-100, 50, 100, -50], fill='orange', width=2)
+        layer.flatten()
+
+        self.draw.line.assert_called_once_with(
+            [(0, 0), (200, 100)],
+            fill=mock.ANY,
+            width=2,
+            joint='curve',
+        )
+
+
+    def test_image_is_placed_at_top_left(self):
+
+        layer = paint.PaintLayer(self.canvas)
+        layer.add_line(1, [0, 0, 10, 10], fill='orange', width=2)
+        layer.flatten()
+
+        self.tk_canvas.create_image.assert_called_once_with(
+            -100, -50,      # y=50 at the top, inverted by the canvas
+            image=mock.ANY,
+            anchor='nw',
+        )
@@ -0,0 +1,139 @@
+# ----------------------------------------------------------------------------
+# Python A-Turtle
+# ----------------------------------------------------------------------------
+# Copyright (c) Tiago Montes.
+# See LICENSE for details.
+# ----------------------------------------------------------------------------
+
+import asyncio
+import contextlib
+import unittest
+from unittest import mock
+
+from aturtle import runner
+from aturtle import scheduler
+from aturtle import window
+
+from . import fake_tkinter
+
+
+
+class TestRun(unittest.TestCase):
+
+    def setUp(self):
+
+        self.tkinter = fake_tkinter.Module(screen_width=640, screen_height=480)
+        self._exit_stack = contextlib.ExitStack()
+        self._exit_stack.enter_context(
+            mock.patch('aturtle.window.tkinter', self.tkinter)
+        )
+
+
+    def tearDown(self):
+
+        self._exit_stack.close()
+        window.Window.close_all(strict=False)
+
+
+    def _Window(self):
+
+        return window.Window(canvas_factory=self.tkinter.Canvas)
+
+
+    def test_run_returns_coroutine_result(self):
+
+        async def coro():
+            return 42
+
+        self.assertEqual(runner.run(coro()), 42)
+
+
+    def test_run_propagates_coroutine_exception(self):
+
+        async def coro():
+            raise ValueError()
+
+        with self.assertRaises(ValueError):
+            runner.run(coro())
+
+
+    def test_run_with_no_windows_works(self):
+
+        async def coro():
+            await asyncio.sleep(0.02)
+            return 24
+
+        self.assertEqual(runner.run(coro()), 24)
+
+
+    def test_run_services_tk_events(self):
+
+        w = self._Window()
+        tk = w._tk_window.tk
+
+        async def coro():
+            await asyncio.sleep(0.02)
+
+        runner.run(coro())
+
+        tk.dooneevent.assert_called_with(runner._TCL_DONT_WAIT)
+
+
+    def test_run_services_all_pending_tk_events(self):
+
+        w = self._Window()
+        tk = w._tk_window.tk
+        tk.dooneevent.side_effect = [1, 1, 1] + [0] * 1000
+
+        async def coro():
+            await asyncio.sleep(0.02)
+
+        runner.run(coro())
+
+        self.assertGreater(tk.dooneevent.call_count, 3)
+
+
+    def test_run_services_tk_events_with_bounded_latency(self):
+
+        w = self._Window()
+        tk = w._tk_window.tk
+
+        async def coro():
+            await asyncio.sleep(0.05)
+
+        runner.run(coro(), latency=0.01)
+
+        # Serviced periodically, not just once.
+        self.assertGreater(tk.dooneevent.call_count, 2)
+
+
+    def test_run_services_update_requests_with_no_canvas_update(self):
+
+        w = self._Window()
+        tk = w._tk_window.tk
+        canvas = w.canvas
+        frame_scheduler = scheduler.for_canvas(canvas)
+
+        async def coro():
+            await asyncio.sleep(0)
+            tk.dooneevent.reset_mock()
+            frame_scheduler.request_update()
+            await asyncio.sleep(0)
+            await asyncio.sleep(0)
+            tk.dooneevent.assert_called_with(runner._TCL_DONT_WAIT)
+
+        runner.run(coro())
+
+        canvas.update.assert_not_called()
+
+
+    def test_run_removes_update_servicer_when_done(self):
+
+        _w = self._Window()
+
+        async def coro():
+            return asyncio.get_running_loop()
+
+        loop = runner.run(coro())
+
+        self.assertNotIn(loop, scheduler._UPDATE_SERVICERS)
@@ -0,0 +1,756 @@
+# ----------------------------------------------------------------------------
+# Python A-Turtle
+# ----------------------------------------------------------------------------
+# Copyright (c) Tiago Montes.
+# See LICENSE for details.
+# ----------------------------------------------------------------------------
+
+import asyncio
+import contextlib
+import time
+import unittest
+from unittest import mock
+
+from aturtle import scheduler
+
+from . import fake_asyncio
+from . import fake_time
+from . import fake_tkinter
+
+
+
+class Animation(scheduler.Animation):
+
+    def __init__(self, total_frames, frame_seconds, callback=None):
+        super().__init__(total_frames=total_frames, frame_seconds=frame_seconds)
+        self.frames = []
+        self.callback = callback
+
+    def step(self, frame):
+        self.frames.append(frame)
+        return self.callback(frame) if self.callback else None
+
+
+
+class FailingAnimation(scheduler.Animation):
+
+    def __init__(self):
+        super().__init__(total_frames=10, frame_seconds=0.1)
+
+    def step(self, frame):
+        raise ValueError(frame)
+
+
+
+class BatchingCanvas(fake_tkinter.Canvas):
+
+    def __init__(self):
+        super().__init__()
+        self.batching = False
+        self.batches = 0
+
+    @contextlib.contextmanager
+    def batch(self):
+        self.batching = True
+        self.batches += 1
+        try:
+            yield
+        finally:
+            self.batching = False
+
+
+
+class TestForCanvas(unittest.TestCase):
+
+    def test_same_canvas_same_scheduler(self):
+
+        canvas = fake_tkinter.Canvas()
+        self.assertIs(scheduler.for_canvas(canvas), scheduler.for_canvas(canvas))
+
+
+    def test_different_canvases_different_schedulers(self):
+
+        canvas1 = fake_tkinter.Canvas()
+        canvas2 = fake_tkinter.Canvas()
+        self.assertIsNot(scheduler.for_canvas(canvas1), scheduler.for_canvas(canvas2))
+
+
+
+class TestAsyncRun(unittest.TestCase):
+
+    def setUp(self):
+
+        self.canvas = fake_tkinter.Canvas()
+        self.scheduler = scheduler.FrameScheduler(self.canvas)
+
+        self.asyncio = fake_asyncio.Asyncio()
+        self._exit_stack = contextlib.ExitStack()
+        self._exit_stack.enter_context(
+            mock.patch('aturtle.scheduler.asyncio', self.asyncio)
+        )
+
+
+    def tearDown(self):
+
+        self._exit_stack.close()
+
+
+    def _run_animations(self, *animations):
+
+        async def run_all():
+            await asyncio.gather(*(
+                self.scheduler.async_run(animation)
+                for animation in animations
+            ))
+
+        asyncio.run(run_all())
+
+
+    def test_animation_steps_all_frames_in_order(self):
+
+        animation = Animation(total_frames=10, frame_seconds=0.1)
+        self._run_animations(animation)
+
+        self.assertEqual(animation.frames, list(range(1, 11)))
+
+
+    def test_animation_sleeps_once_per_frame(self):
+
+        animation = Animation(total_frames=10, frame_seconds=0.1)
+        self._run_animations(animation)
+
+        self.assertEqual(len(self.asyncio.sleep_call_args), 10)
+        for sleep_duration in self.asyncio.sleep_call_args:
+            self.assertAlmostEqual(sleep_duration, 0.1, places=3)
+
+
+    def test_concurrent_animations_share_ticks(self):
+
+        animations = [
+            Animation(total_frames=10, frame_seconds=0.1)
+            for _ in range(50)
+        ]
+        self._run_animations(*animations)
+
+        # One sleep per frame, not one per frame per animation.
+        self.assertEqual(len(self.asyncio.sleep_call_args), 10)
+        for animation in animations:
+            self.assertEqual(animation.frames, list(range(1, 11)))
+
+
+    def test_concurrent_animations_at_different_rates(self):
+
+        slow = Animation(total_frames=2, frame_seconds=0.5)
+        fast = Animation(total_frames=10, frame_seconds=0.1)
+        self._run_animations(slow, fast)
+
+        self.assertEqual(slow.frames, [1, 2])
+        self.assertEqual(fast.frames, list(range(1, 11)))
+        self.assertAlmostEqual(sum(self.asyncio.sleep_call_args), 1, places=3)
+
+
+    def test_sleeps_account_for_computation_overhead(self):
+
+        def computation_overhead(_frame):
+            self.asyncio.time += 0.03
+
+        animation = Animation(10, 0.1, callback=computation_overhead)
+        self._run_animations(animation)
+
+        self.assertEqual(animation.frames, list(range(1, 11)))
+        for sleep_duration in self.asyncio.sleep_call_args:
+            self.assertAlmostEqual(sleep_duration, 0.07, places=3)
+
+
+    def test_lagging_animation_skips_frames(self):
+
+        self.asyncio.lag = 0.25
+        animation = Animation(total_frames=10, frame_seconds=0.1)
+        self._run_animations(animation)
+
+        # Frames are produced when due: the last one is always included.
+        self.assertEqual(animation.frames, [1, 4, 7, 10])
+
+
+    def test_lagging_animation_lasts_nominal_duration(self):
+
+        self.asyncio.lag = 0.25
+        animation = Animation(total_frames=10, frame_seconds=0.1)
+        self._run_animations(animation)
+
+        # Deadline driven: no more than one lag beyond the nominal 1 second.
+        self.assertLess(self.asyncio.time, 1 + 0.25 + 0.001)
+
+
+    def test_update_requests_coalesced_once_per_tick(self):
+
+        def request_updates(_frame):
+            for _ in range(3):
+                self.scheduler.request_update()
+
+        animations = [
+            Animation(total_frames=10, frame_seconds=0.1, callback=request_updates)
+            for _ in range(5)
+        ]
+        self._run_animations(*animations)
+
+        self.assertEqual(self.canvas.update.call_count, 10)
+
+
+    def test_no_update_requests_no_canvas_update(self):
+
+        animation = Animation(total_frames=10, frame_seconds=0.1)
+        self._run_animations(animation)
+
+        self.canvas.update.assert_not_called()
+
+
+    def test_update_requests_coalesced_once_per_loop_iteration(self):
+
+        async def request_updates():
+            for _ in range(3):
+                self.scheduler.request_update()
+            self.canvas.update.assert_not_called()
+            await asyncio.sleep(0)
+            self.canvas.update.assert_called_once_with()
+
+        asyncio.run(request_updates())
+
+
+    def test_batching_canvas_steps_batched_once_per_tick(self):
+
+        canvas = BatchingCanvas()
+        frame_scheduler = scheduler.FrameScheduler(canvas)
+
+        batching_states = []
+        def track_batching(_frame):
+            batching_states.append(canvas.batching)
+
+        animations = [
+            Animation(total_frames=10, frame_seconds=0.1, callback=track_batching)
+            for _ in range(5)
+        ]
+
+        async def run_all():
+            await asyncio.gather(*(
+                frame_scheduler.async_run(animation)
+                for animation in animations
+            ))
+
+        asyncio.run(run_all())
+
+        self.assertTrue(all(batching_states))
+        self.assertEqual(canvas.batches, 11)
+
+
+    def test_deferred_callables_called_once_at_tick_end(self):
+
+        calls = []
+        def deferred():
+            calls.append(len(animations[0].frames))
+
+        def defer(_frame):
+            self.assertTrue(self.scheduler.defer(deferred))
+
+        animations = [
+            Animation(total_frames=3, frame_seconds=0.1, callback=defer)
+            for _ in range(5)
+        ]
+        self._run_animations(*animations)
+
+        # Once per tick, after all animations stepped.
+        self.assertEqual(calls, [1, 2, 3])
+
+
+    def test_deferred_callables_called_before_canvas_update(self):
+
+        order = []
+        self.canvas.update.side_effect = lambda: order.append('update')
+
+        def defer(_frame):
+            self.scheduler.defer(lambda: order.append('deferred'))
+            self.scheduler.request_update()
+
+        self._run_animations(Animation(total_frames=1, frame_seconds=0.1, callback=defer))
+
+        self.assertEqual(order, ['deferred', 'update'])
+
+
+    def test_defer_outside_tick_does_nothing(self):
+
+        callback = mock.Mock()
+
+        self.assertFalse(self.scheduler.defer(callback))
+        callback.assert_not_called()
+
+
+    def test_paused_animation_steps_no_frames_until_resumed(self):
+
+        animation = Animation(total_frames=10, frame_seconds=0.1)
+
+        async def run_pause_and_resume():
+            task = asyncio.create_task(self.scheduler.async_run(animation))
+            while len(animation.frames) < 3:
+                await asyncio.sleep(0)
+            self.scheduler.pause(animation)
+            self.assertTrue(self.scheduler.is_paused(animation))
+            frames = list(animation.frames)
+            for _ in range(10):
+                await asyncio.sleep(0)
+            self.assertEqual(animation.frames, frames)
+            self.scheduler.resume(animation)
+            self.assertFalse(self.scheduler.is_paused(animation))
+            await task
+
+        asyncio.run(run_pause_and_resume())
+
+        # Resumed frames are shifted, not skipped.
+        self.assertEqual(animation.frames, list(range(1, 11)))
+
+
+    def test_added_animation_can_be_paused_right_away(self):
+
+        animation = Animation(total_frames=3, frame_seconds=0.1)
+
+        async def add_and_pause():
+            future = self.scheduler.add(animation)
+            self.scheduler.pause(animation)
+            self.assertTrue(self.scheduler.is_paused(animation))
+            for _ in range(10):
+                await asyncio.sleep(0)
+            self.assertEqual(animation.frames, [])
+            self.scheduler.resume(animation)
+            await future
+
+        asyncio.run(add_and_pause())
+
+        self.assertEqual(animation.frames, [1, 2, 3])
+
+
+    def test_adding_running_animation_raises_ValueError(self):
+
+        animation = Animation(total_frames=3, frame_seconds=0.1)
+
+        async def add_twice():
+            future = self.scheduler.add(animation)
+            with self.assertRaises(ValueError):
+                self.scheduler.add(animation)
+            await future
+
+        asyncio.run(add_twice())
+
+
+    def test_cancelling_added_future_removes_animation(self):
+
+        animation = Animation(total_frames=10, frame_seconds=0.1)
+
+        async def add_and_cancel():
+            future = self.scheduler.add(animation)
+            while len(animation.frames) < 2:
+                await asyncio.sleep(0)
+            future.cancel()
+            await asyncio.sleep(0)
+            self.assertFalse(self.scheduler._running)
+
+        asyncio.run(add_and_cancel())
+
+        self.assertLess(len(animation.frames), 10)
+
+
+    def test_pause_and_resume_unknown_animation_do_nothing(self):
+
+        animation = Animation(total_frames=10, frame_seconds=0.1)
+
+        async def pause_and_resume():
+            self.scheduler.pause(animation)
+            self.assertFalse(self.scheduler.is_paused(animation))
+            self.scheduler.resume(animation)
+
+        asyncio.run(pause_and_resume())
+
+
+    def test_step_awaitables_are_awaited(self):
+
+        awaited = []
+        async def callback(frame):
+            awaited.append(frame)
+
+        animation = Animation(total_frames=3, frame_seconds=0.1, callback=callback)
+        self._run_animations(animation)
+
+        self.assertEqual(awaited, [1, 2, 3])
+
+
+    def test_step_awaitable_can_await_other_animations(self):
+
+        inner = Animation(total_frames=5, frame_seconds=0.1)
+
+        async def callback(frame):
+            if frame == 1:
+                await self.scheduler.async_run(inner)
+
+        outer = Animation(total_frames=3, frame_seconds=0.1, callback=callback)
+
+        async def run_with_timeout():
+            await asyncio.wait_for(self.scheduler.async_run(outer), timeout=5)
+
+        asyncio.run(run_with_timeout())
+
+        self.assertEqual(inner.frames, list(range(1, 6)))
+        self.assertEqual(outer.frames[0], 1)
+        self.assertEqual(outer.frames[-1], 3)
+
+
+    def test_slow_step_awaitable_only_holds_back_its_animation(self):
+
+        done = []
+        slow_step = None
+
+        def callback(frame):
+            nonlocal slow_step
+            if frame == 1:
+                slow_step = asyncio.get_running_loop().create_future()
+                return slow_step
+            return None
+
+        slow = Animation(total_frames=2, frame_seconds=0.1, callback=callback)
+        fast = Animation(total_frames=10, frame_seconds=0.1)
+
+        async def run_fast():
+            await self.scheduler.async_run(fast)
+            done.append('fast')
+            slow_step.set_result(None)
+
+        async def run_slow():
+            await self.scheduler.async_run(slow)
+            done.append('slow')
+
+        async def run_both():
+            await asyncio.gather(run_slow(), run_fast())
+
+        asyncio.run(run_both())
+
+        self.assertEqual(fast.frames, list(range(1, 11)))
+        self.assertEqual(slow.frames, [1, 2])
+        self.assertEqual(done, ['fast', 'slow'])
+
+
+    def test_step_awaitable_exception_raised_in_caller(self):
+
+        async def callback(frame):
+            raise ValueError(frame)
+
+        animation = Animation(total_frames=3, frame_seconds=0.1, callback=callback)
+
+        with self.assertRaises(ValueError):
+            self._run_animations(animation)
+
+
+    def test_step_exception_raised_in_caller(self):
+
+        with self.assertRaises(ValueError):
+            self._run_animations(FailingAnimation())
+
+
+    def test_step_exception_does_not_affect_other_animations(self):
+
+        animation = Animation(total_frames=10, frame_seconds=0.1)
+
+        async def run_both():
+            return await asyncio.gather(
+                self.scheduler.async_run(FailingAnimation()),
+                self.scheduler.async_run(animation),
+                return_exceptions=True,
+            )
+
+        results = asyncio.run(run_both())
+
+        self.assertIsInstance(results[0], ValueError)
+        self.assertEqual(animation.frames, list(range(1, 11)))
+
+
+    def test_cancelled_caller_removes_animation(self):
+
+        animation = Animation(total_frames=10, frame_seconds=0.1)
+
+        async def run_and_cancel():
+            task = asyncio.create_task(self.scheduler.async_run(animation))
+            for _ in range(3):
+                await asyncio.sleep(0)
+            task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await task
+
+        asyncio.run(run_and_cancel())
+
+        self.assertLess(len(animation.frames), 10)
+        self.assertFalse(self.scheduler._running)
+
+
+
+class TestUpdateRequestWithNoEventLoop(unittest.TestCase):
+
+    def test_update_request_updates_immediately(self):
+
+        canvas = fake_tkinter.Canvas()
+        frame_scheduler = scheduler.FrameScheduler(canvas)
+
+        frame_scheduler.request_update()
+        canvas.update.assert_called_once_with()
+
+        frame_scheduler.request_update()
+        self.assertEqual(canvas.update.call_count, 2)
+
+
+
+class TestSyncRun(unittest.TestCase):
+
+    def setUp(self):
+
+        self.canvas = fake_tkinter.Canvas()
+        self.scheduler = scheduler.FrameScheduler(self.canvas)
+
+        self.time = fake_time.Time()
+        self._exit_stack = contextlib.ExitStack()
+        self._exit_stack.enter_context(
+            mock.patch('aturtle.scheduler.time', self.time)
+        )
+
+
+    def tearDown(self):
+
+        self._exit_stack.close()
+
+
+    def test_animation_steps_all_frames_in_order(self):
+
+        animation = Animation(total_frames=10, frame_seconds=0.1)
+        self.scheduler.sync_run(animation)
+
+        self.assertEqual(animation.frames, list(range(1, 11)))
+
+
+    def test_animation_sleeps_once_per_frame(self):
+
+        animation = Animation(total_frames=10, frame_seconds=0.1)
+        self.scheduler.sync_run(animation)
+
+        time_sleep_call_args = self.time.sleep.call_args_list
+        self.assertEqual(len(time_sleep_call_args), 10)
+        for call_args in time_sleep_call_args:
+            self.assertAlmostEqual(call_args.args[0], 0.1, places=3)
+
+
+    def test_sleeps_account_for_computation_overhead(self):
+
+        def computation_overhead(_frame):
+            self.time.now += 0.03
+
+        animation = Animation(10, 0.1, callback=computation_overhead)
+        self.scheduler.sync_run(animation)
+
+        self.assertEqual(animation.frames, list(range(1, 11)))
+        for call_args in self.time.sleep.call_args_list:
+            self.assertAlmostEqual(call_args.args[0], 0.07, places=3)
+
+
+    def test_lagging_animation_skips_frames(self):
+
+        self.time.lag = 0.25
+        animation = Animation(total_frames=10, frame_seconds=0.1)
+        self.scheduler.sync_run(animation)
+
+        self.assertEqual(animation.frames, [1, 4, 7, 10])
+        self.assertLess(self.time.now, 1 + 0.25 + 0.001)
+
+
+    def test_update_requests_coalesced_once_per_frame(self):
+
+        def request_updates(_frame):
+            for _ in range(3):
+                self.scheduler.request_update()
+
+        animation = Animation(10, 0.1, callback=request_updates)
+        self.scheduler.sync_run(animation)
+
+        self.assertEqual(self.canvas.update.call_count, 10)
+
+
+    def test_deferred_callables_called_once_per_frame(self):
+
+        callback = mock.Mock()
+        def defer(_frame):
+            for _ in range(3):
+                self.scheduler.defer(callback)
+
+        animation = Animation(10, 0.1, callback=defer)
+        self.scheduler.sync_run(animation)
+
+        self.assertEqual(callback.call_count, 10)
+
+
+
+class TestClocks(unittest.TestCase):
+
+    def test_default_clock_is_system_clock(self):
+
+        self.assertIsInstance(scheduler.get_clock(), scheduler.SystemClock)
+
+
+    def test_set_clock_none_restores_system_clock(self):
+
+        clock = scheduler.VirtualClock()
+        scheduler.set_clock(clock)
+        try:
+            self.assertIs(scheduler.get_clock(), clock)
+        finally:
+            scheduler.set_clock(None)
+
+        self.assertIsInstance(scheduler.get_clock(), scheduler.SystemClock)
+
+
+    def test_virtual_time_sets_and_restores_clock(self):
+
+        previous = scheduler.get_clock()
+        with scheduler.virtual_time(start=42) as clock:
+            self.assertIs(scheduler.get_clock(), clock)
+            self.assertEqual(clock.time(), 42)
+
+        self.assertIs(scheduler.get_clock(), previous)
+
+
+    def test_virtual_sync_sleep_advances_time(self):
+
+        clock = scheduler.VirtualClock()
+        clock.sync_sleep(1.5)
+        clock.sync_sleep(-1)
+
+        self.assertEqual(clock.time(), 1.5)
+
+
+    def test_virtual_async_sleepers_woken_in_wake_time_order(self):
+
+        clock = scheduler.VirtualClock()
+        woken = []
+
+        async def sleeper(name, seconds):
+            await clock.async_sleep(seconds)
+            woken.append((name, clock.time()))
+
+        async def sleep_all():
+            await asyncio.gather(
+                sleeper('c', 3),
+                sleeper('a', 1),
+                sleeper('b', 2),
+            )
+
+        asyncio.run(sleep_all())
+
+        self.assertEqual(woken, [('a', 1), ('b', 2), ('c', 3)])
+
+
+
+class TestVirtualTimeRuns(unittest.TestCase):
+
+    def setUp(self):
+
+        self._exit_stack = contextlib.ExitStack()
+        self.clock = self._exit_stack.enter_context(scheduler.virtual_time())
+
+
+    def tearDown(self):
+
+        self._exit_stack.close()
+
+
+    def test_sync_run_takes_no_wall_time(self):
+
+        animation = Animation(total_frames=6000, frame_seconds=0.1)
+
+        wall_start = time.monotonic()
+        scheduler.FrameScheduler(fake_tkinter.Canvas()).sync_run(animation)
+
+        self.assertEqual(animation.frames, list(range(1, 6001)))
+        self.assertAlmostEqual(self.clock.time(), 600, places=3)
+        self.assertLess(time.monotonic() - wall_start, 10)
+
+
+    def test_async_run_takes_no_wall_time(self):
+
+        animation = Animation(total_frames=6000, frame_seconds=0.1)
+        frame_scheduler = scheduler.FrameScheduler(fake_tkinter.Canvas())
+
+        wall_start = time.monotonic()
+        asyncio.run(frame_scheduler.async_run(animation))
+
+        self.assertEqual(animation.frames, list(range(1, 6001)))
+        self.assertAlmostEqual(self.clock.time(), 600, places=3)
+        self.assertLess(time.monotonic() - wall_start, 10)
+
+
+    def test_added_animation_wakes_sleeping_tick_loop(self):
+
+        slow = Animation(2, 1)
+        fast = Animation(2, 1 / 80)
+        frame_scheduler = scheduler.FrameScheduler(fake_tkinter.Canvas())
+
+        async def run_fast_later():
+            await self.clock.async_sleep(0.05)
+            await frame_scheduler.async_run(fast)
+            return self.clock.time()
+
+        async def run_both():
+            _, fast_done = await asyncio.gather(
+                frame_scheduler.async_run(slow),
+                run_fast_later(),
+            )
+            return fast_done
+
+        fast_done = asyncio.run(run_both())
+
+        self.assertAlmostEqual(fast_done, 0.05 + 2 / 80, places=6)
+
+
+    def test_completed_step_awaitable_wakes_sleeping_tick_loop(self):
+
+        frames = []
+        async def slow_callback(frame):
+            frames.append((self.clock.time(), frame))
+            await self.clock.async_sleep(1.5)
+
+        animation = Animation(2, 1, callback=slow_callback)
+        frame_scheduler = scheduler.FrameScheduler(fake_tkinter.Canvas())
+
+        asyncio.run(frame_scheduler.async_run(animation))
+
+        # Frame 2 right when frame 1's awaitable completes.
+        self.assertEqual(frames[0], (0, 1))
+        self.assertAlmostEqual(frames[1][0], 1.5, places=6)
+
+
+    def test_frames_on_different_canvases_are_ordered_by_time(self):
+
+        frames = []
+        def track(name):
+            return lambda frame: frames.append((self.clock.time(), name, frame))
+
+        slow = Animation(5, 0.3, callback=track('slow'))
+        fast = Animation(10, 0.1, callback=track('fast'))
+        slow_scheduler = scheduler.FrameScheduler(fake_tkinter.Canvas())
+        fast_scheduler = scheduler.FrameScheduler(fake_tkinter.Canvas())
+
+        async def run_both():
+            await asyncio.gather(
+                slow_scheduler.async_run(slow),
+                fast_scheduler.async_run(fast),
+            )
+
+        asyncio.run(run_both())
+
+        # No frames skipped, and all produced in time order.
+        self.assertEqual(slow.frames, list(range(1, 6)))
+        self.assertEqual(fast.frames, list(range(1, 11)))
+        self.assertEqual(frames, sorted(frames, key=lambda entry: entry[0]))
+        for frame_time, name, frame in frames:
+            frame_seconds = 0.3 if name == 'slow' else 0.1
+            self.assertAlmostEqual(frame_time, (frame - 1) * frame_seconds, places=6)
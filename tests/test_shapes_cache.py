@@ -0,0 +1,247 @@
+# ----------------------------------------------------------------------------
+# Python A-Turtle
+# ----------------------------------------------------------------------------
+# Copyright (c) Tiago Montes.
+# See LICENSE for details.
+# ----------------------------------------------------------------------------
+
+import os
+import pathlib
+import tempfile
+import unittest
+from unittest import mock
+
+from aturtle.shapes import cache
+
+
+
+class TestRotationCache(unittest.TestCase):
+
+    def setUp(self):
+
+        self.cache = cache.RotationCache(max_bytes=100)
+
+
+    def test_acquire_creates_data_via_factory(self):
+
+        factory = mock.Mock(return_value='data')
+        data = self.cache.acquire('key', factory, nbytes=10)
+
+        self.assertEqual(data, 'data')
+        factory.assert_called_once_with()
+
+
+    def test_acquire_same_key_shares_data(self):
+
+        factory = mock.Mock(side_effect=lambda: object())
+        data1 = self.cache.acquire('key', factory, nbytes=10)
+        data2 = self.cache.acquire('key', factory, nbytes=10)
+
+        self.assertIs(data1, data2)
+        factory.assert_called_once_with()
+        self.assertEqual(self.cache.nbytes, 10)
+
+
+    def test_acquire_different_keys_does_not_share_data(self):
+
+        data1 = self.cache.acquire('key1', object, nbytes=10)
+        data2 = self.cache.acquire('key2', object, nbytes=10)
+
+        self.assertIsNot(data1, data2)
+        self.assertEqual(self.cache.nbytes, 20)
+
+
+    def test_data_in_use_is_kept_above_max_bytes(self):
+
+        self.cache.acquire('key1', object, nbytes=80)
+        self.cache.acquire('key2', object, nbytes=80)
+
+        self.assertEqual(len(self.cache), 2)
+        self.assertEqual(self.cache.nbytes, 160)
+
+
+    def test_released_data_is_kept_below_max_bytes(self):
+
+        data = self.cache.acquire('key', object, nbytes=80)
+        self.cache.release('key')
+
+        self.assertIs(self.cache.acquire('key', object, nbytes=80), data)
+
+
+    def test_released_data_is_evicted_above_max_bytes(self):
+
+        self.cache.acquire('key1', object, nbytes=80)
+        self.cache.release('key1')
+        self.cache.acquire('key2', object, nbytes=80)
+
+        self.assertEqual(len(self.cache), 1)
+        self.assertEqual(self.cache.nbytes, 80)
+
+
+    def test_least_recently_released_data_evicted_first(self):
+
+        for key in ('key1', 'key2', 'key3'):
+            self.cache.acquire(key, object, nbytes=30)
+        self.cache.release('key2')
+        self.cache.release('key1')
+        self.cache.release('key3')
+        self.cache.acquire('key4', object, nbytes=30)
+
+        factory = mock.Mock(side_effect=object)
+        self.cache.acquire('key1', factory, nbytes=30)
+        factory.assert_not_called()
+        self.cache.acquire('key2', factory, nbytes=30)
+        factory.assert_called_once_with()
+
+
+    def test_data_with_references_is_not_evicted(self):
+
+        data = self.cache.acquire('key', object, nbytes=80)
+        self.cache.acquire('key', object, nbytes=80)
+        self.cache.release('key')
+        self.cache.acquire('other', object, nbytes=80)
+
+        self.assertIs(self.cache.acquire('key', object, nbytes=80), data)
+
+
+    def test_lowering_max_bytes_evicts(self):
+
+        self.cache.acquire('key', object, nbytes=80)
+        self.cache.release('key')
+        self.cache.max_bytes = 50
+
+        self.assertEqual(len(self.cache), 0)
+        self.assertEqual(self.cache.nbytes, 0)
+
+
+    def test_clear_evicts_data_not_in_use(self):
+
+        self.cache.acquire('used', object, nbytes=10)
+        self.cache.acquire('unused', object, nbytes=10)
+        self.cache.release('unused')
+        self.cache.clear()
+
+        self.assertEqual(len(self.cache), 1)
+        self.assertEqual(self.cache.nbytes, 10)
+
+
+
+class TestTkDestroyed(unittest.TestCase):
+
+    def setUp(self):
+
+        self.cache = cache.RotationCache()
+        for patcher in (
+            mock.patch('aturtle.shapes.cache.shared', self.cache),
+            mock.patch('aturtle.shapes.cache.tk_generation', 0),
+        ):
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+
+    def test_starts_new_generation(self):
+
+        cache.tk_destroyed()
+
+        self.assertEqual(cache.tk_generation, 1)
+
+
+    def test_evicts_shared_data_not_in_use(self):
+
+        self.cache.acquire('used', object, nbytes=10)
+        self.cache.acquire('unused', object, nbytes=10)
+        self.cache.release('unused')
+        cache.tk_destroyed()
+
+        self.assertEqual(len(self.cache), 1)
+
+
+
+class TestDiskCache(unittest.TestCase):
+
+    def setUp(self):
+
+        temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(temp_dir.cleanup)
+        self.directory = pathlib.Path(temp_dir.name) / 'cache'
+        self.cache = cache.DiskCache(self.directory, max_bytes=100)
+
+
+    def _write(self, nbytes):
+
+        return lambda path: path.write_bytes(b'x' * nbytes)
+
+
+    def test_get_missing_key_returns_None(self):
+
+        self.assertIsNone(self.cache.get('key'))
+
+
+    def test_put_then_get_returns_written_file(self):
+
+        self.cache.put('key', lambda path: path.write_bytes(b'data'))
+        path = self.cache.get('key')
+
+        self.assertEqual(path.read_bytes(), b'data')
+
+
+    def test_failed_write_caches_nothing(self):
+
+        def failing_write(path):
+            path.write_bytes(b'partial')
+            raise ValueError('failed')
+
+        self.cache.put('key', failing_write)
+
+        self.assertIsNone(self.cache.get('key'))
+        self.assertEqual(list(self.directory.iterdir()), [])
+
+
+    def test_total_size_is_bounded(self):
+
+        for key in ('key1', 'key2', 'key3'):
+            self.cache.put(key, self._write(40))
+
+        total_bytes = sum(path.stat().st_size for path in self.directory.iterdir())
+        self.assertLessEqual(total_bytes, 100)
+
+
+    def test_least_recently_used_evicted_first(self):
+
+        self.cache.put('key1', self._write(40))
+        self.cache.put('key2', self._write(40))
+        os.utime(self.directory / 'key1.png', (0, 0))
+        os.utime(self.directory / 'key2.png', (1, 1))
+        self.cache.get('key1')
+        self.cache.put('key3', self._write(40))
+
+        self.assertIsNotNone(self.cache.get('key1'))
+        self.assertIsNone(self.cache.get('key2'))
+        self.assertIsNotNone(self.cache.get('key3'))
+
+
+
+class TestEnableDiskCache(unittest.TestCase):
+
+    def tearDown(self):
+
+        cache.disable_disk_cache()
+
+
+    def test_disk_cache_disabled_by_default(self):
+
+        self.assertIsNone(cache.disk)
+
+
+    def test_enable_with_directory(self):
+
+        cache.enable_disk_cache('some-directory')
+
+        self.assertEqual(cache.disk.directory, pathlib.Path('some-directory'))
+
+
+    def test_enable_with_no_directory_uses_user_cache_directory(self):
+
+        cache.enable_disk_cache()
+
+        self.assertIn('aturtle', cache.disk.directory.parts)
@@ -5,11 +5,13 @@
 # See LICENSE for details.
 # ----------------------------------------------------------------------------
 
-import collections
+import asyncio
 import contextlib
 import itertools as it
+import math
 from unittest import mock
 
+from aturtle import paint
 from aturtle import turtle
 from aturtle.sprites import base as sprite_base
 
@@ -17,6 +19,7 @@ from . import base
 from . import fake_tkinter
 from . import fake_sprite
 from . import fake_asyncio
+from . import fake_time
 
 
 
@@ -94,7 +97,7 @@ class AsyncAnimationBase(base.TestCase):
         self.asyncio = fake_asyncio.Asyncio()
         self._exit_stack = contextlib.ExitStack()
         self._exit_stack.enter_context(
-            mock.patch('aturtle.sprites.base.asyncio', self.asyncio)
+            mock.patch('aturtle.scheduler.asyncio', self.asyncio)
         )
 
 
@@ -105,15 +108,10 @@ class AsyncAnimationBase(base.TestCase):
 
     def _run_coroutines(self, *coros):
 
-        ready = collections.deque(coros)
-        while ready:
-            coro = ready.popleft()
-            try:
-                coro.send(None)
-            except StopIteration:
-                pass
-            else:
-                ready.append(coro)
+        async def run_all():
+            await asyncio.gather(*coros)
+
+        asyncio.run(run_all())
 
 
 
@@ -434,10 +432,10 @@ class SyncAnimationBase(base.TestCase):
 
     def setUp(self):
 
-        self.time = mock.Mock()
+        self.time = fake_time.Time()
         self._exit_stack = contextlib.ExitStack()
         self._exit_stack.enter_context(
-            mock.patch('aturtle.sprites.base.time', self.time)
+            mock.patch('aturtle.scheduler.time', self.time)
         )
 
 
@@ -769,6 +767,7 @@ class TestTurtleAsyncMovementIntegrated(AsyncAnimationBase):
             fill='pink',
             width=5,
             capstyle=mock.ANY,
+            tags=mock.ANY,
         )
 
 
@@ -810,6 +809,161 @@ class TestTurtleAsyncMovementIntegrated(AsyncAnimationBase):
             )
 
 
+    def test_async_forward_long_lines_are_drawn_in_chunks(self):
+
+        self.canvas.create_line.side_effect = it.count(100)
+        t = turtle.Turtle(self.sprite, line_tolerance=0)
+
+        coro = t.async_forward(200, speed=100, fps=100)
+        self._run_coroutines(coro)
+
+        # 200 frames, plus the starting point, in chunks of up to 64 points.
+        create_line_call_args_list = self.canvas.create_line.call_args_list
+        self.assertEqual(len(create_line_call_args_list), 4)
+        self.assertEqual(t._lines, [100, 101, 102, 103])
+
+        # Per-frame updates send, at most, a chunk's worth of coordinates.
+        for call_args in self.canvas.coords.call_args_list:
+            _line_id, coords = call_args.args
+            self.assertLessEqual(len(coords), turtle._LINE_CHUNK_POINTS * 2)
+
+        # Each chunk starts where the previous one ended.
+        chunk_coords = [
+            self._last_coords(line_id)
+            for line_id in t._lines
+        ]
+        for previous, following in zip(chunk_coords, chunk_coords[1:]):
+            self.assertEqual(previous[-2:], following[:2])
+        self.assert_almost_equal_anchor(chunk_coords[-1][-2:], (200, 0), places=3)
+
+
+    def test_async_forward_straight_line_is_simplified(self):
+
+        t = turtle.Turtle(self.sprite)
+
+        coro = t.async_forward(200, speed=100, fps=100)
+        self._run_coroutines(coro)
+
+        self.canvas.create_line.assert_called_once()
+        [line_coords], _kwargs = self.canvas.create_line.call_args
+        self.assertEqual(len(line_coords), 4)
+        self.assert_almost_equal_coords(line_coords, [0, 0, 200, 0], places=3)
+
+
+    def test_async_forward_finished_lines_added_to_paint_layer(self):
+
+        self.canvas.create_line.side_effect = it.count(100)
+        paint_layer = mock.Mock()
+        t = turtle.Turtle(self.sprite, line_color='pink', paint_layer=paint_layer)
+
+        self._run_coroutines(t.async_forward(100))
+        paint_layer.add_line.assert_not_called()
+
+        t.line_color = 'navy'
+        self._run_coroutines(t.async_forward(100))
+        paint_layer.add_line.assert_called_once_with(
+            100,
+            mock.ANY,
+            fill='pink',
+            width=t.line_width,
+        )
+        self.assertEqual(t._lines, [101])
+
+
+    def test_async_path_draws_a_single_line(self):
+
+        self.canvas.create_line.side_effect = it.count(100)
+        t = turtle.Turtle(self.sprite)
+
+        coro = t.async_path([(100, 0), (100, 100), (0, 100)], speed=100, fps=10)
+        self._run_coroutines(coro)
+
+        self.canvas.create_line.assert_called_once()
+        self.assertEqual(len(self.asyncio.sleep_call_args), 30)
+        self.assert_almost_equal_coords(
+            self._last_coords(100),
+            [0, 0, 100, 0, 100, 100, 0, 100],
+            places=3,
+        )
+
+
+    def test_async_path_up_draws_no_line(self):
+
+        t = turtle.Turtle(self.sprite)
+
+        coro = t.async_path([(100, 0), (100, 100)], down=False)
+        self._run_coroutines(coro)
+
+        self.canvas.create_line.assert_not_called()
+        self.assert_almost_equal_anchor(self.sprite.anchor, (100, 100), places=3)
+
+
+    def test_async_circle_draws_a_single_line_and_rotates(self):
+
+        self.canvas.create_line.side_effect = it.count(100)
+        t = turtle.Turtle(self.sprite)
+
+        coro = t.async_circle(100, steps=36, speed=1000, fps=10)
+        self._run_coroutines(coro)
+
+        self.canvas.create_line.assert_called_once()
+        self.assert_almost_equal_anchor(self.sprite.anchor, (0, 0), places=3)
+        self.assertAlmostEqual(self.sprite.angle % 360, 0, places=3)
+
+        # All 36 chord vertices, all 100 units away from the (0, 100) center.
+        coords = self._last_coords(100)
+        self.assertEqual(len(coords), 2 * 37)
+        for x, y in zip(coords[::2], coords[1::2]):
+            self.assertAlmostEqual(math.hypot(x, y - 100), 100, places=3)
+
+
+    def test_async_circle_negative_radius_goes_clockwise(self):
+
+        t = turtle.Turtle(self.sprite)
+
+        coro = t.async_circle(-100, 90, speed=1000, fps=10)
+        self._run_coroutines(coro)
+
+        self.assert_almost_equal_anchor(self.sprite.anchor, (100, -100), places=3)
+        self.assertAlmostEqual(self.sprite.angle, 270, places=3)
+
+
+    def test_async_circle_is_relative_to_the_turtle_angle(self):
+
+        self.sprite.direct_rotate_to(90)
+        t = turtle.Turtle(self.sprite)
+
+        coro = t.async_circle(100, 180, speed=1000, fps=10)
+        self._run_coroutines(coro)
+
+        self.assert_almost_equal_anchor(self.sprite.anchor, (-200, 0), places=3)
+        self.assertAlmostEqual(self.sprite.angle, 270, places=3)
+
+
+    def test_arc_chords_are_cached(self):
+
+        turtle._arc_chords.cache_clear()
+        t = turtle.Turtle(self.sprite, down=False)
+
+        for _ in range(3):
+            self._run_coroutines(t.async_circle(10, 90, 4, speed=1000))
+
+        cache_info = turtle._arc_chords.cache_info()
+        self.assertEqual((cache_info.hits, cache_info.misses), (2, 1))
+
+
+    def _last_coords(self, line_id):
+
+        # Latest coordinates set on the `line_id` canvas line item.
+
+        create_line_call_args_list = self.canvas.create_line.call_args_list
+        coords = create_line_call_args_list[line_id - 100].args[0]
+        for call_args in self.canvas.coords.call_args_list:
+            if call_args.args[0] == line_id:
+                coords = call_args.args[1]
+        return list(coords)
+
+
     def test_async_move_draws_calls_canvas_create_line(self):
 
         t = turtle.Turtle(self.sprite, line_color='pink', line_width=5)
@@ -822,6 +976,7 @@ class TestTurtleAsyncMovementIntegrated(AsyncAnimationBase):
             fill='pink',
             width=5,
             capstyle=mock.ANY,
+            tags=mock.ANY,
         )
 
 
@@ -875,6 +1030,7 @@ class TestTurtleAsyncMovementIntegrated(AsyncAnimationBase):
             fill='pink',
             width=5,
             capstyle=mock.ANY,
+            tags=mock.ANY,
         )
 
 
@@ -943,6 +1099,7 @@ class TestTurtleSyncMovementIntegrated(SyncAnimationBase):
             fill='pink',
             width=5,
             capstyle=mock.ANY,
+            tags=mock.ANY,
         )
 
 
@@ -993,6 +1150,7 @@ class TestTurtleSyncMovementIntegrated(SyncAnimationBase):
             fill='pink',
             width=5,
             capstyle=mock.ANY,
+            tags=mock.ANY,
         )
 
 
@@ -1043,6 +1201,7 @@ class TestTurtleSyncMovementIntegrated(SyncAnimationBase):
             fill='pink',
             width=5,
             capstyle=mock.ANY,
+            tags=mock.ANY,
         )
 
 
@@ -1080,3 +1239,553 @@ class TestTurtleSyncMovementIntegrated(SyncAnimationBase):
                 call_args,
                 mock.call(42, mock.ANY),
             )
+
+
+
+class TestTurtleInstantMode(AsyncAnimationBase):
+
+    def setUp(self):
+
+        super().setUp()
+
+        self.time = fake_time.Time()
+        self._exit_stack.enter_context(
+            mock.patch('aturtle.scheduler.time', self.time)
+        )
+
+        self.canvas = fake_tkinter.Canvas()
+        self.canvas.create_line.side_effect = it.count(100)
+        self.sprite = sprite_base.Sprite(self.canvas, shape=None)
+        self.t = turtle.Turtle(self.sprite, line_color='pink', line_width=5)
+
+
+    async def _async_square(self, side):
+
+        for _ in range(4):
+            await self.t.async_forward(side)
+            await self.t.async_left(90)
+
+
+    def test_async_moves_take_no_time(self):
+
+        with self.t.instant():
+            for _ in range(1000):
+                self._run_coroutines(self.t.async_forward(1))
+
+        self.assertEqual(self.asyncio.sleep_call_args, [])
+
+
+    def test_sync_moves_take_no_time(self):
+
+        with self.t.instant():
+            for _ in range(1000):
+                self.t.sync_forward(1)
+
+        self.time.sleep.assert_not_called()
+
+
+    def test_moves_do_not_change_canvas_until_flushed(self):
+
+        with self.t.instant():
+            self._run_coroutines(self._async_square(100))
+            self.canvas.create_line.assert_not_called()
+            self.canvas.move.assert_not_called()
+
+        self.canvas.create_line.assert_called_once()
+
+
+    def test_anchor_and_angle_track_moves(self):
+
+        with self.t.instant():
+            self.t.sync_forward(100)
+            self.t.sync_left(90)
+            self.t.sync_forward(50)
+            self.assert_almost_equal_anchor(self.t.anchor, (100, 50), places=3)
+            self.assertAlmostEqual(self.t.angle, 90)
+            self.assertEqual(self.sprite.anchor, (0, 0))
+
+
+    def test_flush_draws_connected_moves_in_one_line(self):
+
+        with self.t.instant():
+            self._run_coroutines(self._async_square(100))
+
+        self.canvas.create_line.assert_called_once_with(
+            mock.ANY,
+            fill='pink',
+            width=5,
+            capstyle='round',
+            tags=self.t.tag,
+        )
+        [coords], _kwargs = self.canvas.create_line.call_args
+        self.assert_almost_equal_coords(
+            coords,
+            [0, 0, 100, 0, 100, 100, 0, 100, 0, 0],
+            places=3,
+        )
+        self.assertEqual(self.t._lines, [100])
+
+
+    def test_flush_merges_collinear_moves(self):
+
+        with self.t.instant():
+            for _ in range(1000):
+                self.t.sync_forward(1)
+
+        [coords], _kwargs = self.canvas.create_line.call_args
+        self.assert_almost_equal_coords(coords, [0, 0, 1000, 0], places=3)
+
+
+    def test_flush_moves_sprite_to_final_pose(self):
+
+        with self.t.instant():
+            self.t.sync_forward(100)
+            self.t.sync_right(45)
+
+        self.assert_almost_equal_anchor(self.sprite.anchor, (100, 0), places=3)
+        self.assertAlmostEqual(self.sprite.angle, 315)
+
+
+    def test_flush_puts_sprite_in_front_of_lines(self):
+
+        with self.t.instant():
+            self.t.sync_forward(100)
+            self.t.sync_forward(100, down=False)
+            self.t.sync_forward(100)
+
+        self.canvas.tag_raise.assert_called_once_with(None, 101)
+
+
+    def test_pen_up_moves_split_lines(self):
+
+        with self.t.instant():
+            self.t.sync_forward(100)
+            self.t.sync_forward(100, down=False)
+            self.t.sync_forward(100)
+
+        self.assertEqual(self.canvas.create_line.call_count, 2)
+        self.assertEqual(self.t._lines, [100, 101])
+
+
+    def test_line_style_changes_split_lines(self):
+
+        with self.t.instant():
+            self.t.sync_forward(100)
+            self.t.line_color = 'navy'
+            self.t.sync_forward(100)
+
+        fills = [
+            call_args.kwargs['fill']
+            for call_args in self.canvas.create_line.call_args_list
+        ]
+        self.assertEqual(fills, ['pink', 'navy'])
+
+
+    def test_explicit_flush_draws_and_continues_in_new_lines(self):
+
+        with self.t.instant():
+            self.t.sync_forward(100)
+            self.t.flush()
+            self.assertEqual(self.canvas.create_line.call_count, 1)
+            self.t.sync_forward(100)
+
+        self.assertEqual(self.canvas.create_line.call_count, 2)
+        [coords], _kwargs = self.canvas.create_line.call_args
+        self.assert_almost_equal_coords(coords, [100, 0, 200, 0], places=3)
+
+
+    def test_path_draws_a_single_line(self):
+
+        with self.t.instant():
+            self.t.sync_path([(100, 0), (100, 100)])
+
+        [coords], _kwargs = self.canvas.create_line.call_args
+        self.assert_almost_equal_coords(coords, [0, 0, 100, 0, 100, 100], places=3)
+
+
+    def test_circle_tracks_pose(self):
+
+        with self.t.instant():
+            self.t.sync_circle(100, 90)
+            self.assert_almost_equal_anchor(self.t.anchor, (100, 100), places=3)
+            self.assertAlmostEqual(self.t.angle, 90)
+
+        self.canvas.create_line.assert_called_once()
+        self.assertAlmostEqual(self.sprite.angle, 90)
+
+
+    def test_nested_instant_flushes_on_outermost_exit(self):
+
+        with self.t.instant():
+            with self.t.instant():
+                self.t.sync_forward(100)
+            self.canvas.create_line.assert_not_called()
+
+        self.canvas.create_line.assert_called_once()
+
+
+    def test_moves_after_instant_are_animated(self):
+
+        with self.t.instant():
+            self.t.sync_forward(100)
+
+        self._run_coroutines(self.t.async_forward(100, speed=100, fps=10))
+        self.assertEqual(len(self.asyncio.sleep_call_args), 10)
+
+
+
+class TestCommandQueue(AsyncAnimationBase):
+
+    def setUp(self):
+
+        super().setUp()
+
+        self.time = fake_time.Time()
+        self._exit_stack.enter_context(
+            mock.patch('aturtle.scheduler.time', self.time)
+        )
+
+        self.canvas = fake_tkinter.Canvas()
+        self.canvas.create_line.side_effect = it.count(100)
+        self.sprite = sprite_base.Sprite(self.canvas, shape=None)
+        self.t = turtle.Turtle(self.sprite, line_color='pink', line_width=5)
+        self.queue = turtle.CommandQueue(self.t)
+
+
+    def _commands(self):
+
+        return [
+            (command.name, command.args)
+            for command in self.queue._commands
+        ]
+
+
+    def test_consecutive_forwards_are_fused(self):
+
+        for _ in range(100):
+            self.queue.forward(1)
+
+        self.assertEqual(self._commands(), [('forward', [100])])
+
+
+    def test_opposing_forwards_with_pen_down_are_not_fused(self):
+
+        self.queue.forward(100)
+        self.queue.forward(-100)
+
+        self.assertEqual(len(self.queue), 2)
+
+
+    def test_opposing_forwards_with_pen_up_cancel_out(self):
+
+        self.queue.forward(100, down=False)
+        self.queue.forward(-100, down=False)
+
+        self.assertEqual(len(self.queue), 0)
+
+
+    def test_forwards_with_different_arguments_are_not_fused(self):
+
+        self.queue.forward(100)
+        self.queue.forward(100, speed=50)
+        self.queue.forward(100, down=False)
+
+        self.assertEqual(len(self.queue), 3)
+
+
+    def test_forwards_with_different_styles_are_not_fused(self):
+
+        self.queue.forward(100)
+        self.t.line_color = 'navy'
+        self.queue.forward(100)
+
+        self.assertEqual(len(self.queue), 2)
+
+
+    def test_consecutive_rotations_are_fused(self):
+
+        self.queue.left(30)
+        self.queue.left(30)
+        self.queue.right(15)
+
+        self.assertEqual(self._commands(), [('rotate', [45])])
+
+
+    def test_opposing_rotations_cancel_out(self):
+
+        self.queue.forward(100)
+        self.queue.left(90)
+        self.queue.right(90)
+        self.queue.forward(100)
+
+        self.assertEqual(self._commands(), [('forward', [200])])
+
+
+    def test_same_direction_moves_are_fused(self):
+
+        self.queue.move(10, 20)
+        self.queue.move(5, 10)
+        self.queue.move(-5, 10)
+
+        self.assertEqual(self._commands(), [('move', [15, 30]), ('move', [-5, 10])])
+
+
+    def test_pen_up_move_tos_keep_last_destination(self):
+
+        self.queue.move_to(10, 20, down=False)
+        self.queue.move_to(30, 40, down=False)
+        self.queue.move_to(50, 60)
+
+        self.assertEqual(
+            self._commands(),
+            [('move_to', [30, 40]), ('move_to', [50, 60])],
+        )
+
+
+    def test_async_run_empties_the_queue(self):
+
+        self.queue.forward(100)
+        self._run_coroutines(self.queue.async_run())
+
+        self.assertEqual(len(self.queue), 0)
+        self.assert_almost_equal_anchor(self.sprite.anchor, (100, 0), places=3)
+
+
+    def test_async_run_fused_forwards_take_fewer_frames(self):
+
+        for _ in range(100):
+            self.queue.forward(1, speed=100, fps=10)
+        self._run_coroutines(self.queue.async_run())
+
+        # A single 1 second movement, at 10 fps.
+        self.assertEqual(len(self.asyncio.sleep_call_args), 10)
+
+
+    def test_async_run_joins_pen_down_segments_into_one_line(self):
+
+        for _ in range(4):
+            self.queue.forward(100)
+            self.queue.left(90)
+        self._run_coroutines(self.queue.async_run())
+
+        self.canvas.create_line.assert_called_once_with(
+            mock.ANY,
+            fill='pink',
+            width=5,
+            capstyle='round',
+            tags=self.t.tag,
+        )
+        [coords] = self.canvas.coords.call_args.args[1:]
+        self.assert_almost_equal_coords(
+            coords,
+            [0, 0, 100, 0, 100, 100, 0, 100, 0, 0],
+            places=3,
+        )
+
+
+    def test_async_run_pen_up_segments_split_lines(self):
+
+        self.queue.forward(100)
+        self.queue.left(90)
+        self.queue.forward(100, down=False)
+        self.queue.left(90)
+        self.queue.forward(100)
+        self._run_coroutines(self.queue.async_run())
+
+        self.assertEqual(self.canvas.create_line.call_count, 2)
+
+
+    def test_async_run_uses_buffered_styles(self):
+
+        self.queue.forward(100)
+        self.t.line_color = 'navy'
+        self.queue.left(90)
+        self.queue.forward(100)
+        self.t.line_color = 'green'
+        self._run_coroutines(self.queue.async_run())
+
+        fills = [
+            call_args.kwargs['fill']
+            for call_args in self.canvas.create_line.call_args_list
+        ]
+        self.assertEqual(fills, ['pink', 'navy'])
+        self.assertEqual(self.t.line_color, 'green')
+
+
+    def test_turtle_movements_do_not_join_lines(self):
+
+        self._run_coroutines(self.t.async_forward(100))
+        self._run_coroutines(self.t.async_forward(100))
+
+        self.assertEqual(self.canvas.create_line.call_count, 2)
+
+
+    def test_path_is_buffered_and_run(self):
+
+        self.queue.path([(100, 0), (100, 100)])
+        self.queue.sync_run()
+
+        self.canvas.create_line.assert_called_once()
+        self.assert_almost_equal_anchor(self.sprite.anchor, (100, 100), places=3)
+
+
+    def test_sync_run_joins_pen_down_segments_into_one_line(self):
+
+        for _ in range(4):
+            self.queue.forward(100)
+            self.queue.left(90)
+        self.queue.sync_run()
+
+        self.assertEqual(len(self.queue), 0)
+        self.canvas.create_line.assert_called_once()
+        self.assert_almost_equal_anchor(self.sprite.anchor, (0, 0), places=3)
+
+
+
+class TestTurtleClearAndReset(AsyncAnimationBase):
+
+    def setUp(self):
+
+        super().setUp()
+
+        self.canvas = fake_tkinter.Canvas()
+        self.canvas.create_line.side_effect = it.count(100)
+        self.sprite = sprite_base.Sprite(self.canvas, shape=None, anchor=(10, 20), angle=30)
+        self.t = turtle.Turtle(self.sprite, line_color='pink', line_width=5)
+
+
+    def _draw(self, count):
+
+        for _ in range(count):
+            self.t.sync_forward(10, speed=1000)
+            self.t.sync_forward(10, down=False, speed=1000)
+
+
+    def test_turtles_have_unique_tags(self):
+
+        other = turtle.Turtle(self.sprite)
+        self.assertNotEqual(self.t.tag, other.tag)
+
+
+    def test_lines_are_tagged(self):
+
+        self._draw(1)
+
+        self.canvas.create_line.assert_called_once_with(
+            mock.ANY,
+            fill='pink',
+            width=5,
+            capstyle='round',
+            tags=self.t.tag,
+        )
+
+
+    def test_clear_hides_all_lines_at_once(self):
+
+        self._draw(3)
+        self.t.clear()
+
+        self.canvas.itemconfig.assert_called_once_with(self.t.tag, state='hidden')
+        self.canvas.delete.assert_not_called()
+        self.assertEqual(self.t._lines, [])
+
+
+    def test_clear_leaves_pose_unchanged(self):
+
+        self._draw(1)
+        self.t.clear()
+
+        self.assert_almost_equal_anchor(self.sprite.anchor, (27.32, 30), places=2)
+        self.assertEqual(self.sprite.angle, 30)
+
+
+    def test_lines_after_clear_reuse_line_items(self):
+
+        self._draw(3)
+        self.t.clear()
+        self._draw(3)
+
+        self.assertEqual(self.canvas.create_line.call_count, 3)
+        self.assertEqual(sorted(self.t._lines), [100, 101, 102])
+        self.canvas.itemconfig.assert_called_with(
+            mock.ANY,
+            fill='pink',
+            width=5,
+            state='normal',
+        )
+
+
+    def test_lines_beyond_cleared_ones_are_created(self):
+
+        self._draw(2)
+        self.t.clear()
+        self._draw(3)
+
+        self.assertEqual(self.canvas.create_line.call_count, 3)
+        self.assertEqual(sorted(self.t._lines), [100, 101, 102])
+
+
+    def test_clear_clears_paint_layer(self):
+
+        paint_layer = mock.Mock()
+        t = turtle.Turtle(self.sprite, paint_layer=paint_layer)
+        t.clear()
+
+        paint_layer.clear.assert_called_once_with()
+
+
+    def test_paint_layer_is_claimed(self):
+
+        paint_layer = mock.Mock()
+        t = turtle.Turtle(self.sprite, paint_layer=paint_layer)
+
+        paint_layer.claim.assert_called_once_with(t)
+
+
+    def test_paint_layer_cannot_be_shared(self):
+
+        with mock.patch('aturtle.paint.Image'):
+            paint_layer = paint.PaintLayer(self.canvas, bbox=(0, 0, 10, 10))
+        _t = turtle.Turtle(self.sprite, paint_layer=paint_layer)
+
+        with self.assertRaises(ValueError):
+            turtle.Turtle(self.sprite, paint_layer=paint_layer)
+
+
+    def test_reset_deletes_all_lines_at_once(self):
+
+        self._draw(3)
+        self.t.reset()
+
+        self.canvas.delete.assert_called_once_with(self.t.tag)
+        self.assertEqual(self.t._lines, [])
+
+
+    def test_reset_restores_initial_pose(self):
+
+        self._draw(1)
+        self.t.sync_left(90, speed=1000)
+        self.t.reset()
+
+        self.assert_almost_equal_anchor(self.sprite.anchor, (10, 20), places=3)
+        self.assertAlmostEqual(self.sprite.angle, 30)
+
+
+    def test_lines_after_reset_are_created(self):
+
+        self._draw(2)
+        self.t.clear()
+        self.t.reset()
+        self._draw(1)
+
+        self.assertEqual(self.canvas.create_line.call_count, 3)
+
+
+    def test_clear_in_instant_mode_drops_pending_lines(self):
+
+        with self.t.instant():
+            self._draw(1)
+            self.t.clear()
+            self.t.sync_forward(10)
+
+        self.canvas.create_line.assert_called_once()
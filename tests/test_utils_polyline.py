@@ -0,0 +1,146 @@
+# ----------------------------------------------------------------------------
+# Python A-Turtle
+# ----------------------------------------------------------------------------
+# Copyright (c) Tiago Montes.
+# See LICENSE for details.
+# ----------------------------------------------------------------------------
+
+from array import array
+import math
+import unittest
+
+from hypothesis import given
+from hypothesis import strategies as st
+
+from aturtle.utils import polyline
+
+
+
+def _segment_distance(px, py, ax, ay, bx, by):
+
+    dx = bx - ax
+    dy = by - ay
+    length_squared = dx * dx + dy * dy
+    if not length_squared:
+        return math.hypot(px - ax, py - ay)
+    t = max(0, min(1, ((px - ax) * dx + (py - ay) * dy) / length_squared))
+    return math.hypot(px - (ax + t * dx), py - (ay + t * dy))
+
+
+
+def _polyline_distance(px, py, coords):
+
+    points = list(zip(coords[::2], coords[1::2]))
+    if len(points) == 1:
+        return math.hypot(px - points[0][0], py - points[0][1])
+    return min(
+        _segment_distance(px, py, *a, *b)
+        for a, b in zip(points, points[1:])
+    )
+
+
+
+class TestSimplifier(unittest.TestCase):
+
+    def _simplified(self, points, tolerance):
+
+        simplifier = polyline.Simplifier(*points[0], tolerance=tolerance)
+        for point in points[1:]:
+            simplifier.add(*point)
+        return list(simplifier.coords)
+
+
+    def test_collinear_points_merge_into_one_segment(self):
+
+        points = [(x, 0) for x in range(100)]
+        coords = self._simplified(points, tolerance=0.5)
+
+        self.assertEqual(coords, [0, 0, 99, 0])
+
+
+    def test_near_collinear_points_merge_into_one_segment(self):
+
+        points = [(x, 0.2 * (x % 2)) for x in range(100)]
+        coords = self._simplified(points, tolerance=0.5)
+
+        self.assertEqual(coords, [0, 0, 99, 0.2])
+
+
+    def test_coords_are_a_compact_array(self):
+
+        simplifier = polyline.Simplifier(0, 0, tolerance=0.5)
+        simplifier.add(1, 1)
+
+        self.assertIsInstance(simplifier.coords, array)
+        self.assertEqual(simplifier.coords.typecode, 'd')
+
+
+    def test_last_point_is_the_last_added_one(self):
+
+        simplifier = polyline.Simplifier(0, 0, tolerance=0.5)
+        for x in range(1, 10):
+            simplifier.add(x, 0)
+            self.assertEqual(list(simplifier.coords[-2:]), [x, 0])
+
+
+    def test_turns_beyond_tolerance_are_kept(self):
+
+        points = [(x, 0) for x in range(10)] + [(9, y) for y in range(1, 10)]
+        coords = self._simplified(points, tolerance=0.5)
+
+        self.assertEqual(coords, [0, 0, 9, 0, 9, 9])
+
+
+    def test_reversals_are_kept(self):
+
+        points = [(x, 0) for x in range(10)] + [(x, 0) for x in range(8, 4, -1)]
+        coords = self._simplified(points, tolerance=0.5)
+
+        self.assertEqual(coords, [0, 0, 9, 0, 5, 0])
+
+
+    def test_zero_tolerance_keeps_all_points(self):
+
+        points = [(x, 0) for x in range(10)]
+        coords = self._simplified(points, tolerance=0)
+
+        self.assertEqual(len(coords), 20)
+
+
+    def test_spiral_has_far_fewer_vertices(self):
+
+        # Like a turtle moving and turning: one point per frame, at 80 fps.
+        points = [(0, 0)]
+        angle = 0
+        for frame in range(4800):
+            angle += math.radians(90 / 80)
+            step = 1 + frame / 1000
+            x, y = points[-1]
+            points.append((x + step * math.cos(angle), y + step * math.sin(angle)))
+        coords = self._simplified(points, tolerance=0.5)
+
+        self.assertLess(len(coords) // 2, len(points) // 5)
+
+
+    @given(
+        st.lists(
+            st.tuples(
+                st.floats(min_value=-5, max_value=5),
+                st.floats(min_value=-5, max_value=5),
+            ),
+            min_size=1,
+            max_size=100,
+        ),
+        st.floats(min_value=0.1, max_value=2),
+    )
+    def test_all_points_within_tolerance(self, steps, tolerance):
+
+        points = [(0, 0)]
+        for dx, dy in steps:
+            x, y = points[-1]
+            points.append((x + dx, y + dy))
+        coords = self._simplified(points, tolerance)
+
+        for x, y in points:
+            distance = _polyline_distance(x, y, coords)
+            self.assertLessEqual(distance, tolerance + 1e-6)
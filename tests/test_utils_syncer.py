@@ -72,6 +72,22 @@ class Test(unittest.TestCase):
         time_module_mock.sleep.assert_called_once_with(24)
 
 
+    def test_syncer_handles_using_default_positional_args(self):
+
+        async def async_sleep(duration=42):
+            await asyncio.sleep(duration)
+
+        sync_sleep = syncer.create_sync_func(async_sleep, lambda n: n)
+
+        # The `time` module was injected into the function globals.
+        time_module_mock = mock.Mock()
+        with mock.patch(__name__ + '.time', time_module_mock):
+            sync_sleep()
+
+        # `time.sleep(42)` was called.
+        time_module_mock.sleep.assert_called_once_with(42)
+
+
     def test_syncer_converts_awaited_self_references(self):
 
         class Async:
@@ -5,9 +5,13 @@
 # See LICENSE for details.
 # ----------------------------------------------------------------------------
 
+import unittest
+from unittest import mock
+
 from hypothesis import given
 from hypothesis import strategies as st
 
+from aturtle.shapes import cache
 from aturtle.shapes import vector
 
 from . import base
@@ -105,6 +109,123 @@ class TestShapeAccess(base.TestCase):
 
 
 
+class TestShapePreRotation(base.TestCase):
+
+    COORDS = [0, 0, 2, 0, 1, 1, -3, 5, 4, -2]
+    ANCHOR = (1, 2)
+
+    def setUp(self):
+
+        patcher = mock.patch('aturtle.shapes.cache.shared', cache.RotationCache())
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+
+    def _pure_python_shape(self, rotations):
+
+        # Own cache: otherwise, equal NumPy shapes would share its data.
+        own_cache = cache.RotationCache()
+        with mock.patch('aturtle.shapes.vector.numpy', None):
+            with mock.patch('aturtle.shapes.cache.shared', own_cache):
+                return vector.Shape(
+                    self.COORDS,
+                    anchor=self.ANCHOR,
+                    rotations=rotations,
+                    pre_rotate=True,
+                )
+
+
+    def test_pure_python_fallback_without_numpy(self):
+
+        shape = self._pure_python_shape(rotations=36)
+
+        for angle in range(0, 360, 10):
+            with self.subTest(angle=angle):
+                self.assertIsInstance(shape[angle], list)
+
+
+    @unittest.skipIf(vector.numpy is None, 'requires NumPy')
+    def test_numpy_rotations_match_pure_python(self):
+
+        rotations = 360
+        expected = self._pure_python_shape(rotations)
+        shape = vector.Shape(
+            self.COORDS,
+            anchor=self.ANCHOR,
+            rotations=rotations,
+            pre_rotate=True,
+        )
+        self.assertIsNot(shape._rotated_data, expected._rotated_data)
+
+        for angle in range(0, 360, 7):
+            with self.subTest(angle=angle):
+                self.assert_almost_equal_coords(shape[angle], expected[angle], places=9)
+
+
+    @unittest.skipIf(vector.numpy is None, 'requires NumPy')
+    def test_numpy_rotations_are_views_on_a_contiguous_table(self):
+
+        shape = vector.Shape(self.COORDS, rotations=36, pre_rotate=True)
+
+        table = shape._rotated_data
+        self.assertEqual(table.shape, (36, len(self.COORDS)))
+        self.assertTrue(table.flags['C_CONTIGUOUS'])
+        self.assertTrue(vector.numpy.shares_memory(shape[90], table))
+
+
+
+class TestSharedRotations(base.TestCase):
+
+    def setUp(self):
+
+        self.cache = cache.RotationCache()
+        patcher = mock.patch('aturtle.shapes.cache.shared', self.cache)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+
+    def test_equal_shapes_share_rotated_data(self):
+
+        shapes = [vector.Triangle(radius=20, pre_rotate=True) for _ in range(10)]
+
+        self.assertEqual(len(self.cache), 1)
+        for shape in shapes:
+            self.assertIs(shape._rotated_data, shapes[0]._rotated_data)
+
+
+    def test_equal_lazy_shapes_share_rotated_data(self):
+
+        shape1 = vector.Shape([0, 0, 2, 0, 1, 1])
+        shape2 = vector.Shape([0, 0, 2, 0, 1, 1])
+
+        self.assertIs(shape1[90], shape2[90])
+
+
+    def test_different_shapes_do_not_share_rotated_data(self):
+
+        _shapes = [
+            vector.Triangle(radius=20),
+            vector.Triangle(radius=21),
+            vector.Triangle(radius=20, anchor=(1, 1)),
+            vector.Triangle(radius=20, rotations=36),
+            vector.Triangle(radius=20, pre_rotate=True),
+            vector.Square(radius=20),
+        ]
+
+        self.assertEqual(len(self.cache), len(_shapes))
+
+
+    def test_collected_shapes_release_rotated_data(self):
+
+        self.cache.max_bytes = 0
+        shape = vector.Triangle(radius=20)
+        self.assertEqual(len(self.cache), 1)
+
+        del shape
+        self.assertEqual(len(self.cache), 0)
+
+
+
 class TestBadRegularPolygonCreation(base.TestCase):
 
     def test_create_with_less_than_three_sides_raises_ValueError(self):
@@ -5,11 +5,14 @@
 # See LICENSE for details.
 # ----------------------------------------------------------------------------
 
+import asyncio
+import contextlib
 from unittest import mock
 
 from aturtle import sprites, shapes
 
 from . import base
+from . import fake_asyncio
 from . import fake_tkinter
 
 
@@ -351,6 +354,73 @@ class TestNonDefaultSprite(base.TestCase):
 
 
 
+class TestFusedFrameChanges(base.TestCase):
+
+    def setUp(self):
+
+        self.canvas = fake_tkinter.Canvas()
+        self.asyncio = fake_asyncio.Asyncio()
+        self._exit_stack = contextlib.ExitStack()
+        self._exit_stack.enter_context(
+            mock.patch('aturtle.scheduler.asyncio', self.asyncio)
+        )
+        self.sprite = sprites.VectorSprite(self.canvas, UnitSquare())
+        self.canvas.coords.reset_mock()
+
+
+    def tearDown(self):
+
+        self._exit_stack.close()
+
+
+    def _run_coroutines(self, *coros):
+
+        async def run_all():
+            await asyncio.gather(*coros)
+
+        asyncio.run(run_all())
+
+
+    def test_concurrent_move_and_rotate_update_coords_once_per_frame(self):
+
+        self._run_coroutines(
+            self.sprite.async_move(10, 0, speed=10, fps=10),
+            self.sprite.async_rotate(90, speed=90, fps=10),
+        )
+
+        self.canvas.move.assert_not_called()
+        self.assertEqual(self.canvas.coords.call_count, 10)
+        self.assertEqual(
+            self.canvas.coords.call_args.args[1],
+            self.sprite.coords,
+        )
+
+
+    def test_concurrent_moves_move_once_per_frame(self):
+
+        self._run_coroutines(
+            self.sprite.async_move(10, 0, speed=10, fps=10),
+            self.sprite.async_move(0, 10, speed=10, fps=10),
+        )
+
+        self.assertEqual(self.canvas.move.call_count, 10)
+        for call_args in self.canvas.move.call_args_list:
+            _item_id, dx, dy = call_args.args
+            self.assertAlmostEqual(dx, 1)
+            self.assertAlmostEqual(dy, 1)
+        self.assert_almost_equal_anchor(self.sprite.anchor, (10, 10), places=3)
+
+
+    def test_direct_changes_outside_frames_are_immediate(self):
+
+        self.sprite.direct_move(10, 0)
+        self.canvas.move.assert_called_once()
+
+        self.sprite.direct_rotate(90)
+        self.canvas.coords.assert_called_once()
+
+
+
 class TestRegressionSpriteInitializedWithUpdateTrue(base.TestCase):
 
     def test_direct_rotate_around_calls_canvas_update_once(self):
@@ -525,6 +525,30 @@ class TestMultipleWindows(FakedTkinterTestCase):
         w1.close()
 
 
+    def test_tk_interpreter_is_first_windows(self):
+
+        w1 = self._Window()
+        _w2 = self._Window()
+
+        self.assertIs(window.Window.tk_interpreter(), w1._tk_window.tk)
+
+
+    def test_tk_interpreter_is_none_with_no_windows(self):
+
+        self.assertIsNone(window.Window.tk_interpreter())
+
+
+    def test_closing_root_window_starts_new_tk_generation(self):
+
+        w1 = self._Window()
+        w2 = self._Window()
+        with mock.patch('aturtle.shapes.cache.tk_destroyed') as tk_destroyed:
+            w2.close()
+            tk_destroyed.assert_not_called()
+            w1.close()
+            tk_destroyed.assert_called_once_with()
+
+
     def test_first_has_underlying_tk_others_have_underlying_toplevels(self):
 
         w1 = self._Window()